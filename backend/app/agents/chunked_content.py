@@ -14,6 +14,7 @@ Success Rate: 95%+
 
 import asyncio
 import json
+import time
 from decimal import Decimal
 from typing import Dict, Optional
 
@@ -22,6 +23,8 @@ from anthropic import AsyncAnthropic
 import structlog
 
 from app.core.config import settings
+from app.core.gemini_executor import run_gemini
+from app.core.resilience import get_resilience
 from app.core.adaptive_chunking import AdaptiveChunkingStrategy
 
 logger = structlog.get_logger(__name__)
@@ -61,7 +64,10 @@ class ChunkedContentAgent:
         self.gemini_model = genai.GenerativeModel("gemini-2.5-pro")
 
         # Initialize Claude Sonnet 4.5 (latest model, Sept 2025)
-        self.claude_client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.claude_client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_retries=0,  # Retries handled by app.core.resilience
+        )
         self.sonnet_model = "claude-sonnet-4-5-20250929"
 
         # Initialize adaptive chunking analyzer (NEW - Claude Desktop optimization)
@@ -254,14 +260,19 @@ class ChunkedContentAgent:
             for i, chunk_type in enumerate(chunk_types)
         ]
 
-        # Try parallel generation first
+        # Try parallel generation first (calls overlap on the Gemini executor)
+        started = time.monotonic()
         try:
             tasks = [
                 self._generate_gemini_chunk(i+1, prompt)
                 for i, prompt in enumerate(chunk_prompts)
             ]
             chunk_results = await asyncio.gather(*tasks)
-            logger.info("chunked_content.parallel_generation_success", chunks=len(chunk_results))
+            logger.info(
+                "chunked_content.parallel_generation_success",
+                chunks=len(chunk_results),
+                duration_seconds=round(time.monotonic() - started, 1)
+            )
             return chunk_results
 
         except Exception as e:
@@ -281,7 +292,9 @@ class ChunkedContentAgent:
         """
         Generate chunks sequentially (fallback for rate limiting)
 
-        Waits 30 seconds between chunks to respect Gemini free tier quota.
+        Each chunk call backs off on quota errors for as long as Gemini's
+        retry hint asks (see app.core.resilience) instead of sleeping a
+        fixed 30 seconds between chunks.
         """
         logger.info("chunked_content.generating_chunks_sequential", count=len(chunk_prompts))
 
@@ -291,11 +304,6 @@ class ChunkedContentAgent:
                 result = await self._generate_gemini_chunk(i+1, prompt)
                 chunk_results.append(result)
 
-                # Wait 30 seconds between chunks (free tier: 2/minute)
-                if i < len(chunk_prompts) - 1:
-                    logger.info("chunked_content.waiting_for_rate_limit", seconds=30, next_chunk=i+2)
-                    await asyncio.sleep(30)
-
             except Exception as e:
                 logger.error(
                     "chunked_content.sequential_chunk_failed",
@@ -309,15 +317,21 @@ class ChunkedContentAgent:
 
     async def _generate_gemini_chunk(self, chunk_number: int, prompt: str) -> Dict:
         """Generate a single chunk using Gemini Flash 2.0"""
-        try:
-            response = self.gemini_model.generate_content(
+        async def generate():
+            return await run_gemini(
+                self.gemini_model.generate_content,
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.7,
                     max_output_tokens=2000,  # ~1000 words
-                )
+                ),
+                request_options={"timeout": settings.GEMINI_REQUEST_TIMEOUT_SECONDS}
             )
 
+        try:
+            # Quota errors are retried after Gemini's own retry hint
+            response = await get_resilience("gemini").call(generate)
+
             content = response.text
 
             # Calculate cost (Gemini Flash 2.0 pricing)
@@ -619,7 +633,8 @@ Start with the appropriate H2 header for this section and write naturally."""
         )
 
         try:
-            response = await self.claude_client.messages.create(
+            response = await get_resilience("anthropic").call(
+                self.claude_client.messages.create,
                 model=self.sonnet_model,
                 max_tokens=32000,  # Sonnet 4.5 supports up to 64K - use 32K to fully utilize capabilities (Claude Desktop recommendation)
                 temperature=0.7,
@@ -1102,13 +1117,18 @@ Pure markdown, no JSON, no code fences."""
             # Use Gemini 2.5 Pro (same as chunk generation) for consistency
             weaving_model = genai.GenerativeModel("gemini-2.5-pro")
 
-            response = weaving_model.generate_content(
-                weaving_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.5,  # Lower temp for consistency
-                    max_output_tokens=4000,  # ~2000 words woven output
+            async def generate():
+                return await run_gemini(
+                    weaving_model.generate_content,
+                    weaving_prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.5,  # Lower temp for consistency
+                        max_output_tokens=4000,  # ~2000 words woven output
+                    ),
+                    request_options={"timeout": settings.GEMINI_REQUEST_TIMEOUT_SECONDS}
                 )
-            )
+
+            response = await get_resilience("gemini").call(generate)
 
             woven_content = response.text
 
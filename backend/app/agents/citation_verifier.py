@@ -16,6 +16,7 @@ from anthropic import AsyncAnthropic
 import structlog
 
 from app.core.config import settings
+from app.core.resilience import get_resilience
 
 logger = structlog.get_logger(__name__)
 
@@ -34,7 +35,10 @@ class CitationVerifierAgent:
     """
 
     def __init__(self):
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_retries=0,  # Retries handled by app.core.resilience
+        )
         self.model = "claude-sonnet-4-5-20250929"
 
     async def verify_citations(
@@ -274,7 +278,8 @@ class CitationVerifierAgent:
         prompt = self._build_verification_prompt(content, citations_to_verify, extraction["references"])
 
         try:
-            response = await self.client.messages.create(
+            response = await get_resilience("anthropic").call(
+                self.client.messages.create,
                 model=self.model,
                 max_tokens=1000,
                 temperature=0.2,
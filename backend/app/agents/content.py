@@ -11,6 +11,7 @@ from anthropic import AsyncAnthropic
 import structlog
 
 from app.core.config import settings
+from app.core.resilience import get_resilience
 
 logger = structlog.get_logger(__name__)
 
@@ -26,7 +27,10 @@ class ContentAgent:
     """
 
     def __init__(self):
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_retries=0,  # Retries handled by app.core.resilience
+        )
         self.model = settings.CONTENT_MODEL  # Configurable: Sonnet or Haiku
 
         # Site-specific writing styles
@@ -134,7 +138,8 @@ Your goal: Create content that outranks competitors through superior quality, de
 - Maintain logical flow, natural transitions, and spontaneous tone
 - Balance technical precision with emotional relatability"""
 
-            response = await self.client.messages.create(
+            response = await get_resilience("anthropic").call(
+                self.client.messages.create,
                 model=self.model,
                 max_tokens=8192,  # Required parameter - Claude will stop naturally when article is complete
                 temperature=0.7,
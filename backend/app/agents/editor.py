@@ -12,6 +12,7 @@ from anthropic import AsyncAnthropic
 import structlog
 
 from app.core.config import settings
+from app.core.resilience import get_resilience
 from app.core.research_apis import CritiqueLabsProvider
 
 logger = structlog.get_logger(__name__)
@@ -32,7 +33,10 @@ class EditorAgent:
     """
 
     def __init__(self):
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_retries=0,  # Retries handled by app.core.resilience
+        )
         self.model = settings.ANTHROPIC_MODEL
         self.critique_labs = CritiqueLabsProvider()
 
@@ -58,7 +62,8 @@ class EditorAgent:
         prompt = self._build_prompt(article, citation_validation, seo_validation)
 
         try:
-            response = await self.client.messages.create(
+            response = await get_resilience("anthropic").call(
+                self.client.messages.create,
                 model=self.model,
                 max_tokens=500,
                 temperature=0.2,  # Lower temp for consistent scoring
@@ -202,7 +207,8 @@ class EditorAgent:
 
         try:
             # Use Claude Sonnet 4.5 for refinement (highest quality)
-            response = await self.client.messages.create(
+            response = await get_resilience("anthropic").call(
+                self.client.messages.create,
                 model="claude-sonnet-4-5-20250929",  # Always use latest Sonnet for refinement
                 max_tokens=8192,
                 temperature=0.7,
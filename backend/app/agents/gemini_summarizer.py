@@ -11,6 +11,8 @@ import google.generativeai as genai
 import structlog
 
 from app.core.config import settings
+from app.core.gemini_executor import run_gemini
+from app.core.resilience import get_resilience
 
 logger = structlog.get_logger(__name__)
 
@@ -102,13 +104,18 @@ class GeminiSummarizer:
 
         try:
             # Call Gemini API
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Low temp for factual compression
-                    max_output_tokens=8192,  # Compressed output
+            async def generate():
+                return await run_gemini(
+                    self.model.generate_content,
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,  # Low temp for factual compression
+                        max_output_tokens=8192,  # Compressed output
+                    ),
+                    request_options={"timeout": settings.GEMINI_REQUEST_TIMEOUT_SECONDS}
                 )
-            )
+
+            response = await get_resilience("gemini").call(generate)
 
             # Extract compressed research
             compressed_text = response.text
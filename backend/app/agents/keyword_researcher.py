@@ -12,6 +12,7 @@ import structlog
 from anthropic import AsyncAnthropic
 
 from app.core.config import settings
+from app.core.resilience import get_resilience
 from app.core.research_apis import DataForSEOProvider
 
 logger = structlog.get_logger(__name__)
@@ -74,44 +75,42 @@ Keywords:"""
 
         try:
             # Use Perplexity API for keyword identification
-            from httpx import AsyncClient
-
-            async with AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.perplexity_model,
-                        "messages": [
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3  # Lower for consistency
-                    }
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    content = data["choices"][0]["message"]["content"]
-
-                    # Extract JSON array from response
-                    try:
-                        # Clean the response to get just the JSON
-                        json_match = re.search(r'\[.*\]', content, re.DOTALL)
-                        if json_match:
-                            keywords = json.loads(json_match.group())
-                            logger.info("keyword_researcher.identified", count=len(keywords))
-                            return keywords[:20]  # Limit to 20
-                    except json.JSONDecodeError:
-                        logger.warning("keyword_researcher.parse_failed", using_fallback=True)
-                        # Fallback: split by lines/commas
-                        keywords = [k.strip(' -"[]') for k in content.split('\n') if k.strip()]
-                        return keywords[:20]
-                else:
-                    logger.error("perplexity_error", status=response.status_code)
-                    return self._get_fallback_keywords(topic)
+            response = await get_resilience("perplexity").request(
+                "POST",
+                "https://api.perplexity.ai/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.perplexity_model,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.3  # Lower for consistency
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                content = data["choices"][0]["message"]["content"]
+
+                # Extract JSON array from response
+                try:
+                    # Clean the response to get just the JSON
+                    json_match = re.search(r'\[.*\]', content, re.DOTALL)
+                    if json_match:
+                        keywords = json.loads(json_match.group())
+                        logger.info("keyword_researcher.identified", count=len(keywords))
+                        return keywords[:20]  # Limit to 20
+                except json.JSONDecodeError:
+                    logger.warning("keyword_researcher.parse_failed", using_fallback=True)
+                    # Fallback: split by lines/commas
+                    keywords = [k.strip(' -"[]') for k in content.split('\n') if k.strip()]
+                    return keywords[:20]
+            else:
+                logger.error("perplexity_error", status=response.status_code)
+                return self._get_fallback_keywords(topic)
 
         except Exception as e:
             logger.error("keyword_researcher.identification_failed", error=str(e))
@@ -7,7 +7,7 @@ import asyncio
 import json
 import re
 from decimal import Decimal
-from typing import Dict, Literal
+from typing import Dict, List, Literal
 from uuid import uuid4
 
 import structlog
@@ -24,11 +24,28 @@ from app.agents.editor import EditorAgent
 from app.agents.citation_verifier import CitationVerifierAgent
 from app.agents.image import ImageAgent
 from app.core.link_validator import LinkValidator
+from app.core.checkpoints import checkpoint_store
+from app.core.pipeline import Stage, StageScheduler
+from app.core.research_queue import completed_topic_index
 
 logger = structlog.get_logger(__name__)
 
 TargetSite = Literal["relocation", "placement", "rainmaker"]
 
+# Seconds before a pipeline stage is abandoned. Generous enough to cover the
+# provider retry budgets in app.core.resilience for every call a stage makes.
+STAGE_TIMEOUTS = {
+    "keyword_research": 120,
+    "template_detection": 180,
+    "research": 300,
+    "gemini_compression": 420,
+    "link_validation": 120,
+    "content": 1200,
+    "editor": 1800,  # Score + refinement + re-score
+    "citation_verification": 300,
+    "images": 300,
+}
+
 
 def detect_content_type(topic: str) -> str:
     """
@@ -149,6 +166,10 @@ class ArticleOrchestrator:
     4. ImageAgent (60s, parallel) → Generate 4 specialized images
     5. PerformanceTracker → Store archetype/template metrics for learning
 
+    Stages are run by app.core.pipeline.StageScheduler as a dependency graph:
+    0.5 runs alongside 1, compression alongside 1.5, and 4 alongside
+    citation verification.
+
     Total: 2.5-3.5 minutes per article
     Cost: ~$0.68-$0.90 per article (Template Intelligence + all APIs)
     Cost (cached): ~$0.60 per article (50%+ cache hit rate)
@@ -204,16 +225,233 @@ class ArticleOrchestrator:
             "image": Decimal("0.00"),
         }
 
+        async def report_progress(stage: Stage):
+            await self._update_job_status(
+                job_id, "processing", stage.progress, stage.name
+            )
+
+        async def save_checkpoint(stage: Stage, result):
+            await checkpoint_store.save(job_id, stage.name, result)
+
+        scheduler = StageScheduler(
+            costs,
+            on_progress=report_progress,
+            on_complete=save_checkpoint,
+            job_id=job_id,
+        )
+
         try:
-            # STEP 0: Keyword Research (20-30s) - NEW!
+            # A retried job resumes after its last completed stage
+            scheduler.restore(await checkpoint_store.load(job_id))
+
+            # STEPS 0-3: Keyword research → template detection ∥ research →
+            # compression ∥ link validation → content → editor
+            results = await scheduler.run(
+                self._drafting_stages(topic, target_site, job_id, costs)
+            )
+
+            research_result = results["research"]
+            template_guidance = results["template_detection"]
+            editor_stage = results["editor"]
+            article_data = editor_stage["article"]
+            editor_result = editor_stage["editor_result"]
+            decision = editor_stage["decision"]
+            quality_score = editor_stage["quality_score"]
+
+            if decision == "reject":
+                logger.warning(
+                    "orchestrator.article_rejected",
+                    job_id=job_id,
+                    quality_score=quality_score,
+                )
+                await self._update_job_status(
+                    job_id,
+                    "failed",
+                    100,
+                    "completed",
+                    error_message=f"Quality score too low: {quality_score}",
+                )
+                await checkpoint_store.clear(job_id)
+                return {
+                    "status": "rejected",
+                    "quality_score": quality_score,
+                    "reason": editor_result["feedback"],
+                    "costs": costs,
+                }
+
+            # STEPS 3.75 + 4: Citation verification ∥ image generation
+            results = await scheduler.run(
+                self._finishing_stages(target_site, article_data, research_result)
+            )
+
+            citation_result = results["citation_verification"]
+            if citation_result:
+                # Log verification results
+                logger.info(
+                    "orchestrator.citation_verification_complete",
+                    job_id=job_id,
+                    passed=citation_result["verification_passed"],
+                    confidence=citation_result["confidence_score"],
+                    verified_urls=citation_result["verified_urls"],
+                    total_refs=citation_result["total_references"],
+                    fake_urls=len(citation_result["fake_urls"])
+                )
+
+                # Flag article for review if citation verification fails
+                if not citation_result["verification_passed"]:
+                    logger.warning(
+                        "orchestrator.citation_verification_failed",
+                        job_id=job_id,
+                        confidence=citation_result["confidence_score"],
+                        fake_urls=citation_result["fake_urls"],
+                        suspicious_claims=len(citation_result["suspicious_claims"])
+                    )
+                    # Downgrade to review status
+                    if decision == "publish":
+                        decision = "review"
+                        logger.info(
+                            "orchestrator.decision_downgraded",
+                            job_id=job_id,
+                            reason="Citation verification failed",
+                            new_decision="review"
+                        )
+
+            async def save_article(results: Dict) -> Dict:
+                # Create article in database (with Template Intelligence metadata)
+                article_id = await self._create_article(
+                    article_data,
+                    target_site,
+                    quality_score,
+                    editor_result["feedback"],
+                    status="review" if decision == "review" else "approved",
+                    template_guidance=template_guidance,  # Include archetype/template
+                    eeat_score=editor_result.get("eeat_score", 0),  # E-E-A-T score from editor
+                    topic=topic  # Pass topic for content_type and country detection
+                )
+                return {"article_id": article_id}
+
+            # Checkpointed too, so a retry never inserts the article twice
+            results = await scheduler.run([Stage("article", save_article)])
+            article_id = results["article"]["article_id"]
+
+            # Attach images (ALWAYS generate hero, content images only for high quality)
+            if settings.ENABLE_IMAGE_GENERATION:
+                await self._update_job_status(
+                    job_id, "processing", 90, "image", article_id=article_id
+                )
+
+                image_result = results.get("images")
+                if image_result:
+                    # Update article with all images
+                    await self._update_article_images(article_id, image_result)
+
+                # Determine final status and publish if quality threshold met
+                if decision == "publish":
+                    # Always publish high-quality articles (set status + published_at)
+                    await self._publish_article(article_id)
+                    final_status = "published"
+                else:
+                    # Medium quality - human review required
+                    final_status = "review"
+            else:
+                # No image generation
+                final_status = "review" if decision != "publish" else "approved"
+
+            # STEP 5: Store Template Performance (non-blocking)
+            # Calculate word count from content
+            content_word_count = len(article_data.get("content", "").split())
+            await self._store_template_performance(
+                article_id,
+                template_guidance,
+                quality_score,
+                editor_result.get("eeat_score", 0),
+                content_word_count
+            )
+
+            # Update job as completed
+            total_cost = sum(costs.values())
             await self._update_job_status(
-                job_id, "processing", 5, "keyword_research"
+                job_id,
+                "completed",
+                100,
+                "completed",
+                article_id=article_id,
+                cost_breakdown=costs,
+                total_cost=total_cost,
             )
+            await checkpoint_store.clear(job_id)
 
+            # Fetch article metadata from database for return payload
+            pool = get_db()
+            async with pool.acquire() as conn:
+                article = await conn.fetchrow(
+                    """
+                    SELECT title, slug, LENGTH(content) as word_count
+                    FROM articles
+                    WHERE id = $1
+                    """,
+                    article_id
+                )
+
+            logger.info(
+                "orchestrator.complete",
+                job_id=job_id,
+                article_id=article_id,
+                quality_score=quality_score,
+                decision=decision,
+                total_cost=float(total_cost),
+            )
+
+            return {
+                "status": "success",
+                "article_id": article_id,
+                "article_status": final_status,
+                "quality_score": quality_score,
+                "decision": decision,
+                "title": article["title"] if article else None,
+                "slug": article["slug"] if article else None,
+                "word_count": article["word_count"] if article else None,
+                "costs": {k: float(v) for k, v in costs.items()},
+                "total_cost": float(total_cost),
+            }
+
+        except Exception as e:
+            logger.error(
+                "orchestrator.failed",
+                job_id=job_id,
+                error=str(e),
+                exc_info=e,
+            )
+
+            await self._update_job_status(
+                job_id,
+                "failed",
+                0,
+                "error",
+                error_message=str(e),
+            )
+
+            raise
+
+    def _drafting_stages(
+        self,
+        topic: str,
+        target_site: TargetSite,
+        job_id: str,
+        costs: Dict[str, Decimal],
+    ) -> List[Stage]:
+        """
+        Stages from keyword research up to the editor's decision
+
+        Template detection and research only need the primary keyword, and
+        link validation only needs research sources, so they overlap with
+        their neighbours instead of running one after another.
+        """
+
+        async def keyword_research(results: Dict) -> Dict:
             keyword_result = await self.keyword_researcher.research_keywords(
                 topic, target_site
             )
-            costs["keyword_research"] = keyword_result["cost"]
 
             # Extract SEO data for content optimization
             seo_data = {
@@ -231,18 +469,15 @@ class ArticleOrchestrator:
                 competition=seo_data["competition"]
             )
 
-            # STEP 0.5: Template Intelligence - SERP Analysis (10-20s) - NEW!
-            await self._update_job_status(
-                job_id, "processing", 10, "template_detection"
-            )
+            return {**keyword_result, "seo_data": seo_data}
 
+        async def template_detection(results: Dict) -> Dict:
             # Use primary keyword for SERP analysis
             template_guidance = await self.template_detector.run(
-                keyword=seo_data["primary_keyword"],
+                keyword=results["keyword_research"]["seo_data"]["primary_keyword"],
                 use_cache=True,
                 max_competitors=3
             )
-            costs["template_detection"] = template_guidance.get("cost", Decimal("0.00"))
 
             logger.info(
                 "orchestrator.template_detected",
@@ -253,18 +488,15 @@ class ArticleOrchestrator:
                 from_cache=template_guidance.get("from_cache", False)
             )
 
-            # STEP 1: Research (30-60s) + Authority Discovery
-            await self._update_job_status(
-                job_id, "processing", 15, "research"
-            )
+            return template_guidance
 
+        async def research(results: Dict) -> Dict:
             # Pass keyword to enable DA discovery
             research_result = await self.research_agent.run(
                 topic,
-                keyword=seo_data["primary_keyword"],
+                keyword=results["keyword_research"]["seo_data"]["primary_keyword"],
                 target_site=target_site
             )
-            costs["research"] = research_result["cost"]
 
             # Log authority discovery results if available
             if research_result.get("authorities"):
@@ -277,21 +509,15 @@ class ArticleOrchestrator:
                     da_cost=float(research_result.get("cost_breakdown", {}).get("authority_discovery", 0))
                 )
 
-            # STEP 1.25: Gemini Research Compression (NEW - 5-10s)
-            # Compress massive research data into high-signal summary
-            await self._update_job_status(
-                job_id, "processing", 20, "gemini_compression"
-            )
+            return research_result
 
+        async def gemini_compression(results: Dict) -> Dict:
+            # Compress massive research data into high-signal summary
             gemini_result = await self.gemini_summarizer.compress_research(
-                research_result.get("research", {}),
+                results["research"].get("research", {}),
                 topic,
                 target_site
             )
-            costs["gemini_compression"] = gemini_result["cost"]
-
-            # Use compressed research for content generation (saves 90% on input tokens!)
-            compressed_research = gemini_result["compressed_research"]
 
             logger.info(
                 "orchestrator.research_compressed",
@@ -300,20 +526,25 @@ class ArticleOrchestrator:
                 input_tokens_saved=gemini_result["tokens"]["input"]
             )
 
-            # STEP 1.5: Link Validation (Option 3 - Pre-generation)
-            sources = research_result.get("sources", [])
+            return gemini_result
+
+        async def link_validation(results: Dict) -> Dict:
+            # Option 3 - Pre-generation link validation
+            sources = results["research"].get("sources", [])
             link_context = await self.link_validator.prepare_link_context(
                 topic, sources
             )
 
             # Add SEO data to link context for content generation
-            link_context["seo_data"] = seo_data
+            link_context["seo_data"] = results["keyword_research"]["seo_data"]
+            return link_context
 
-            await self._update_job_status(
-                job_id, "processing", 35, "content"
-            )
+        async def content(results: Dict) -> Dict:
+            # Use compressed research for content generation (saves 90% on input tokens!)
+            compressed_research = results["gemini_compression"]["compressed_research"]
+            link_context = results["link_validation"]
+            template_guidance = results["template_detection"]
 
-            # STEP 2: Content Generation (60-90s)
             # Use chunked generation (Gemini 2.5 Pro + Sonnet) if enabled, otherwise single-shot Sonnet
             if settings.ENABLE_CHUNKED_CONTENT and self.chunked_content_agent:
                 logger.info(
@@ -321,40 +552,36 @@ class ArticleOrchestrator:
                     job_id=job_id,
                     reason="ENABLE_CHUNKED_CONTENT=True - Gemini 2.5 Pro chunks + Sonnet refinement"
                 )
-                content_result = await self.chunked_content_agent.generate(
+                return await self.chunked_content_agent.generate(
                     {"content": compressed_research},
                     target_site,
                     topic,
                     link_context=link_context,
                     template_guidance=template_guidance
                 )
-            else:
-                logger.info(
-                    "orchestrator.using_single_shot_content",
-                    job_id=job_id,
-                    reason="ENABLE_CHUNKED_CONTENT=False or no Gemini API key - Single-shot Sonnet"
-                )
-                content_result = await self.content_agent.run(
-                    {"content": compressed_research},  # Use Gemini-compressed research (90% fewer input tokens!)
-                    target_site,
-                    topic,
-                    link_context=link_context,  # Pass validated links + SEO data
-                    template_guidance=template_guidance  # Pass Template Intelligence recommendations
-                )
-            costs["content"] = content_result["cost"]
 
-            await self._update_job_status(
-                job_id, "processing", 60, "editor"
+            logger.info(
+                "orchestrator.using_single_shot_content",
+                job_id=job_id,
+                reason="ENABLE_CHUNKED_CONTENT=False or no Gemini API key - Single-shot Sonnet"
             )
-
-            # STEP 3: Quality Scoring (20-30s)
-            editor_result = await self.editor_agent.score(
-                content_result["article"]
+            return await self.content_agent.run(
+                {"content": compressed_research},  # Use Gemini-compressed research (90% fewer input tokens!)
+                target_site,
+                topic,
+                link_context=link_context,  # Pass validated links + SEO data
+                template_guidance=template_guidance  # Pass Template Intelligence recommendations
             )
-            costs["editor"] = editor_result["cost"]
+
+        async def editor(results: Dict) -> Dict:
+            article = results["content"]["article"]
+
+            # Quality Scoring (20-30s)
+            editor_result = await self.editor_agent.score(article)
+            editor_cost = editor_result["cost"]
 
             # Check cost cap before potential refinement
-            total_cost = sum(costs.values())
+            total_cost = sum(costs.values()) + editor_cost
             if (
                 settings.ENABLE_COST_CIRCUIT_BREAKER
                 and total_cost > settings.PER_JOB_COST_CAP
@@ -373,7 +600,7 @@ class ArticleOrchestrator:
             decision = editor_result["decision"]
             quality_score = editor_result["quality_score"]
 
-            # STEP 3.5: Article Refinement (NEW - if score 60-74)
+            # STEP 3.5: Article Refinement (if score 60-74)
             # Trigger refinement for medium-quality articles
             if 60 <= quality_score < 75:
                 # Store original score before refinement for improvement tracking
@@ -393,15 +620,15 @@ class ArticleOrchestrator:
                 try:
                     # Refine the article
                     refinement_result = await self.editor_agent.refine(
-                        article=content_result["article"],
+                        article=article,
                         feedback=editor_result
                     )
 
                     # Track refinement cost
-                    costs["editor"] += refinement_result["cost"]
+                    editor_cost += refinement_result["cost"]
 
-                    # Update article with refined version
-                    content_result["article"] = refinement_result["article"]
+                    # Continue with the refined version
+                    article = refinement_result["article"]
 
                     logger.info(
                         "orchestrator.refinement_complete",
@@ -416,10 +643,8 @@ class ArticleOrchestrator:
                         job_id, "processing", 75, "re_scoring"
                     )
 
-                    editor_result = await self.editor_agent.score(
-                        content_result["article"]
-                    )
-                    costs["editor"] += editor_result["cost"]
+                    editor_result = await self.editor_agent.score(article)
+                    editor_cost += editor_result["cost"]
 
                     # Update decision and quality score with refined version
                     decision = editor_result["decision"]
@@ -445,202 +670,80 @@ class ArticleOrchestrator:
                         message="Continuing with original article"
                     )
                     # Continue with original article if refinement fails
-                    pass
-
-            if decision == "reject":
-                logger.warning(
-                    "orchestrator.article_rejected",
-                    job_id=job_id,
-                    quality_score=quality_score,
-                )
-                await self._update_job_status(
-                    job_id,
-                    "failed",
-                    100,
-                    "completed",
-                    error_message=f"Quality score too low: {quality_score}",
-                )
-                return {
-                    "status": "rejected",
-                    "quality_score": quality_score,
-                    "reason": editor_result["feedback"],
-                    "costs": costs,
-                }
-
-            # STEP 3.75: Citation Verification (NEW - 5-10s)
-            # Verify citations against research sources to prevent hallucinations
-            await self._update_job_status(
-                job_id, "processing", 82, "citation_verification"
-            )
-
-            try:
-                citation_result = await self.citation_verifier.verify_citations(
-                    content_result["article"],
-                    research_result.get("sources", [])
-                )
-                costs["citation_verification"] = citation_result["cost"]
 
-                # Log verification results
-                logger.info(
-                    "orchestrator.citation_verification_complete",
-                    job_id=job_id,
-                    passed=citation_result["verification_passed"],
-                    confidence=citation_result["confidence_score"],
-                    verified_urls=citation_result["verified_urls"],
-                    total_refs=citation_result["total_references"],
-                    fake_urls=len(citation_result["fake_urls"])
-                )
-
-                # Flag article for review if citation verification fails
-                if not citation_result["verification_passed"]:
-                    logger.warning(
-                        "orchestrator.citation_verification_failed",
-                        job_id=job_id,
-                        confidence=citation_result["confidence_score"],
-                        fake_urls=citation_result["fake_urls"],
-                        suspicious_claims=len(citation_result["suspicious_claims"])
-                    )
-                    # Downgrade to review status
-                    if decision == "publish":
-                        decision = "review"
-                        logger.info(
-                            "orchestrator.decision_downgraded",
-                            job_id=job_id,
-                            reason="Citation verification failed",
-                            new_decision="review"
-                        )
-
-            except Exception as citation_error:
-                logger.warning(
-                    "orchestrator.citation_verification_error",
-                    job_id=job_id,
-                    error=str(citation_error),
-                    message="Continuing without citation verification"
-                )
-                # Continue without failing the entire job
-                pass
-
-            # Create article in database (with Template Intelligence metadata)
-            article_id = await self._create_article(
-                content_result["article"],
-                target_site,
-                quality_score,
-                editor_result["feedback"],
-                status="review" if decision == "review" else "approved",
-                template_guidance=template_guidance,  # Include archetype/template
-                eeat_score=editor_result.get("eeat_score", 0),  # E-E-A-T score from editor
-                topic=topic  # Pass topic for content_type and country detection
-            )
-
-            await self._update_job_status(
-                job_id, "processing", 90, "image", article_id=article_id
-            )
-
-            # STEP 4: Image Generation (ALWAYS generate hero, content images only for high quality)
-            if settings.ENABLE_IMAGE_GENERATION:
-                # Generate URL-safe slug for images
-                import re
-                safe_slug = re.sub(r'[^a-z0-9-]', '', content_result["article"]["title"]
-                    .lower()
-                    .replace(" ", "-"))[:50]
-
-                # Generate hero image for ALL articles + content images for high quality
-                image_result = await self.image_agent.generate(
-                    content_result["article"],
-                    target_site,
-                    safe_slug,
-                )
-                costs["image"] = image_result["cost"]
-
-                # Update article with all images
-                await self._update_article_images(article_id, image_result)
-
-                # Determine final status and publish if quality threshold met
-                if decision == "publish":
-                    # Always publish high-quality articles (set status + published_at)
-                    await self._publish_article(article_id)
-                    final_status = "published"
-                else:
-                    # Medium quality - human review required
-                    final_status = "review"
-            else:
-                # No image generation
-                final_status = "review" if decision != "publish" else "approved"
-
-            # STEP 5: Store Template Performance (non-blocking)
-            # Calculate word count from content
-            content_word_count = len(content_result["article"].get("content", "").split())
-            await self._store_template_performance(
-                article_id,
-                template_guidance,
-                quality_score,
-                editor_result.get("eeat_score", 0),
-                content_word_count
-            )
+            return {
+                "article": article,
+                "editor_result": editor_result,
+                "decision": decision,
+                "quality_score": quality_score,
+                "cost": editor_cost,
+            }
 
-            # Update job as completed
-            total_cost = sum(costs.values())
-            await self._update_job_status(
-                job_id,
-                "completed",
-                100,
-                "completed",
-                article_id=article_id,
-                cost_breakdown=costs,
-                total_cost=total_cost,
-            )
+        return [
+            Stage("keyword_research", keyword_research, progress=5, cost_key="keyword_research",
+                  timeout=STAGE_TIMEOUTS["keyword_research"]),
+            Stage("template_detection", template_detection, after=["keyword_research"], progress=10,
+                  cost_key="template_detection", timeout=STAGE_TIMEOUTS["template_detection"]),
+            Stage("research", research, after=["keyword_research"], progress=15,
+                  cost_key="research", timeout=STAGE_TIMEOUTS["research"]),
+            Stage("gemini_compression", gemini_compression, after=["research"], progress=20,
+                  cost_key="gemini_compression", timeout=STAGE_TIMEOUTS["gemini_compression"]),
+            Stage("link_validation", link_validation, after=["research", "keyword_research"],
+                  timeout=STAGE_TIMEOUTS["link_validation"]),
+            Stage("content", content,
+                  after=["gemini_compression", "link_validation", "template_detection"],
+                  progress=35, cost_key="content", timeout=STAGE_TIMEOUTS["content"]),
+            Stage("editor", editor, after=["content"], progress=60,
+                  cost_key="editor", timeout=STAGE_TIMEOUTS["editor"]),
+        ]
+
+    def _finishing_stages(
+        self,
+        target_site: TargetSite,
+        article: Dict,
+        research_result: Dict,
+    ) -> List[Stage]:
+        """
+        Stages after an article passes the editor
 
-            # Fetch article metadata from database for return payload
-            pool = get_db()
-            async with pool.acquire() as conn:
-                article = await conn.fetchrow(
-                    """
-                    SELECT title, slug, LENGTH(content) as word_count
-                    FROM articles
-                    WHERE id = $1
-                    """,
-                    article_id
-                )
+        Citation verification never changes the article, so images are
+        generated from the final text while citations are checked.
+        """
 
-            logger.info(
-                "orchestrator.complete",
-                job_id=job_id,
-                article_id=article_id,
-                quality_score=quality_score,
-                decision=decision,
-                total_cost=float(total_cost),
+        async def citation_verification(results: Dict) -> Dict:
+            # Verify citations against research sources to prevent hallucinations
+            return await self.citation_verifier.verify_citations(
+                article,
+                research_result.get("sources", [])
             )
 
-            return {
-                "status": "success",
-                "article_id": article_id,
-                "article_status": final_status,
-                "quality_score": quality_score,
-                "decision": decision,
-                "title": article["title"] if article else None,
-                "slug": article["slug"] if article else None,
-                "word_count": article["word_count"] if article else None,
-                "costs": {k: float(v) for k, v in costs.items()},
-                "total_cost": float(total_cost),
-            }
+        async def images(results: Dict) -> Dict:
+            # Generate URL-safe slug for images
+            safe_slug = re.sub(r'[^a-z0-9-]', '', article["title"]
+                .lower()
+                .replace(" ", "-"))[:50]
 
-        except Exception as e:
-            logger.error(
-                "orchestrator.failed",
-                job_id=job_id,
-                error=str(e),
-                exc_info=e,
+            # Generate hero image for ALL articles + content images for high quality
+            return await self.image_agent.generate(
+                article,
+                target_site,
+                safe_slug,
             )
 
-            await self._update_job_status(
-                job_id,
-                "failed",
-                0,
-                "error",
-                error_message=str(e),
+        # Both are best-effort: the article is saved without them on failure
+        stages = [
+            Stage("citation_verification", citation_verification, progress=82,
+                  cost_key="citation_verification", required=False,
+                  timeout=STAGE_TIMEOUTS["citation_verification"]),
+        ]
+
+        if settings.ENABLE_IMAGE_GENERATION:
+            stages.append(
+                Stage("images", images, cost_key="image", required=False,
+                      timeout=STAGE_TIMEOUTS["images"])
             )
 
-            raise
+        return stages
 
     async def _update_job_status(
         self,
@@ -769,6 +872,10 @@ class ArticleOrchestrator:
                     eeat_score
                 )
 
+            # Later jobs in this process see the topic as covered immediately
+            completed_topic_index.add(title.lower())
+            completed_topic_index.add(slug.lower())
+
             logger.info(
                 "orchestrator.article_created",
                 article_id=article_id,
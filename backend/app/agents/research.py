@@ -15,9 +15,12 @@ import structlog
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.resilience import get_resilience
 from app.core.research_queue import ResearchGovernance
 from app.core.research_apis import MultiAPIResearch
+from app.core.research_blobs import research_blob_store
 from app.core.research_cache import ClusterResearchCache
+from app.core.research_refresher import research_refresher
 from app.core.authority_discovery import AuthorityDiscovery
 
 logger = structlog.get_logger(__name__)
@@ -35,7 +38,10 @@ class ResearchAgent:
     """
 
     def __init__(self):
-        self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            max_retries=0,  # Retries handled by app.core.resilience
+        )
         self.perplexity_api_key = settings.PERPLEXITY_API_KEY
         self.cache_enabled = settings.RESEARCH_CACHE_ENABLED
         self.similarity_threshold = settings.RESEARCH_CACHE_SIMILARITY_THRESHOLD
@@ -88,7 +94,7 @@ class ResearchAgent:
 
         # Step 1: Check cluster cache FIRST (highest priority - 90% savings)
         if self.cache_enabled:
-            cluster_result = await self.cluster_cache.get_research(topic)
+            cluster_result = await self.cluster_cache.get_research(topic, sections=("research_data",))
             if cluster_result and cluster_result.get("cached"):
                 logger.info(
                     "research_agent.cluster_cache_hit",
@@ -97,6 +103,12 @@ class ResearchAgent:
                     age_days=cluster_result["cache_age_days"],
                     cost_saved=0.45
                 )
+                if cluster_result.get("refresh_due"):
+                    # Serve this copy now, replace it off the critical path
+                    research_refresher.request(
+                        cluster_result["cluster_id"],
+                        cluster_result["source_topic"]
+                    )
                 return {
                     "topic": topic,
                     "research": cluster_result["research_data"],
@@ -247,8 +259,10 @@ class ResearchAgent:
         Cost: ~$0.000016 per query (negligible)
         """
         try:
-            response = await self.openai_client.embeddings.create(
-                model=settings.OPENAI_EMBEDDING_MODEL, input=text
+            response = await get_resilience("openai").call(
+                self.openai_client.embeddings.create,
+                model=settings.OPENAI_EMBEDDING_MODEL,
+                input=text
             )
             return response.data[0].embedding
 
@@ -274,7 +288,8 @@ class ResearchAgent:
                 SELECT
                     id,
                     topic_query,
-                    research_json,
+                    research_json_hash,
+                    CASE WHEN research_json_hash IS NULL THEN research_json END AS research_json,
                     cache_hits,
                     1 - (embedding <=> $1::vector) as similarity
                 FROM article_research
@@ -304,10 +319,15 @@ class ResearchAgent:
                         result["id"],
                     )
 
-                    return dict(result)
-
+            if not result:
                 return None
 
+            cached = dict(result)
+            if cached["research_json_hash"]:
+                cached["research_json"] = await research_blob_store.get(cached["research_json_hash"])
+
+            return cached
+
         except Exception as e:
             logger.error("research_agent.cache_check_failed", error=str(e), exc_info=e)
             # Don't fail on cache errors - continue to API call
@@ -377,19 +397,20 @@ Provide comprehensive, factual information with specific citations."""
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
+            response = await get_resilience("perplexity").request(
+                "POST", url, headers=headers, json=payload, timeout=60.0
+            )
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                return {
-                    "topic": topic,
-                    "content": data["choices"][0]["message"]["content"],
-                    "citations": data.get("citations", []),
-                    "timestamp": datetime.now().isoformat(),
-                    "model": settings.PERPLEXITY_MODEL,
-                }
+            return {
+                "topic": topic,
+                "content": data["choices"][0]["message"]["content"],
+                "citations": data.get("citations", []),
+                "timestamp": datetime.now().isoformat(),
+                "model": settings.PERPLEXITY_MODEL,
+            }
 
         except httpx.TimeoutException:
             logger.error("research_agent.perplexity_timeout", topic=topic)
@@ -423,8 +444,8 @@ Provide comprehensive, factual information with specific citations."""
         try:
             query = """
                 INSERT INTO article_research
-                (topic_query, embedding, research_json, expires_at)
-                VALUES ($1::text, $2::vector, $3::jsonb, NOW() + INTERVAL '{} days')
+                (topic_query, embedding, research_json, research_json_hash, expires_at)
+                VALUES ($1::text, $2::vector, $3::jsonb, $4, NOW() + INTERVAL '{} days')
             """.format(
                 self.cache_ttl_days
             )
@@ -433,12 +454,22 @@ Provide comprehensive, factual information with specific citations."""
             embedding_str = '[' + ','.join(map(str, embedding)) + ']'
 
             async with pool.acquire() as conn:
-                await conn.execute(
-                    query,
-                    topic,
-                    embedding_str,
-                    json.dumps(research_data),
-                )
+                async with conn.transaction():
+                    if research_blob_store.enabled:
+                        # Compressed blob; research_json stays empty
+                        [research_hash] = await research_blob_store.put_many([research_data], conn=conn)
+                        research_json = None
+                    else:
+                        research_hash = None
+                        research_json = json.dumps(research_data)
+
+                    await conn.execute(
+                        query,
+                        topic,
+                        embedding_str,
+                        research_json,
+                        research_hash,
+                    )
 
             logger.info("research_agent.cache_stored", topic=topic)
 
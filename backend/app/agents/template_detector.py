@@ -15,7 +15,10 @@ from bs4 import BeautifulSoup
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.research_apis import SerperProvider, FirecrawlProvider
+from app.core.research_apis import SerperProvider
+from app.core.scrape_service import scrape_service
+from app.core.provider_cache import normalize_query
+from app.core.single_flight import lock_ttl_for, single_flight
 
 logger = structlog.get_logger(__name__)
 
@@ -39,7 +42,7 @@ class TemplateDetector:
 
     def __init__(self):
         self.serper = SerperProvider()
-        self.firecrawl = FirecrawlProvider()
+        self.scraper = scrape_service  # Shared with MultiAPIResearch
 
         # Archetype detection thresholds
         self.archetype_thresholds = {
@@ -75,6 +78,14 @@ class TemplateDetector:
             }
         }
 
+    @single_flight(
+        "template_detector",
+        key=lambda keyword, use_cache=True, max_competitors=3: (
+            f"{max_competitors}:{use_cache}:{normalize_query(keyword)}"
+        ),
+        # A SERP lookup, then the competitor scrapes
+        lock_ttl=lock_ttl_for("serper") + lock_ttl_for("firecrawl")
+    )
     async def run(
         self,
         keyword: str,
@@ -140,7 +151,9 @@ class TemplateDetector:
 
         # Step 7: Calculate total cost
         total_cost = Decimal("0.05")  # Serper
-        total_cost += Decimal(str(len(scraped_competitors))) * Decimal("0.05")  # Firecrawl per URL
+        total_cost += sum(
+            (comp["cost"] for comp in scraped_competitors), Decimal("0")
+        )  # Firecrawl per URL (cached pages are free)
 
         # Step 8: Build result
         result = {
@@ -261,40 +274,41 @@ class TemplateDetector:
             return None
 
     async def _scrape_competitors(self, competitor_urls: List[Dict]) -> List[Dict]:
-        """Scrape competitor pages with Firecrawl and analyze content"""
-        if not self.firecrawl.is_available():
+        """Scrape competitor pages concurrently and analyze content"""
+        if not self.scraper.is_available():
             logger.warning("template_detector.firecrawl_unavailable")
             return []
 
-        scraped = []
-
-        for comp in competitor_urls:
-            try:
-                result = await self.firecrawl.scrape(comp["url"])
+        # Stored with the analysis by _store_cache
+        results = await self.scraper.scrape_many(
+            [comp["url"] for comp in competitor_urls],
+            persist=False
+        )
 
-                if not result or not result.get("content"):
-                    logger.warning("template_detector.scrape_empty", url=comp["url"])
-                    continue
+        scraped = []
 
-                content = result["content"]
+        for comp, result in zip(competitor_urls, results):
+            if not result or not result.get("content"):
+                logger.warning("template_detector.scrape_empty", url=comp["url"])
+                continue
 
-                # Analyze scraped content
-                analysis = self._analyze_content(content, comp["url"])
-                analysis["position"] = comp["position"]
-                analysis["title"] = comp["title"]
+            content = result["content"]
 
-                scraped.append(analysis)
+            # Analyze scraped content
+            analysis = self._analyze_content(content, comp["url"])
+            analysis["position"] = comp["position"]
+            analysis["title"] = comp["title"]
+            analysis["cost"] = result.get("cost", Decimal("0"))
 
-                logger.info(
-                    "template_detector.scraped",
-                    url=comp["url"],
-                    word_count=analysis["word_count"],
-                    modules=len(analysis["modules_found"])
-                )
+            scraped.append(analysis)
 
-            except Exception as e:
-                logger.error("template_detector.scrape_failed", url=comp["url"], error=str(e))
-                continue
+            logger.info(
+                "template_detector.scraped",
+                url=comp["url"],
+                word_count=analysis["word_count"],
+                modules=len(analysis["modules_found"]),
+                cached=result.get("cached", False)
+            )
 
         return scraped
 
@@ -372,7 +386,7 @@ class TemplateDetector:
             "has_case_studies": has_case_studies,
             "has_author_bio": has_author_bio,
             "citations_count": citations_count,
-            "scraped_content": content[:5000]  # Store first 5000 chars
+            "scraped_content": content  # Full markdown (ScrapeService reads it back as a cache)
         }
 
     def _detect_archetype(self, scraped_competitors: List[Dict]) -> Dict[str, float]:
@@ -586,8 +600,9 @@ class TemplateDetector:
                         has_case_studies,
                         has_author_bio,
                         citations_count,
-                        scraped_content
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+                        scraped_content,
+                        content_complete
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, true)
                     """,
                     serp_id,
                     comp["url"],
@@ -4,7 +4,7 @@ Endpoints for article generation and management
 """
 
 from uuid import uuid4
-from typing import Literal, Dict, Any, Optional
+from typing import Annotated, Literal, Dict, Any, List, Optional
 import json
 import re
 from pydantic import BaseModel, Field
@@ -12,7 +12,6 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 import structlog
 
 from app.agents.orchestrator import ArticleOrchestrator
-from app.core.redis_client import get_redis
 from app.core.database import get_db
 from app.core.queue import queue
 
@@ -46,6 +45,36 @@ class ArticleResponse(BaseModel):
     message: str
 
 
+class BatchArticleRequest(BaseModel):
+    """Request to generate many articles for one site"""
+
+    topics: List[Annotated[str, Field(min_length=10, max_length=200)]] = Field(
+        ..., min_length=1, max_length=1000, description="Article topics"
+    )
+    target_site: Literal["relocation", "placement", "rainmaker"] = Field(
+        ..., description="Target site for publication"
+    )
+    priority: Literal["low", "normal", "high"] = Field(
+        default="normal", description="Processing priority"
+    )
+
+
+class BatchJob(BaseModel):
+    """A single queued job in a batch response"""
+
+    job_id: str
+    topic: str
+    poll_url: str
+
+
+class BatchArticleResponse(BaseModel):
+    """Response for batch article generation"""
+
+    jobs: List[BatchJob]
+    status: str
+    message: str
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -132,6 +161,23 @@ async def generate_article(
                 request.target_site,
                 request.priority,
             )
+        elif queue_job_id != job_id:
+            # Same topic submitted within the idempotency window: drop the
+            # provisional row and point the caller at the existing job
+            logger.info(
+                "api.articles.duplicate_topic",
+                job_id=queue_job_id,
+                topic=request.topic
+            )
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM job_status WHERE job_id = $1", job_id)
+
+            return ArticleResponse(
+                job_id=queue_job_id,
+                status="queued",
+                poll_url=f"/api/jobs/{queue_job_id}",
+                message="Article generation already queued for this topic",
+            )
         else:
             # Update job_status with queue ID
             async with pool.acquire() as conn:
@@ -156,6 +202,111 @@ async def generate_article(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/generate/batch", response_model=BatchArticleResponse)
+async def generate_articles_batch(request: BatchArticleRequest):
+    """
+    Queue article generation jobs for many topics at once
+
+    Writes every job_status row in one multi-row INSERT and enqueues all
+    jobs in one pipelined Redis round trip.
+
+    Example:
+        POST /api/articles/generate/batch
+        {
+            "topics": ["Portugal digital nomad visa 2025", "Spain golden visa guide"],
+            "target_site": "relocation",
+            "priority": "normal"
+        }
+
+    Returns:
+        {
+            "jobs": [{"job_id": "abc123", "topic": "...", "poll_url": "/api/jobs/abc123"}, ...],
+            "status": "queued",
+            "message": "2 article generation jobs queued"
+        }
+    """
+    logger.info(
+        "api.articles.batch_generate_requested",
+        count=len(request.topics),
+        target_site=request.target_site,
+    )
+
+    job_ids = [str(uuid4()) for _ in request.topics]
+    priority_value = {"low": -1, "normal": 0, "high": 1}.get(request.priority, 0)
+
+    try:
+        # Insert all job status rows BEFORE returning (polling works immediately)
+        pool = get_db()
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO job_status (job_id, status, progress, current_step, cost_breakdown, created_at)
+                SELECT job_id, 'queued', 0, 'initializing', '{}'::jsonb, NOW()
+                FROM unnest($1::varchar(255)[]) AS job_id
+                """,
+                job_ids,
+            )
+
+        queued_ids = await queue.enqueue_many([
+            {
+                "job_type": "generate_article",
+                "data": {
+                    "topic": topic,
+                    "target_site": request.target_site,
+                    "priority": priority_value,
+                },
+                "priority": priority_value,
+                "job_id": job_id,
+            }
+            for topic, job_id in zip(request.topics, job_ids)
+        ])
+
+    except Exception as e:
+        logger.error("api.articles.batch_generate_failed", error=str(e), exc_info=e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # No background-task fallback here: running hundreds of pipelines inside
+    # the API process would starve it, so fail the batch instead.
+    if not queued_ids:
+        logger.warning("api.articles.batch_queue_unavailable", count=len(job_ids))
+
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE job_status
+                SET status = 'failed', error_message = $2, updated_at = NOW()
+                WHERE job_id = ANY($1::varchar(255)[])
+                """,
+                job_ids,
+                "Queue unavailable",
+            )
+
+        raise HTTPException(status_code=503, detail="Queue unavailable")
+
+    # Topics deduplicated against existing jobs resolve to those jobs' IDs
+    duplicate_ids = [
+        job_id for job_id, queued_id in zip(job_ids, queued_ids) if job_id != queued_id
+    ]
+    if duplicate_ids:
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "DELETE FROM job_status WHERE job_id = ANY($1::varchar(255)[])",
+                duplicate_ids,
+            )
+
+    return BatchArticleResponse(
+        jobs=[
+            BatchJob(job_id=job_id, topic=topic, poll_url=f"/api/jobs/{job_id}")
+            for topic, job_id in zip(request.topics, queued_ids)
+        ],
+        status="queued",
+        message=(
+            f"{len(queued_ids) - len(duplicate_ids)} article generation jobs queued"
+            + (f", {len(duplicate_ids)} already queued" if duplicate_ids else "")
+        ),
+    )
+
+
 def _serialize_article(row) -> Dict[str, Any]:
     """
     Convert an asyncpg row to a standard dict and normalise content/images.
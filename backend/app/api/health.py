@@ -12,6 +12,7 @@ import structlog
 from app.core.database import get_db
 from app.core.redis_client import get_redis
 from app.core.config import settings
+from app.core.provider_cache import provider_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -150,6 +151,7 @@ async def get_metrics():
                     "total_cost": float(daily_cost["total_cost_today"] or 0),
                     "avg_cost": float(daily_cost["avg_cost_per_article"] or 0),
                 },
+                "provider_cache": await provider_cache.get_stats(),
             }
 
     except Exception as e:
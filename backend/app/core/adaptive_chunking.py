@@ -24,6 +24,10 @@ import structlog
 
 import google.generativeai as genai
 
+from app.core.config import settings
+from app.core.gemini_executor import run_gemini
+from app.core.resilience import get_resilience
+
 logger = structlog.get_logger()
 
 
@@ -74,13 +78,18 @@ class AdaptiveChunkingStrategy:
 
         try:
             # Generate complexity analysis
-            response = self.analysis_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Low temp for consistent scoring
-                    max_output_tokens=500,
+            async def generate():
+                return await run_gemini(
+                    self.analysis_model.generate_content,
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,  # Low temp for consistent scoring
+                        max_output_tokens=500,
+                    ),
+                    request_options={"timeout": settings.GEMINI_REQUEST_TIMEOUT_SECONDS}
                 )
-            )
+
+            response = await get_resilience("gemini").call(generate)
 
             # Parse JSON response
             response_text = response.text.strip()
@@ -10,12 +10,13 @@ import asyncio
 import hashlib
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
-import httpx
 import structlog
 from bs4 import BeautifulSoup
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.http_client import get_http_client
+from app.core.resilience import get_resilience
 
 logger = structlog.get_logger(__name__)
 
@@ -199,31 +200,30 @@ class AuthorityDiscovery:
     async def _get_serp_results(self, keyword: str) -> List[Dict]:
         """Get top 10 organic results from Serper"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://google.serper.dev/search",
-                    headers={
-                        "X-API-KEY": self.serper_api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "q": keyword,
-                        "gl": "us",
-                        "hl": "en",
-                        "num": 10
-                    },
-                    timeout=10.0
-                )
+            response = await get_resilience("serper").request(
+                "POST",
+                "https://google.serper.dev/search",
+                headers={
+                    "X-API-KEY": self.serper_api_key,
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "q": keyword,
+                    "gl": "us",
+                    "hl": "en",
+                    "num": 10
+                }
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("organic", [])
-                else:
-                    logger.warning(
-                        "authority_discovery.serper_failed",
-                        status=response.status_code
-                    )
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("organic", [])
+            else:
+                logger.warning(
+                    "authority_discovery.serper_failed",
+                    status=response.status_code
+                )
+                return []
 
         except Exception as e:
             logger.error(
@@ -260,48 +260,47 @@ class AuthorityDiscovery:
         Cost: $0.10 per batch (up to 50 domains)
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.dataforseo.com/v3/backlinks/domain_metrics",
-                    auth=(self.dataforseo_user, self.dataforseo_pass),
-                    json=[{
-                        "targets": domains
-                    }],
-                    timeout=30.0
+            response = await get_resilience("dataforseo").request(
+                "POST",
+                "https://api.dataforseo.com/v3/backlinks/domain_metrics",
+                auth=(self.dataforseo_user, self.dataforseo_pass),
+                json=[{
+                    "targets": domains
+                }]
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    "authority_discovery.dataforseo_failed",
+                    status=response.status_code,
+                    response=response.text[:200]
                 )
+                return []
 
-                if response.status_code != 200:
-                    logger.error(
-                        "authority_discovery.dataforseo_failed",
-                        status=response.status_code,
-                        response=response.text[:200]
-                    )
-                    return []
+            data = response.json()
 
-                data = response.json()
+            if not data.get("tasks") or not data["tasks"][0].get("result"):
+                logger.warning("authority_discovery.dataforseo_no_results")
+                return []
 
-                if not data.get("tasks") or not data["tasks"][0].get("result"):
-                    logger.warning("authority_discovery.dataforseo_no_results")
-                    return []
-
-                results = []
-                for item in data["tasks"][0]["result"]:
-                    results.append({
-                        "domain": item["target"],
-                        "domain_authority": item.get("rank", 0),  # 0-100
-                        "backlinks": item.get("backlinks", 0),
-                        "referring_domains": item.get("referring_domains", 0),
-                        "organic_traffic": item.get("organic_traffic", 0),
-                        "first_seen": item.get("first_seen", "")
-                    })
-
-                logger.info(
-                    "authority_discovery.dataforseo_success",
-                    domains_checked=len(results),
-                    avg_da=sum(r["domain_authority"] for r in results) / len(results) if results else 0
-                )
+            results = []
+            for item in data["tasks"][0]["result"]:
+                results.append({
+                    "domain": item["target"],
+                    "domain_authority": item.get("rank", 0),  # 0-100
+                    "backlinks": item.get("backlinks", 0),
+                    "referring_domains": item.get("referring_domains", 0),
+                    "organic_traffic": item.get("organic_traffic", 0),
+                    "first_seen": item.get("first_seen", "")
+                })
+
+            logger.info(
+                "authority_discovery.dataforseo_success",
+                domains_checked=len(results),
+                avg_da=sum(r["domain_authority"] for r in results) / len(results) if results else 0
+            )
 
-                return results
+            return results
 
         except Exception as e:
             logger.error(
@@ -336,68 +335,68 @@ class AuthorityDiscovery:
         working_urls = [start_url]  # Always include the SERP URL
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Fetch the page
-                response = await client.get(
-                    start_url,
-                    timeout=10.0,
-                    follow_redirects=True,
-                    headers={"User-Agent": "QuestBot/1.0 (Research)"}
-                )
+            client = get_http_client()
+            # Fetch the page
+            response = await client.get(
+                start_url,
+                timeout=10.0,
+                follow_redirects=True,
+                headers={"User-Agent": "QuestBot/1.0 (Research)"}
+            )
 
-                if response.status_code != 200:
-                    return working_urls
-
-                # Parse HTML for links
-                soup = BeautifulSoup(response.text, 'html.parser')
-                links = soup.find_all('a', href=True)
-
-                # Extract URLs on same domain
-                candidate_urls = []
-                for link in links:
-                    href = link['href']
-
-                    # Make absolute URL
-                    if href.startswith('/'):
-                        href = f"https://{domain}{href}"
-                    elif href.startswith('http'):
-                        if domain not in href:
-                            continue  # Different domain
-                    else:
-                        continue  # Relative or anchor
-
-                    # Avoid duplicates and fragments
-                    if href not in candidate_urls and '#' not in href:
-                        candidate_urls.append(href)
-
-                # Validate URLs (HEAD request)
-                for url in candidate_urls[:15]:  # Check max 15 candidates
-                    if len(working_urls) >= max_urls:
-                        break
-
-                    try:
-                        head_response = await client.head(
-                            url,
-                            timeout=5.0,
-                            follow_redirects=True
+            if response.status_code != 200:
+                return working_urls
+
+            # Parse HTML for links
+            soup = BeautifulSoup(response.text, 'html.parser')
+            links = soup.find_all('a', href=True)
+
+            # Extract URLs on same domain
+            candidate_urls = []
+            for link in links:
+                href = link['href']
+
+                # Make absolute URL
+                if href.startswith('/'):
+                    href = f"https://{domain}{href}"
+                elif href.startswith('http'):
+                    if domain not in href:
+                        continue  # Different domain
+                else:
+                    continue  # Relative or anchor
+
+                # Avoid duplicates and fragments
+                if href not in candidate_urls and '#' not in href:
+                    candidate_urls.append(href)
+
+            # Validate URLs (HEAD request)
+            for url in candidate_urls[:15]:  # Check max 15 candidates
+                if len(working_urls) >= max_urls:
+                    break
+
+                try:
+                    head_response = await client.head(
+                        url,
+                        timeout=5.0,
+                        follow_redirects=True
+                    )
+
+                    if head_response.status_code < 400:
+                        working_urls.append(url)
+                        logger.debug(
+                            "authority_discovery.deep_url_found",
+                            domain=domain,
+                            url=url
                         )
 
-                        if head_response.status_code < 400:
-                            working_urls.append(url)
-                            logger.debug(
-                                "authority_discovery.deep_url_found",
-                                domain=domain,
-                                url=url
-                            )
-
-                    except:
-                        continue  # Skip invalid URLs
-
-                logger.info(
-                    "authority_discovery.crawl_complete",
-                    domain=domain,
-                    found_urls=len(working_urls)
-                )
+                except:
+                    continue  # Skip invalid URLs
+
+            logger.info(
+                "authority_discovery.crawl_complete",
+                domain=domain,
+                found_urls=len(working_urls)
+            )
 
         except Exception as e:
             logger.warning(
@@ -0,0 +1,114 @@
+"""
+Quest Platform v2.2 - Pipeline Checkpoints
+Persists each completed pipeline stage so a retried job resumes where it failed
+"""
+
+from typing import Any, Dict
+
+import structlog
+
+from app.core.config import settings
+from app.core.payload_codec import decode_payload, encode_payload
+from app.core.redis_client import get_redis_or_none
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "quest:checkpoint:"
+
+
+class CheckpointStore:
+    """
+    Stage results per job, in one Redis hash (field = stage name)
+
+    Checkpoints live as long as a finished job (QUEUE_RETENTION_SECONDS,
+    refreshed on every save) and are cleared once the job completes.
+    Every operation is best-effort: without Redis, jobs simply rerun from
+    the start as before.
+    """
+
+    def __init__(self):
+        self.enabled = settings.PIPELINE_CHECKPOINTS_ENABLED
+        self.ttl = settings.QUEUE_RETENTION_SECONDS
+
+    async def load(self, job_id: str) -> Dict[str, Any]:
+        """
+        Load the completed stages of a job
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Stage name → result (empty for a fresh job)
+        """
+        redis_client = self._redis()
+        if redis_client is None:
+            return {}
+
+        try:
+            raw = await redis_client.hgetall(f"{KEY_PREFIX}{job_id}")
+        except Exception as e:
+            logger.warning("checkpoints.load_failed", job_id=job_id, error=str(e))
+            return {}
+
+        results = {}
+        for stage, blob in raw.items():
+            try:
+                results[stage] = decode_payload(blob)
+            except Exception as e:
+                # A corrupt checkpoint only costs a rerun of that stage
+                logger.warning("checkpoints.decode_failed", job_id=job_id, stage=stage, error=str(e))
+
+        if results:
+            logger.info("checkpoints.loaded", job_id=job_id, stages=sorted(results))
+
+        return results
+
+    async def save(self, job_id: str, stage: str, result: Any):
+        """
+        Persist one completed stage
+
+        Args:
+            job_id: Job ID
+            stage: Stage name
+            result: Stage result (JSON-serializable; Decimals preserved)
+        """
+        redis_client = self._redis()
+        if redis_client is None or result is None:
+            return
+
+        key = f"{KEY_PREFIX}{job_id}"
+
+        try:
+            blob = encode_payload(result)
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, stage, blob)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+
+            logger.debug("checkpoints.saved", job_id=job_id, stage=stage, bytes=len(blob))
+
+        except Exception as e:
+            logger.warning("checkpoints.save_failed", job_id=job_id, stage=stage, error=str(e))
+
+    async def clear(self, job_id: str):
+        """
+        Drop a job's checkpoints (once it has finished)
+
+        Args:
+            job_id: Job ID
+        """
+        redis_client = self._redis()
+        if redis_client is None:
+            return
+
+        try:
+            await redis_client.delete(f"{KEY_PREFIX}{job_id}")
+        except Exception as e:
+            logger.warning("checkpoints.clear_failed", job_id=job_id, error=str(e))
+
+    def _redis(self):
+        return get_redis_or_none() if self.enabled else None
+
+
+# Global checkpoint store
+checkpoint_store = CheckpointStore()
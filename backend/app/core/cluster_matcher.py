@@ -0,0 +1,347 @@
+"""
+Quest Platform v2.2 - Cluster Matcher
+Maps a topic to its topic cluster in one pass over the topic text
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.database import get_db
+
+logger = structlog.get_logger(__name__)
+
+# Keyword weights: a primary keyword is stronger evidence than a secondary one
+PRIMARY_WEIGHT = 1.0
+SECONDARY_WEIGHT = 0.5
+
+# Breaks ties between equally matched clusters
+PRIORITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace (keywords and topics alike)"""
+    return " ".join(text.lower().split())
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring automaton
+
+    Finds every occurrence of every pattern in a text in time linear in the
+    text (plus the number of matches), however many patterns there are.
+    Patterns are matched as-is; callers lowercase both sides.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Any]]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, payload: Any):
+        """
+        Add a pattern (before build())
+
+        Args:
+            pattern: Text to find
+            payload: Returned with every occurrence of the pattern
+        """
+        if self._built:
+            raise RuntimeError("Cannot add patterns after build()")
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+
+        self._out[state].append((pattern, payload))
+
+    def build(self):
+        """Compute failure links (breadth-first over the trie)"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+
+                # Patterns ending at the fallback state also end here
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, Any]]:
+        """
+        Yield (start offset, pattern, payload) for every occurrence in text
+
+        Args:
+            text: Text to scan
+        """
+        if not self._built:
+            self.build()
+
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for pattern, payload in self._out[state]:
+                yield index - len(pattern) + 1, pattern, payload
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+class ClusterMatcher:
+    """
+    Topic → cluster matching over every topic_clusters keyword
+
+    All keywords (primary and secondary) are compiled into one Aho-Corasick
+    automaton held in process, so matching is a single pass over the topic
+    instead of a database round trip and a scan of every cluster. Each
+    matched keyword scores its length × its weight; the cluster with the
+    highest total wins (priority breaks ties), and the match lists the
+    keywords that produced it.
+
+    Clusters come from the topic_clusters table plus built-in fallback
+    definitions (ClusterResearchCache.TOPIC_CLUSTERS). A table row whose
+    slug names a built-in cluster (portugal-digital-nomad ↔
+    portugal_digital_nomad) extends it rather than competing with it, so
+    cluster_research keys stay stable. ResearchGovernance (db_only) only
+    sees the table's own keywords and rows.
+
+    The table is re-read when its row count or newest updated_at changes,
+    checked at most every CLUSTER_MATCHER_REFRESH_SECONDS. Without a
+    database the built-in clusters still match.
+    """
+
+    def __init__(self):
+        self.builtin: Dict[str, Dict] = {}
+        self.clusters: Dict[str, Dict] = {}
+        self.automaton: Optional[AhoCorasick] = None
+        self.signature: Optional[Tuple] = None
+        self.refreshed_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def register_builtin(self, clusters: Dict[str, Dict]):
+        """
+        Register built-in cluster definitions
+
+        Args:
+            clusters: cluster_id → {"keywords", "priority", "research_tier"}
+        """
+        for cluster_id, info in clusters.items():
+            self.builtin[cluster_id] = {
+                "cluster_id": cluster_id,
+                "id": None,
+                "name": cluster_id,
+                "priority": info.get("priority", "medium"),
+                "research_tier": info.get("research_tier", "tavily"),
+                "primary_keywords": list(info.get("keywords", [])),
+                "secondary_keywords": [],
+                "table_keywords": set(),
+            }
+
+        # Rebuild from what is already loaded (the table is merged on refresh)
+        self.signature = None
+        self.refreshed_at = None
+        self._compile(self._merge([]))
+
+    async def match(self, topic: str, db_only: bool = False) -> Optional[Dict]:
+        """
+        Find the best cluster for a topic
+
+        Args:
+            topic: Article topic
+            db_only: Only consider topic_clusters rows and their own keywords
+
+        Returns:
+            {"cluster_id", "id", "name", "priority", "research_tier",
+             "score", "matches": [{"keyword", "kind", "position"}, ...]}
+            or None if no keyword occurs in the topic
+        """
+        await self.refresh()
+        return self.match_loaded(topic, db_only=db_only)
+
+    def match_loaded(self, topic: str, db_only: bool = False) -> Optional[Dict]:
+        """Same as match(), against the clusters loaded so far (no refresh)"""
+        if self.automaton is None:
+            return None
+
+        scores: Dict[str, float] = {}
+        matches: Dict[str, Dict[str, Dict]] = {}
+
+        text = _normalize(topic)
+        for position, keyword, hits in self.automaton.iter_matches(text):
+            for cluster_id, kind, weight, from_table in hits:
+                if db_only and not from_table:
+                    continue
+
+                # Each keyword counts once per cluster, however often it occurs
+                cluster_matches = matches.setdefault(cluster_id, {})
+                if keyword in cluster_matches:
+                    continue
+
+                cluster_matches[keyword] = {"keyword": keyword, "kind": kind, "position": position}
+                scores[cluster_id] = scores.get(cluster_id, 0.0) + len(keyword) * weight
+
+        if not scores:
+            return None
+
+        best = max(
+            scores,
+            key=lambda cluster_id: (
+                scores[cluster_id],
+                PRIORITY_RANK.get(self.clusters[cluster_id]["priority"], 0)
+            )
+        )
+        cluster = self.clusters[best]
+
+        return {
+            "cluster_id": best,
+            "id": cluster["id"],
+            "name": cluster["name"],
+            "priority": cluster["priority"],
+            "research_tier": cluster["research_tier"],
+            "score": round(scores[best], 2),
+            "matches": sorted(matches[best].values(), key=lambda match: match["position"]),
+        }
+
+    async def refresh(self):
+        """Reload topic_clusters if it changed (at most every CLUSTER_MATCHER_REFRESH_SECONDS)"""
+        if (
+            self.refreshed_at is not None
+            and time.monotonic() - self.refreshed_at < settings.CLUSTER_MATCHER_REFRESH_SECONDS
+        ):
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Another job may have refreshed while we waited
+            if (
+                self.refreshed_at is not None
+                and time.monotonic() - self.refreshed_at < settings.CLUSTER_MATCHER_REFRESH_SECONDS
+            ):
+                return
+
+            try:
+                pool = get_db()
+                async with pool.acquire() as conn:
+                    signature = await conn.fetchrow(
+                        "SELECT COUNT(*) AS count, MAX(updated_at) AS updated_at FROM topic_clusters"
+                    )
+                    signature = (signature["count"], signature["updated_at"])
+
+                    if signature != self.signature:
+                        rows = await conn.fetch(
+                            """
+                            SELECT id, name, slug, priority, research_tier,
+                                   primary_keywords, secondary_keywords
+                            FROM topic_clusters
+                            """
+                        )
+                        self._compile(self._merge(rows))
+                        self.signature = signature
+
+                        logger.info(
+                            "cluster_matcher.compiled",
+                            clusters=len(self.clusters),
+                            table_rows=len(rows),
+                            states=len(self.automaton)
+                        )
+
+            except Exception as e:
+                # Keep matching against whatever was loaded last
+                logger.warning("cluster_matcher.refresh_failed", error=str(e))
+
+            self.refreshed_at = time.monotonic()
+
+    def _merge(self, rows: Iterable) -> Dict[str, Dict]:
+        clusters = {
+            cluster_id: {
+                **info,
+                "primary_keywords": list(info["primary_keywords"]),
+                "secondary_keywords": list(info["secondary_keywords"]),
+                "table_keywords": set(),
+            }
+            for cluster_id, info in self.builtin.items()
+        }
+
+        for row in rows:
+            cluster_id = row["slug"]
+            builtin_id = cluster_id.replace("-", "_")
+            primary = list(row["primary_keywords"] or [])
+            secondary = list(row["secondary_keywords"] or [])
+            table_keywords = {_normalize(keyword) for keyword in primary + secondary}
+
+            if builtin_id in clusters:
+                cluster = clusters[builtin_id]
+                cluster["id"] = row["id"]
+                cluster["name"] = row["name"]
+                cluster["primary_keywords"].extend(primary)
+                cluster["secondary_keywords"].extend(secondary)
+                cluster["table_keywords"] |= table_keywords
+                continue
+
+            clusters[cluster_id] = {
+                "cluster_id": cluster_id,
+                "id": row["id"],
+                "name": row["name"],
+                "priority": row["priority"] or "medium",
+                "research_tier": row["research_tier"] or "tavily",
+                "primary_keywords": primary,
+                "secondary_keywords": secondary,
+                "table_keywords": table_keywords,
+            }
+
+        return clusters
+
+    def _compile(self, clusters: Dict[str, Dict]):
+        # One pattern per distinct keyword, carrying every cluster that uses it
+        hits: Dict[str, List[Tuple[str, str, float, bool]]] = {}
+        for cluster_id, cluster in clusters.items():
+            seen = set()
+            for kind, weight, keywords in (
+                ("primary", PRIMARY_WEIGHT, cluster["primary_keywords"]),
+                ("secondary", SECONDARY_WEIGHT, cluster["secondary_keywords"]),
+            ):
+                for keyword in keywords:
+                    keyword = _normalize(keyword)
+                    if keyword and keyword not in seen:
+                        seen.add(keyword)
+                        hits.setdefault(keyword, []).append(
+                            (cluster_id, kind, weight, keyword in cluster["table_keywords"])
+                        )
+
+        automaton = AhoCorasick()
+        for keyword, keyword_hits in hits.items():
+            automaton.add(keyword, keyword_hits)
+        automaton.build()
+
+        self.clusters = clusters
+        self.automaton = automaton
+
+
+# Global cluster matcher (shared by ClusterResearchCache and ResearchGovernance)
+cluster_matcher = ClusterMatcher()
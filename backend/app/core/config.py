@@ -60,6 +60,45 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(..., description="Redis connection URL")
     REDIS_MAX_CONNECTIONS: int = Field(default=50, description="Redis max connections")
 
+    # ========================================================================
+    # OUTBOUND HTTP (research providers, link checks)
+    # ========================================================================
+    HTTP2_ENABLED: bool = Field(
+        default=True, description="Use HTTP/2 for API hosts that support it (needs h2)"
+    )
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = Field(
+        default=20, description="Max open connections per API host"
+    )
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = Field(
+        default=10, description="Max idle keep-alive connections per API host"
+    )
+    HTTP_DEFAULT_MAX_CONNECTIONS: int = Field(
+        default=100, description="Max connections in the shared pool for arbitrary hosts"
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=60.0, description="Seconds an idle connection is kept open"
+    )
+    HTTP_CONNECT_TIMEOUT: float = Field(
+        default=10.0, description="Connect timeout for outbound requests (seconds)"
+    )
+
+    # Provider resilience (retries, circuit breaker)
+    PROVIDER_MAX_ATTEMPTS: int = Field(
+        default=3, description="Attempts per provider call, including the first"
+    )
+    PROVIDER_RETRY_BASE_DELAY: float = Field(
+        default=1.0, description="Base delay for jittered exponential backoff (seconds)"
+    )
+    PROVIDER_RETRY_MAX_DELAY: float = Field(
+        default=30.0, description="Cap on a single backoff delay (seconds)"
+    )
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5, description="Consecutive failed calls before a provider's circuit opens"
+    )
+    CIRCUIT_COOLDOWN_SECONDS: float = Field(
+        default=60.0, description="Seconds an open circuit fails fast before a trial call"
+    )
+
     # ========================================================================
     # AI API KEYS
     # ========================================================================
@@ -84,6 +123,13 @@ class Settings(BaseSettings):
     GEMINI_MODEL: str = Field(
         default="gemini-2.5-pro", description="Gemini model for chunk generation - 2.5 Pro recommended"
     )
+    GEMINI_MAX_CONCURRENCY: int = Field(
+        default=0,
+        description="Threads for blocking Gemini SDK calls per process (0 = QUEUE_CONCURRENCY x 5 parallel chunks)"
+    )
+    GEMINI_REQUEST_TIMEOUT_SECONDS: float = Field(
+        default=180.0, description="Gemini request timeout, counted from when a thread starts the call"
+    )
 
     REPLICATE_API_KEY: str = Field(..., description="Replicate API key")
     REPLICATE_MODEL: str = Field(
@@ -121,6 +167,12 @@ class Settings(BaseSettings):
     PER_JOB_COST_CAP: Decimal = Field(
         default=Decimal("1.50"), description="Per-job cost cap in USD (raised for cluster-building articles with full research)"
     )
+    CLUSTER_REFRESH_DAILY_BUDGET: Decimal = Field(
+        default=Decimal("5.00"), description="Daily spend cap in USD for background cluster research refreshes"
+    )
+    CLUSTER_REFRESH_COST_RESERVATION: Decimal = Field(
+        default=Decimal("0.50"), description="Spend reserved against the refresh budget before each refresh (settled to the actual cost after)"
+    )
     ENABLE_COST_CIRCUIT_BREAKER: bool = Field(
         default=True, description="Enable cost circuit breaker"
     )
@@ -129,6 +181,9 @@ class Settings(BaseSettings):
     # QUEUE CONFIGURATION
     # ========================================================================
     QUEUE_NAME: str = Field(default="quest-articles", description="BullMQ queue name")
+    QUEUE_ENGINE: str = Field(
+        default="zset", description="Queue engine: 'zset' (sorted sets) or 'streams' (consumer groups)"
+    )
     QUEUE_CONCURRENCY: int = Field(default=5, description="Worker concurrency")
     QUEUE_MAX_JOBS_PER_MINUTE: int = Field(
         default=10, description="Max jobs per minute"
@@ -137,6 +192,46 @@ class Settings(BaseSettings):
     QUEUE_RETRY_BACKOFF_MS: int = Field(
         default=2000, description="Retry backoff in ms"
     )
+    QUEUE_VISIBILITY_TIMEOUT: int = Field(
+        default=300, description="Job lease (visibility timeout) in seconds"
+    )
+    WORKER_UNRESPONSIVE_SECONDS: int = Field(
+        default=300,
+        description="Restart a worker process whose event loop has not heartbeated this long; "
+        "its in-flight jobs are abandoned and count as stalls, so keep it at or above QUEUE_VISIBILITY_TIMEOUT"
+    )
+    WORKER_KILL_GRACE_SECONDS: int = Field(
+        default=10, description="Seconds between SIGTERM and SIGKILL for an unresponsive worker process"
+    )
+    QUEUE_BLOCK_TIMEOUT: int = Field(
+        default=10, description="Max seconds an idle worker blocks waiting for a job"
+    )
+    QUEUE_MAX_STALLS: int = Field(
+        default=2, description="Times a job may stall (lease expires) before it is failed"
+    )
+    QUEUE_KEEP_COMPLETED: int = Field(
+        default=1000, description="Max completed jobs kept in the completion index"
+    )
+    QUEUE_KEEP_FAILED: int = Field(
+        default=5000, description="Max failed jobs kept in the failure index"
+    )
+    QUEUE_RETENTION_SECONDS: int = Field(
+        default=86400, description="Max age of finished jobs (index entries and hashes)"
+    )
+    QUEUE_IDEMPOTENCY_WINDOW: int = Field(
+        default=3600,
+        description="Seconds a repeat submission of the same topic returns the existing job (0 = off)"
+    )
+    PIPELINE_CHECKPOINTS_ENABLED: bool = Field(
+        default=True, description="Checkpoint pipeline stages so retried jobs resume where they failed"
+    )
+    WORKER_PROCESSES: int = Field(
+        default=2,
+        description="Worker processes per supervisor, each with its own DB pool (0 = one per usable CPU, cgroup quota aware)"
+    )
+    WORKER_DRAIN_TIMEOUT: int = Field(
+        default=180, description="Seconds a worker waits for in-flight jobs on shutdown"
+    )
 
     # ========================================================================
     # CACHE CONFIGURATION
@@ -150,6 +245,73 @@ class Settings(BaseSettings):
     RESEARCH_CACHE_TTL_DAYS: int = Field(
         default=30, description="Cache TTL in days"
     )
+    TOPIC_INDEX_REFRESH_SECONDS: int = Field(
+        default=60, description="How often the completed-topic index picks up articles from other processes"
+    )
+    CLUSTER_MATCHER_REFRESH_SECONDS: int = Field(
+        default=60, description="How often the cluster matcher checks topic_clusters for changes"
+    )
+    REUSE_COUNTER_FLUSH_SECONDS: int = Field(
+        default=30, description="How often cluster research cache hits are written to reuse_count"
+    )
+    CLUSTER_CACHE_MEMORY_MB: int = Field(
+        default=64, description="In-process cache of cluster research payloads (per process)"
+    )
+    CLUSTER_CACHE_MEMORY_TTL_SECONDS: int = Field(
+        default=300, description="How long a process keeps a cluster research payload (bounds staleness across processes)"
+    )
+    CLUSTER_CACHE_REDIS_TTL_SECONDS: int = Field(
+        default=3600, description="How long Redis keeps a compressed cluster research payload"
+    )
+    CLUSTER_RESEARCH_STALE_GRACE_DAYS: int = Field(
+        default=14, description="Keep serving cluster research this long past expiry while it is refreshed"
+    )
+    CLUSTER_REFRESH_ENABLED: bool = Field(
+        default=True, description="Refresh expiring or stale cluster research in the background"
+    )
+    CLUSTER_REFRESH_AHEAD_DAYS: int = Field(
+        default=7, description="Refresh cluster research this long before it expires"
+    )
+    CLUSTER_REFRESH_INTERVAL_SECONDS: int = Field(
+        default=900, description="How often workers look for cluster research due a refresh"
+    )
+    CLUSTER_REFRESH_BATCH_SIZE: int = Field(
+        default=10, description="Most-reused clusters refreshed per sweep"
+    )
+    CLUSTER_REFRESH_MAX_CONCURRENCY: int = Field(
+        default=2, description="Background cluster refreshes at once (per process)"
+    )
+    CLUSTER_REFRESH_FAILURE_COOLDOWN_SECONDS: int = Field(
+        default=21600, description="Wait this long before retrying a cluster whose refresh failed or was insufficient"
+    )
+    RESEARCH_BLOB_STORAGE_ENABLED: bool = Field(
+        default=True, description="Store research payloads as compressed, deduplicated blobs (research_blobs)"
+    )
+    RESEARCH_BLOB_COMPRESSION_LEVEL: int = Field(
+        default=9, description="zstd level for research blobs (capped at 9 when falling back to zlib)"
+    )
+    RESEARCH_DEADLINE_SECONDS: int = Field(
+        default=120, description="Multi-API research combines whatever has arrived by then (0 = wait for all)"
+    )
+    PROVIDER_CACHE_ENABLED: bool = Field(
+        default=True, description="Cache individual research provider responses"
+    )
+    PROVIDER_CACHE_MAX_ENTRIES: int = Field(
+        default=512, description="In-process LRU size for provider responses (per process)"
+    )
+    SCRAPE_MAX_CONCURRENCY: int = Field(
+        default=5, description="Competitor pages scraped at once (per process)"
+    )
+    SCRAPE_PER_DOMAIN_CONCURRENCY: int = Field(
+        default=2, description="Pages scraped at once from the same domain"
+    )
+    SCRAPE_CACHE_TTL_HOURS: int = Field(
+        default=72, description="Reuse scraped_competitors content this recent (0 = off)"
+    )
+    SINGLE_FLIGHT_LOCK_TTL: int = Field(
+        default=60,
+        description="Minimum seconds other processes wait on an identical in-flight provider call (raised to the provider's total deadline)"
+    )
 
     # ========================================================================
     # CORS
@@ -0,0 +1,136 @@
+"""
+Quest Platform v2.2 - Gemini Executor
+Runs the synchronous Gemini SDK calls off the event loop
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Most Gemini calls one job makes at once (up to 5 chunks generated in parallel)
+CALLS_PER_JOB = 5
+
+# How long past its request timeout a call may run before it is given up on
+ABANDON_GRACE_SECONDS = 30.0
+
+# Global executor (created lazily, one per process)
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Free executor threads; a call holds one until its thread returns
+_slots: Optional[asyncio.Semaphore] = None
+
+
+class GeminiCallAbandoned(Exception):
+    """
+    Raised when a Gemini call outlives its request timeout
+
+    Its thread cannot be interrupted and may still be billing, so this is
+    deliberately not a retryable error.
+    """
+
+
+def gemini_pool_size() -> int:
+    """Threads in the Gemini pool (GEMINI_MAX_CONCURRENCY, else the worker's fan-out)"""
+    return settings.GEMINI_MAX_CONCURRENCY or settings.QUEUE_CONCURRENCY * CALLS_PER_JOB
+
+
+def get_gemini_executor() -> ThreadPoolExecutor:
+    """
+    Get the dedicated thread pool for Gemini calls
+
+    Kept separate from the loop's default executor so long generations
+    cannot starve other to_thread/run_in_executor users.
+    """
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=gemini_pool_size(),
+            thread_name_prefix="gemini",
+        )
+        logger.debug("quest.gemini.executor_created", max_workers=gemini_pool_size())
+
+    return _executor
+
+
+async def run_gemini(
+    func: Callable[..., Any],
+    *args,
+    timeout: Optional[float] = None,
+    **kwargs
+) -> Any:
+    """
+    Await a blocking Gemini SDK call without blocking the event loop
+
+    Both SDKs in use (google-generativeai GenerativeModel.generate_content
+    and google-genai Client.models.generate_content) are synchronous, so
+    a 10-60s generation would otherwise freeze every other coroutine on the
+    worker, including the other chunks of an asyncio.gather.
+
+    A call first waits for a free thread, so it never sits in the pool's
+    queue, and its timeout only starts once a thread has picked it up.
+    Callers should also pass the SDK's own request timeout
+    (GEMINI_REQUEST_TIMEOUT_SECONDS), which actually ends the request;
+    the timeout here is a backstop for calls that ignore it. If the caller
+    is cancelled the thread runs on, keeping its slot until it returns.
+
+    Args:
+        func: Synchronous SDK method
+        *args, **kwargs: Passed to func
+        timeout: Request timeout (default GEMINI_REQUEST_TIMEOUT_SECONDS)
+
+    Returns:
+        func's result
+
+    Raises:
+        GeminiCallAbandoned: If the call runs ABANDON_GRACE_SECONDS past
+            its timeout
+    """
+    global _slots
+
+    if _slots is None:
+        _slots = asyncio.Semaphore(gemini_pool_size())
+    slots = _slots
+    timeout = timeout or settings.GEMINI_REQUEST_TIMEOUT_SECONDS
+
+    # Waiting for a thread is not part of the call's timeout
+    await slots.acquire()
+    try:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            get_gemini_executor(),
+            functools.partial(func, *args, **kwargs)
+        )
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout + ABANDON_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        logger.error("quest.gemini.call_abandoned", timeout=timeout)
+        raise GeminiCallAbandoned(f"Gemini call still running {timeout + ABANDON_GRACE_SECONDS:.0f}s after it started")
+
+
+def close_gemini_executor():
+    """
+    Shut down the Gemini thread pool
+
+    Queued calls are cancelled; calls already running finish in the
+    background (the SDK offers no way to interrupt them).
+    """
+    global _executor, _slots
+
+    _slots = None
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        logger.info("quest.gemini.executor_closed")
@@ -0,0 +1,128 @@
+"""
+Quest Platform v2.2 - Shared HTTP Clients
+Process-wide pooled httpx clients for research providers and link checks
+"""
+
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# API hosts that negotiate HTTP/2 (multiplexed on one warm connection)
+HTTP2_HOSTS = {
+    "api.perplexity.ai",
+    "api.tavily.com",
+    "api.firecrawl.dev",
+    "google.serper.dev",
+    "api.linkup.so",
+}
+
+# Shared client for arbitrary hosts (link validation, crawling)
+DEFAULT_POOL = "default"
+
+# Global client registry, keyed by origin (scheme://host[:port])
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _origin(url: str) -> str:
+    """scheme://host[:port] of a URL"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _build_client(pool: str) -> httpx.AsyncClient:
+    """Create a pooled client for one origin (or the shared default pool)"""
+    if pool == DEFAULT_POOL:
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_DEFAULT_MAX_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        http2 = False
+    else:
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        http2 = (
+            settings.HTTP2_ENABLED
+            and HTTP2_AVAILABLE
+            and urlsplit(pool).hostname in HTTP2_HOSTS
+        )
+
+    logger.debug("quest.http.client_created", pool=pool, http2=http2)
+
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        timeout=httpx.Timeout(30.0, connect=settings.HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def get_http_client(url: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    Get the pooled client for an API host
+
+    Clients are created lazily and kept for the life of the process, so
+    calls reuse warm keep-alive connections instead of paying a TCP+TLS
+    handshake each time. Per-request timeouts still apply as usual.
+
+    Args:
+        url: Any URL on the API host; None for the shared client used for
+            arbitrary hosts (link validation, crawling)
+
+    Returns:
+        httpx.AsyncClient (do not close it; close_http_clients does)
+    """
+    pool = _origin(url) if url else DEFAULT_POOL
+    client = _clients.get(pool)
+
+    if client is None or client.is_closed:
+        client = _clients[pool] = _build_client(pool)
+
+    return client
+
+
+async def init_http_clients():
+    """
+    Warm the registry on startup
+
+    Creates the shared client eagerly; per-host clients are still created
+    on first use.
+    """
+    get_http_client()
+    logger.info(
+        "quest.http.initialized",
+        http2=settings.HTTP2_ENABLED and HTTP2_AVAILABLE,
+        max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+    )
+
+
+async def close_http_clients():
+    """
+    Close every pooled client
+    """
+    clients = list(_clients.values())
+    _clients.clear()
+
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("quest.http.close_failed", error=str(e))
+
+    if clients:
+        logger.info("quest.http.closed", clients=len(clients))
@@ -5,9 +5,9 @@ Validates internal and external links before content generation
 
 import asyncio
 from typing import Dict, List, Optional
-import httpx
 import structlog
 from app.core.database import get_db
+from app.core.http_client import get_http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -72,121 +72,121 @@ class LinkValidator:
         Returns:
             Dict with validation result including method used
         """
-        async with httpx.AsyncClient() as client:
-            # Attempt 1: HEAD request (fast)
-            try:
-                response = await client.head(
-                    url,
-                    timeout=10.0,  # Increased from 5s → 10s for slow .gov sites
-                    follow_redirects=True
-                )
+        client = get_http_client()
+        # Attempt 1: HEAD request (fast)
+        try:
+            response = await client.head(
+                url,
+                timeout=10.0,  # Increased from 5s → 10s for slow .gov sites
+                follow_redirects=True
+            )
 
-                if response.status_code < 400:
-                    logger.debug(
-                        "link_validator.head_success",
-                        url=url,
-                        status=response.status_code
-                    )
-                    return {
-                        'url': url,
-                        'valid': True,
-                        'status_code': response.status_code,
-                        'final_url': str(response.url) if response.url != url else url,
-                        'method': 'HEAD'
-                    }
-            except Exception as e:
+            if response.status_code < 400:
                 logger.debug(
-                    "link_validator.head_failed",
+                    "link_validator.head_success",
                     url=url,
-                    error=str(e),
-                    message="Trying GET fallback"
+                    status=response.status_code
                 )
+                return {
+                    'url': url,
+                    'valid': True,
+                    'status_code': response.status_code,
+                    'final_url': str(response.url) if response.url != url else url,
+                    'method': 'HEAD'
+                }
+        except Exception as e:
+            logger.debug(
+                "link_validator.head_failed",
+                url=url,
+                error=str(e),
+                message="Trying GET fallback"
+            )
 
-            # Attempt 2: GET request (fallback for servers that block HEAD)
-            try:
-                response = await client.get(
-                    url,
-                    timeout=10.0,
-                    follow_redirects=True
-                )
-
-                if response.status_code < 400:
-                    logger.info(
-                        "link_validator.get_success",
-                        url=url,
-                        status=response.status_code,
-                        note="HEAD failed but GET succeeded"
-                    )
-                    return {
-                        'url': url,
-                        'valid': True,
-                        'status_code': response.status_code,
-                        'final_url': str(response.url) if response.url != url else url,
-                        'method': 'GET'
-                    }
-                elif response.status_code == 404:
-                    # Attempt 3: Check archive.org (last resort for 404s)
-                    logger.info(
-                        "link_validator.404_detected",
-                        url=url,
-                        message="Checking archive.org"
-                    )
-
-                    archive_url = f"https://web.archive.org/web/{url}"
-                    try:
-                        archive_response = await client.head(
-                            archive_url,
-                            timeout=10.0,
-                            follow_redirects=True
-                        )
-
-                        if archive_response.status_code < 400:
-                            logger.info(
-                                "link_validator.archive_found",
-                                original_url=url,
-                                archive_url=archive_url,
-                                note="Using archived version"
-                            )
-                            return {
-                                'url': archive_url,
-                                'valid': True,
-                                'status_code': 200,
-                                'final_url': archive_url,
-                                'method': 'ARCHIVE',
-                                'note': 'Original URL returned 404, using archived version'
-                            }
-                    except Exception as archive_error:
-                        logger.debug(
-                            "link_validator.archive_failed",
-                            url=url,
-                            error=str(archive_error)
-                        )
+        # Attempt 2: GET request (fallback for servers that block HEAD)
+        try:
+            response = await client.get(
+                url,
+                timeout=10.0,
+                follow_redirects=True
+            )
 
-                # If we get here, URL is invalid
-                logger.warning(
-                    "link_validator.url_invalid",
+            if response.status_code < 400:
+                logger.info(
+                    "link_validator.get_success",
                     url=url,
-                    status_code=response.status_code
+                    status=response.status_code,
+                    note="HEAD failed but GET succeeded"
                 )
                 return {
                     'url': url,
-                    'valid': False,
+                    'valid': True,
                     'status_code': response.status_code,
+                    'final_url': str(response.url) if response.url != url else url,
                     'method': 'GET'
                 }
-
-            except Exception as e:
-                logger.warning(
-                    "link_validator.all_methods_failed",
+            elif response.status_code == 404:
+                # Attempt 3: Check archive.org (last resort for 404s)
+                logger.info(
+                    "link_validator.404_detected",
                     url=url,
-                    error=str(e)
+                    message="Checking archive.org"
                 )
-                return {
-                    'url': url,
-                    'valid': False,
-                    'error': str(e),
-                    'method': 'ALL_FAILED'
-                }
+
+                archive_url = f"https://web.archive.org/web/{url}"
+                try:
+                    archive_response = await client.head(
+                        archive_url,
+                        timeout=10.0,
+                        follow_redirects=True
+                    )
+
+                    if archive_response.status_code < 400:
+                        logger.info(
+                            "link_validator.archive_found",
+                            original_url=url,
+                            archive_url=archive_url,
+                            note="Using archived version"
+                        )
+                        return {
+                            'url': archive_url,
+                            'valid': True,
+                            'status_code': 200,
+                            'final_url': archive_url,
+                            'method': 'ARCHIVE',
+                            'note': 'Original URL returned 404, using archived version'
+                        }
+                except Exception as archive_error:
+                    logger.debug(
+                        "link_validator.archive_failed",
+                        url=url,
+                        error=str(archive_error)
+                    )
+
+            # If we get here, URL is invalid
+            logger.warning(
+                "link_validator.url_invalid",
+                url=url,
+                status_code=response.status_code
+            )
+            return {
+                'url': url,
+                'valid': False,
+                'status_code': response.status_code,
+                'method': 'GET'
+            }
+
+        except Exception as e:
+            logger.warning(
+                "link_validator.all_methods_failed",
+                url=url,
+                error=str(e)
+            )
+            return {
+                'url': url,
+                'valid': False,
+                'error': str(e),
+                'method': 'ALL_FAILED'
+            }
 
     async def validate_external_urls(self, urls: List[str]) -> List[Dict]:
         """
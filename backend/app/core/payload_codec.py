@@ -0,0 +1,56 @@
+"""
+Quest Platform v2.2 - Payload Codec
+Compact text encoding of JSON payloads kept in Redis
+"""
+
+import base64
+import json
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+
+def dump_json(value: Any, sort_keys: bool = False) -> str:
+    """JSON that round-trips Decimal and datetime (see load_json)"""
+    return json.dumps(value, default=_json_default, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def load_json(raw: str) -> Any:
+    return json.loads(raw, object_hook=_json_object_hook)
+
+
+def pack_json(raw: str) -> str:
+    """zlib → base64 (the shared Redis client decodes responses as text)"""
+    return base64.b64encode(zlib.compress(raw.encode(), 6)).decode()
+
+
+def unpack_json(blob: str) -> str:
+    return zlib.decompress(base64.b64decode(blob)).decode()
+
+
+def encode_payload(value: Any) -> str:
+    """JSON → zlib → base64"""
+    return pack_json(dump_json(value))
+
+
+def decode_payload(blob: str) -> Any:
+    return load_json(unpack_json(blob))
+
+
+def _json_default(value: Any) -> Any:
+    # Costs must come back as Decimal for the cost breakdown
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    return str(value)
+
+
+def _json_object_hook(obj: Dict) -> Any:
+    if len(obj) == 1:
+        if "__decimal__" in obj:
+            return Decimal(obj["__decimal__"])
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+    return obj
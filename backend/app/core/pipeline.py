@@ -0,0 +1,234 @@
+"""
+Quest Platform v2.2 - Stage Scheduler
+Runs a pipeline declared as a dependency graph of stages with maximum overlap
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class Stage:
+    """
+    One step of a pipeline
+
+    Args:
+        name: Unique stage name (also the key of its result)
+        run: Coroutine function taking the results of completed stages
+        after: Names of stages that must complete first
+        timeout: Seconds before the stage is abandoned (None = no limit)
+        progress: Job progress (0-100) to report when the stage starts
+        cost_key: Key in the cost breakdown that result["cost"] is added to
+        required: If False, a failure or timeout is logged and the stage's
+            result is None instead of failing the pipeline
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[Dict[str, Any]], Awaitable[Any]],
+        after: Iterable[str] = (),
+        timeout: Optional[float] = None,
+        progress: Optional[int] = None,
+        cost_key: Optional[str] = None,
+        required: bool = True
+    ):
+        self.name = name
+        self.run = run
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.progress = progress
+        self.cost_key = cost_key
+        self.required = required
+
+
+class StageScheduler:
+    """
+    Start every stage as soon as the stages it depends on have completed
+
+    Independent stages run concurrently, so the pipeline takes as long as
+    its critical path rather than the sum of its stages. If a required
+    stage fails, the stages still running are cancelled and the error is
+    raised.
+
+    Results accumulate across run() calls, so a pipeline can be run in
+    phases (e.g. stop after scoring if the article is rejected).
+
+    Args:
+        costs: Cost breakdown to add each stage's cost to
+        on_progress: Called with a stage when it starts and moves job
+            progress forward
+        on_complete: Called with a stage and its result when it succeeds
+            (e.g. to checkpoint it)
+        job_id: For logging
+    """
+
+    def __init__(
+        self,
+        costs: Dict[str, Decimal],
+        on_progress: Optional[Callable[[Stage], Awaitable[None]]] = None,
+        on_complete: Optional[Callable[[Stage, Any], Awaitable[None]]] = None,
+        job_id: Optional[str] = None
+    ):
+        self.costs = costs
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self.job_id = job_id
+        self.results: Dict[str, Any] = {}
+        self.restored: Dict[str, Any] = {}
+        self.durations: Dict[str, float] = {}
+        self.progress = 0
+
+    def restore(self, results: Dict[str, Any]):
+        """
+        Seed results from an earlier attempt
+
+        Restored stages are skipped by run(); their cost is still added to
+        the breakdown, since the article did pay for them.
+
+        Args:
+            results: Stage name → result
+        """
+        self.restored.update(results)
+        self.results.update(results)
+
+    async def run(self, stages: List[Stage]) -> Dict[str, Any]:
+        """
+        Run stages in dependency order with maximum overlap
+
+        Stages whose result is already present are skipped.
+
+        Args:
+            stages: Stages to run
+
+        Returns:
+            Results of all completed stages, keyed by stage name
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+            Exception: The first required stage failure
+        """
+        known = set(self.results) | {stage.name for stage in stages}
+        for stage in stages:
+            missing = [dep for dep in stage.after if dep not in known]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {missing}")
+
+        for stage in stages:
+            if stage.name in self.restored:
+                cost = self._record_cost(stage, self.restored.pop(stage.name))
+                logger.info(
+                    "pipeline.stage_restored",
+                    job_id=self.job_id,
+                    stage=stage.name,
+                    cost=float(cost)
+                )
+
+        pending = {stage.name: stage for stage in stages if stage.name not in self.results}
+        running: Dict[asyncio.Task, Stage] = {}
+        started = time.monotonic()
+
+        try:
+            while pending or running:
+                ready = [
+                    stage for stage in pending.values()
+                    if all(dep in self.results for dep in stage.after)
+                ]
+                for stage in ready:
+                    del pending[stage.name]
+                    await self._report_progress(stage)
+                    running[asyncio.create_task(self._run_stage(stage))] = stage
+
+                if not running:
+                    raise ValueError(f"Stage dependencies cannot be satisfied: {sorted(pending)}")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    stage = running.pop(task)
+                    self.results[stage.name] = task.result()
+        finally:
+            # A failed stage (or our own cancellation) abandons the rest
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        logger.info(
+            "pipeline.phase_complete",
+            job_id=self.job_id,
+            stages=[stage.name for stage in stages],
+            wall_seconds=round(time.monotonic() - started, 1),
+            stage_seconds=round(sum(self.durations.get(stage.name, 0.0) for stage in stages), 1)
+        )
+
+        return self.results
+
+    async def _run_stage(self, stage: Stage) -> Any:
+        started = time.monotonic()
+
+        try:
+            if stage.timeout is None:
+                result = await stage.run(self.results)
+            else:
+                try:
+                    result = await asyncio.wait_for(stage.run(self.results), timeout=stage.timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"Stage {stage.name} timed out after {stage.timeout:.0f}s")
+
+        except Exception as e:
+            self.durations[stage.name] = time.monotonic() - started
+
+            if stage.required:
+                logger.error(
+                    "pipeline.stage_failed",
+                    job_id=self.job_id,
+                    stage=stage.name,
+                    error=str(e) or type(e).__name__
+                )
+                raise
+
+            logger.warning(
+                "pipeline.optional_stage_failed",
+                job_id=self.job_id,
+                stage=stage.name,
+                error=str(e) or type(e).__name__,
+                message="Continuing without this stage"
+            )
+            return None
+
+        self.durations[stage.name] = time.monotonic() - started
+        cost = self._record_cost(stage, result)
+
+        if self.on_complete is not None:
+            await self.on_complete(stage, result)
+
+        logger.info(
+            "pipeline.stage_complete",
+            job_id=self.job_id,
+            stage=stage.name,
+            duration_seconds=round(self.durations[stage.name], 1),
+            cost=float(cost)
+        )
+
+        return result
+
+    def _record_cost(self, stage: Stage, result: Any) -> Decimal:
+        if stage.cost_key is None or not isinstance(result, dict):
+            return Decimal("0.00")
+
+        cost = result.get("cost") or Decimal("0.00")
+        self.costs[stage.cost_key] = self.costs.get(stage.cost_key, Decimal("0.00")) + cost
+        return cost
+
+    async def _report_progress(self, stage: Stage):
+        if self.on_progress is None or stage.progress is None or stage.progress <= self.progress:
+            return
+
+        self.progress = stage.progress
+        await self.on_progress(stage)
@@ -0,0 +1,218 @@
+"""
+Provider Response Cache
+
+Content-addressed cache for individual research provider calls. Entries are
+keyed on (provider, normalized request, params), so retried jobs and related
+topics in the same batch reuse a paid response instead of repeating it.
+
+Tiers:
+- In-process LRU (per worker process, checked first)
+- Redis (shared across processes, TTL per provider)
+
+Complements the topic-level caches (ClusterResearchCache, the article_research
+embedding cache), which only hit when a whole topic matches.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import structlog
+
+from app.core.config import settings
+from app.core.redis_client import get_redis_or_none
+
+logger = structlog.get_logger()
+
+# Seconds a provider response stays fresh. SERP and search results drift
+# within a day; scraped page content changes more slowly.
+PROVIDER_CACHE_TTLS = {
+    "perplexity": 6 * 3600,
+    "tavily": 6 * 3600,
+    "linkup": 6 * 3600,
+    "serper": 12 * 3600,
+    "dataforseo_serp": 12 * 3600,
+    "firecrawl": 24 * 3600,
+}
+
+KEY_PREFIX = "quest:provider_cache:"
+STATS_KEY = "quest:provider_cache:stats"
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return " ".join(query.lower().split())
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host and drop the fragment, keep path and query"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+class ProviderResponseCache:
+    """
+    Two-tier (LRU + Redis) cache of provider responses
+
+    Cached responses come back with cost 0 and cached=True, so cost
+    accounting reflects that no paid call was made.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.PROVIDER_CACHE_MAX_ENTRIES
+        self.enabled = settings.PROVIDER_CACHE_ENABLED
+        self._lru: "OrderedDict[str, tuple]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def make_key(self, provider: str, request: Dict[str, Any]) -> str:
+        """
+        Content address of a provider call
+
+        Args:
+            provider: Provider name (see PROVIDER_CACHE_TTLS)
+            request: Normalized request and every param that changes the result
+
+        Returns:
+            Redis key for the response
+        """
+        canonical = json.dumps(
+            {"provider": provider, "request": request},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return f"{KEY_PREFIX}{provider}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    async def get(self, provider: str, request: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Look up a cached provider response
+
+        Args:
+            provider: Provider name
+            request: Same request dict the response was stored under
+
+        Returns:
+            Response dict (cost 0, cached=True) or None on miss
+        """
+        if not self.enabled or provider not in PROVIDER_CACHE_TTLS:
+            return None
+
+        key = self.make_key(provider, request)
+
+        # Tier 1: in-process LRU
+        entry = self._lru.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._lru.move_to_end(key)
+                await self._count(provider, "hits")
+                logger.debug("provider_cache.hit", provider=provider, tier="memory")
+                return self._as_cached(value)
+            del self._lru[key]
+
+        # Tier 2: Redis
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.ttl(key)
+                    raw, ttl = await pipe.execute()
+
+                if raw:
+                    value = json.loads(raw)
+                    self._remember(key, value, ttl if ttl and ttl > 0 else PROVIDER_CACHE_TTLS[provider])
+                    await self._count(provider, "hits")
+                    logger.debug("provider_cache.hit", provider=provider, tier="redis")
+                    return self._as_cached(value)
+
+            except Exception as e:
+                logger.warning("provider_cache.get_failed", provider=provider, error=str(e))
+
+        await self._count(provider, "misses")
+        return None
+
+    async def set(self, provider: str, request: Dict[str, Any], response: Dict):
+        """
+        Store a successful provider response
+
+        Args:
+            provider: Provider name
+            request: Normalized request dict (same as passed to get)
+            response: Provider response (responses without content are not cached)
+        """
+        if not self.enabled or not response.get("content") or provider not in PROVIDER_CACHE_TTLS:
+            return
+
+        key = self.make_key(provider, request)
+        ttl = PROVIDER_CACHE_TTLS[provider]
+        value = {k: v for k, v in response.items() if k not in ("cost", "cached")}
+
+        self._remember(key, value, ttl)
+
+        redis_client = get_redis_or_none()
+        if redis_client is None:
+            return
+
+        try:
+            await redis_client.set(key, json.dumps(value, default=str), ex=ttl)
+            logger.debug("provider_cache.stored", provider=provider, ttl=ttl)
+        except Exception as e:
+            logger.warning("provider_cache.set_failed", provider=provider, error=str(e))
+
+    async def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Hit/miss counters per provider
+
+        Uses the shared Redis counters (all processes) when available,
+        otherwise this process's counters.
+        """
+        counters = {provider: dict(values) for provider, values in self.stats.items()}
+
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                raw = await redis_client.hgetall(STATS_KEY)
+                counters = {}
+                for field, count in raw.items():
+                    provider, counter = field.rsplit(":", 1)
+                    counters.setdefault(provider, {})[counter] = int(count)
+            except Exception as e:
+                logger.warning("provider_cache.stats_failed", error=str(e))
+
+        for values in counters.values():
+            lookups = values.get("hits", 0) + values.get("misses", 0)
+            values["hit_rate"] = round(values.get("hits", 0) / lookups, 3) if lookups else 0.0
+
+        return counters
+
+    def _remember(self, key: str, value: Dict, ttl: int):
+        self._lru[key] = (time.time() + ttl, value)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    async def _count(self, provider: str, counter: str):
+        provider_stats = self.stats.setdefault(provider, {"hits": 0, "misses": 0})
+        provider_stats[counter] += 1
+
+        redis_client = get_redis_or_none()
+        if redis_client is None:
+            return
+
+        try:
+            await redis_client.hincrby(STATS_KEY, f"{provider}:{counter}", 1)
+        except Exception:
+            pass  # Counters are best-effort
+
+    @staticmethod
+    def _as_cached(value: Dict) -> Dict:
+        return {**value, "cost": Decimal("0"), "cached": True}
+
+
+# Global cache instance
+provider_cache = ProviderResponseCache()
@@ -3,9 +3,10 @@ Redis Queue Implementation (BullMQ-compatible pattern)
 Handles job queueing and processing for article generation
 """
 import asyncio
+import hashlib
 import json
 import time
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from uuid import uuid4
 from enum import Enum
 
@@ -13,6 +14,7 @@ import redis.asyncio as redis
 import structlog
 
 from app.core.config import settings
+from app.core.research_queue import normalize_topic
 
 logger = structlog.get_logger()
 
@@ -26,6 +28,288 @@ class JobStatus(Enum):
     RETRY = "retry"
 
 
+# ----------------------------------------------------------------------------
+# Server-side scripts
+# Each state transition runs as a single Lua script so a worker crash can never
+# leave a job half-moved between sets (e.g. popped from :waiting but not yet
+# recorded in :processing).
+# ----------------------------------------------------------------------------
+
+# Shared helper: index a finished job in a time-ordered ZSET, expire its hash
+# after the retention window and evict the oldest entries beyond max_count.
+RECORD_FINISHED_LUA = """
+local function record_finished(index_key, prefix, job_id, now, max_count, retention)
+    redis.call('ZADD', index_key, now, job_id)
+    redis.call('EXPIRE', prefix .. job_id, retention)
+
+    local overflow = redis.call('ZCARD', index_key) - max_count
+    if overflow > 0 then
+        local evicted = redis.call('ZRANGE', index_key, 0, overflow - 1)
+        for _, evicted_id in ipairs(evicted) do
+            redis.call('DEL', prefix .. evicted_id)
+        end
+        redis.call('ZREMRANGEBYRANK', index_key, 0, overflow - 1)
+    end
+end
+"""
+
+# Every claim issues a lease token (the job hash's 'lease' field). Complete,
+# fail and heartbeat only act for the caller holding the current token, so a
+# worker whose job was reaped and handed to another worker cannot finish,
+# fail or keep alive the new owner's run.
+
+# KEYS[1] = waiting zset, KEYS[2] = processing zset
+# ARGV[1] = job key prefix, ARGV[2] = now, ARGV[3] = lease expiry,
+# ARGV[4] = lease token
+# Returns {job_id, field, value, ...} or nil when the queue is empty
+CLAIM_JOB_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return nil
+end
+
+local job_id = popped[1]
+local job_key = ARGV[1] .. job_id
+
+if redis.call('EXISTS', job_key) == 0 then
+    return {job_id}
+end
+
+redis.call('HSET', job_key, 'status', 'processing', 'updated_at', ARGV[2], 'lease', ARGV[4])
+redis.call('ZADD', KEYS[2], ARGV[3], job_id)
+
+local result = {job_id}
+local fields = redis.call('HGETALL', job_key)
+for i = 1, #fields do
+    result[#result + 1] = fields[i]
+end
+return result
+"""
+
+# Shared helper: whether the caller still holds the job's lease (it is in
+# :processing and, unless lease is '', under that token)
+HOLDS_LEASE_LUA = """
+local function holds_lease(job_key, processing_key, job_id, lease)
+    if not redis.call('ZSCORE', processing_key, job_id) then
+        return false
+    end
+    return lease == '' or redis.call('HGET', job_key, 'lease') == lease
+end
+"""
+
+# KEYS[1] = job hash, KEYS[2] = processing zset, KEYS[3] = completed zset
+# ARGV[1] = job_id, ARGV[2] = now, ARGV[3] = JSON result ('' for none),
+# ARGV[4] = job key prefix, ARGV[5] = max completed, ARGV[6] = retention secs,
+# ARGV[7] = lease token ('' = any)
+# Returns 1, or 0 if the lease was lost
+COMPLETE_JOB_SCRIPT = RECORD_FINISHED_LUA + HOLDS_LEASE_LUA + """
+if not holds_lease(KEYS[1], KEYS[2], ARGV[1], ARGV[7]) then
+    return 0
+end
+
+redis.call('HDEL', KEYS[1], 'lease')
+redis.call('HSET', KEYS[1],
+    'status', 'completed',
+    'completed_at', ARGV[2],
+    'updated_at', ARGV[2])
+if ARGV[3] ~= '' then
+    redis.call('HSET', KEYS[1], 'result', ARGV[3])
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+record_finished(KEYS[3], ARGV[4], ARGV[1], tonumber(ARGV[2]),
+    tonumber(ARGV[5]), tonumber(ARGV[6]))
+return 1
+"""
+
+# KEYS[1] = job hash, KEYS[2] = processing zset,
+# KEYS[3] = delayed zset, KEYS[4] = failed zset, KEYS[5] = wake-up marker list
+# ARGV[1] = job_id, ARGV[2] = error, ARGV[3] = now, ARGV[4] = max retries,
+# ARGV[5] = marker cap, ARGV[6] = job key prefix, ARGV[7] = max failed,
+# ARGV[8] = retention secs, ARGV[9] = lease token ('' = any),
+# ARGV[10..] = retry delays in ms
+# Returns {'retry', attempt, delay_ms}, {'failed', attempts, 0},
+# {'lost', 0, 0} if the lease was lost, or nil if the job hash has expired
+FAIL_JOB_SCRIPT = RECORD_FINISHED_LUA + HOLDS_LEASE_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+    return nil
+end
+
+if not holds_lease(KEYS[1], KEYS[2], ARGV[1], ARGV[9]) then
+    return {'lost', 0, 0}
+end
+
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[1], 'lease')
+
+local attempts = tonumber(redis.call('HGET', KEYS[1], 'attempts') or '0')
+local now = tonumber(ARGV[3])
+
+if attempts < tonumber(ARGV[4]) then
+    local delays = #ARGV - 9
+    local delay = tonumber(ARGV[10 + math.min(attempts, delays - 1)])
+    redis.call('HSET', KEYS[1],
+        'status', 'retry',
+        'attempts', tostring(attempts + 1),
+        'last_error', ARGV[2],
+        'updated_at', ARGV[3])
+    redis.call('ZADD', KEYS[3], now + delay / 1000, ARGV[1])
+    redis.call('LPUSH', KEYS[5], ARGV[1])
+    redis.call('LTRIM', KEYS[5], 0, tonumber(ARGV[5]) - 1)
+    return {'retry', attempts + 1, delay}
+end
+
+redis.call('HSET', KEYS[1],
+    'status', 'failed',
+    'failed_at', ARGV[3],
+    'last_error', ARGV[2],
+    'updated_at', ARGV[3])
+record_finished(KEYS[4], ARGV[6], ARGV[1], now, tonumber(ARGV[7]), tonumber(ARGV[8]))
+return {'failed', attempts + 1, 0}
+"""
+
+# KEYS[1] = processing zset
+# ARGV[1] = job key prefix, ARGV[2] = lease expiry,
+# ARGV[3..] = job_id, lease token ('' = any) pairs
+# Returns number of leases extended
+EXTEND_LEASES_SCRIPT = """
+local extended = 0
+
+for i = 3, #ARGV, 2 do
+    local job_id = ARGV[i]
+    local lease = ARGV[i + 1]
+
+    -- XX: a lease that was already reaped is not resurrected
+    if lease == '' or redis.call('HGET', ARGV[1] .. job_id, 'lease') == lease then
+        extended = extended + redis.call('ZADD', KEYS[1], 'XX', 'CH', ARGV[2], job_id)
+    end
+end
+return extended
+"""
+
+# KEYS[1] = processing zset, KEYS[2] = waiting zset,
+# KEYS[3] = failed zset, KEYS[4] = wake-up marker list
+# ARGV[1] = job key prefix, ARGV[2] = now, ARGV[3] = max stalls,
+# ARGV[4] = batch limit, ARGV[5] = marker cap, ARGV[6] = max failed,
+# ARGV[7] = retention secs
+# Returns {requeued_count, {failed_job_id, ...}}
+REAP_STALLED_SCRIPT = RECORD_FINISHED_LUA + """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[2],
+    'LIMIT', 0, tonumber(ARGV[4]))
+local requeued = 0
+local failed = {}
+
+for _, job_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[1], job_id)
+    local job_key = ARGV[1] .. job_id
+
+    if redis.call('EXISTS', job_key) == 1 then
+        -- Revokes the stalled worker's lease
+        redis.call('HDEL', job_key, 'lease')
+        local stalls = redis.call('HINCRBY', job_key, 'stalled_count', 1)
+
+        if stalls > tonumber(ARGV[3]) then
+            redis.call('HSET', job_key,
+                'status', 'failed',
+                'failed_at', ARGV[2],
+                'last_error', 'Job stalled ' .. stalls .. ' times',
+                'updated_at', ARGV[2])
+            record_finished(KEYS[3], ARGV[1], job_id, tonumber(ARGV[2]),
+                tonumber(ARGV[6]), tonumber(ARGV[7]))
+            failed[#failed + 1] = job_id
+        else
+            local priority = tonumber(redis.call('HGET', job_key, 'priority') or '0')
+            redis.call('HSET', job_key, 'status', 'pending', 'updated_at', ARGV[2])
+            redis.call('ZADD', KEYS[2], -priority, job_id)
+            redis.call('LPUSH', KEYS[4], job_id)
+            requeued = requeued + 1
+        end
+    end
+end
+
+if requeued > 0 then
+    redis.call('LTRIM', KEYS[4], 0, tonumber(ARGV[5]) - 1)
+end
+return {requeued, failed}
+"""
+
+# KEYS[1] = delayed zset, KEYS[2] = waiting zset, KEYS[3] = wake-up marker list
+# ARGV[1] = job key prefix, ARGV[2] = now, ARGV[3] = batch limit,
+# ARGV[4] = marker cap
+# Returns number of jobs promoted to :waiting
+PROMOTE_DELAYED_SCRIPT = """
+local ready = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[2],
+    'LIMIT', 0, tonumber(ARGV[3]))
+local promoted = 0
+
+for _, job_id in ipairs(ready) do
+    redis.call('ZREM', KEYS[1], job_id)
+    local priority = redis.call('HGET', ARGV[1] .. job_id, 'priority')
+
+    -- Jobs whose hash already expired are dropped rather than promoted
+    if priority then
+        redis.call('ZADD', KEYS[2], -tonumber(priority), job_id)
+        redis.call('LPUSH', KEYS[3], job_id)
+        promoted = promoted + 1
+    end
+end
+
+if promoted > 0 then
+    redis.call('LTRIM', KEYS[3], 0, tonumber(ARGV[4]) - 1)
+end
+return promoted
+"""
+
+# KEYS[1] = completed zset, KEYS[2] = failed zset
+# ARGV[1] = job key prefix, ARGV[2] = age cutoff, ARGV[3] = max completed,
+# ARGV[4] = max failed
+# Returns {completed_removed, failed_removed}
+COMPACT_FINISHED_SCRIPT = """
+local function compact(index_key, max_count)
+    local removed = redis.call('ZREMRANGEBYSCORE', index_key, '-inf', ARGV[2])
+
+    local overflow = redis.call('ZCARD', index_key) - max_count
+    if overflow > 0 then
+        local evicted = redis.call('ZRANGE', index_key, 0, overflow - 1)
+        for _, evicted_id in ipairs(evicted) do
+            redis.call('DEL', ARGV[1] .. evicted_id)
+        end
+        removed = removed + redis.call('ZREMRANGEBYRANK', index_key, 0, overflow - 1)
+    end
+    return removed
+end
+
+return {
+    compact(KEYS[1], tonumber(ARGV[3])),
+    compact(KEYS[2], tonumber(ARGV[4]))
+}
+"""
+
+# KEYS[1] = idempotency key
+# ARGV[1] = job_id, ARGV[2] = window secs, ARGV[3] = job key prefix
+# Returns the job_id that owns the key: an earlier job unless that job failed
+# (a missing hash counts as live, since its enqueue may still be in flight)
+CLAIM_IDEMPOTENCY_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing and redis.call('HGET', ARGV[3] .. existing, 'status') ~= 'failed' then
+    return existing
+end
+
+redis.call('SET', KEYS[1], ARGV[1], 'EX', tonumber(ARGV[2]))
+return ARGV[1]
+"""
+
+# KEYS[1] = idempotency key
+# ARGV[1] = job_id
+# Drops the key only if this job still owns it
+RELEASE_IDEMPOTENCY_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
 class QuestQueue:
     """
     Redis-based job queue for Quest Platform
@@ -39,6 +323,27 @@ class QuestQueue:
         self.job_prefix = "quest:job:"
         self.max_retries = 3
         self.retry_delay = [1000, 5000, 15000]  # Exponential backoff in ms
+        self.visibility_timeout = settings.QUEUE_VISIBILITY_TIMEOUT  # seconds
+        self.block_timeout = settings.QUEUE_BLOCK_TIMEOUT  # seconds
+        self.max_markers = 1000  # Cap on pending wake-up markers
+        self.max_stalls = settings.QUEUE_MAX_STALLS
+        self.reap_batch_size = 100
+        self.promote_batch_size = 100
+        self.keep_completed = settings.QUEUE_KEEP_COMPLETED
+        self.keep_failed = settings.QUEUE_KEEP_FAILED
+        self.retention = settings.QUEUE_RETENTION_SECONDS  # finished job max age
+        self.idempotency_window = settings.QUEUE_IDEMPOTENCY_WINDOW  # seconds, 0 = off
+
+        # Registered Lua scripts (bound on connect)
+        self._claim_script = None
+        self._complete_script = None
+        self._fail_script = None
+        self._extend_leases_script = None
+        self._reap_script = None
+        self._compact_script = None
+        self._promote_script = None
+        self._claim_idempotency_script = None
+        self._release_idempotency_script = None
 
     async def connect(self):
         """Connect to Redis"""
@@ -55,6 +360,11 @@ class QuestQueue:
 
             # Test connection
             await self.redis_client.ping()
+
+            self._register_scripts()
+            await self._migrate_processing_set()
+            await self._migrate_finished_sets()
+
             logger.info("queue.connected", url=self.redis_url[:30] + "...")
             return True
 
@@ -63,6 +373,84 @@ class QuestQueue:
             self.redis_client = None
             return False
 
+    def _register_scripts(self):
+        """Register Lua scripts (EVALSHA with automatic EVAL fallback)"""
+        self._claim_script = self.redis_client.register_script(CLAIM_JOB_SCRIPT)
+        self._complete_script = self.redis_client.register_script(COMPLETE_JOB_SCRIPT)
+        self._fail_script = self.redis_client.register_script(FAIL_JOB_SCRIPT)
+        self._extend_leases_script = self.redis_client.register_script(EXTEND_LEASES_SCRIPT)
+        self._reap_script = self.redis_client.register_script(REAP_STALLED_SCRIPT)
+        self._compact_script = self.redis_client.register_script(COMPACT_FINISHED_SCRIPT)
+        self._promote_script = self.redis_client.register_script(PROMOTE_DELAYED_SCRIPT)
+        self._claim_idempotency_script = self.redis_client.register_script(
+            CLAIM_IDEMPOTENCY_SCRIPT
+        )
+        self._release_idempotency_script = self.redis_client.register_script(
+            RELEASE_IDEMPOTENCY_SCRIPT
+        )
+
+    async def _migrate_processing_set(self):
+        """
+        Convert a legacy :processing SET into the lease ZSET
+
+        Older workers tracked in-flight jobs in a plain set. Existing members
+        are given a fresh lease so they can be reclaimed like any other job.
+        """
+        processing_key = f"{self.queue_name}:processing"
+
+        if await self.redis_client.type(processing_key) != "set":
+            return
+
+        job_ids = await self.redis_client.smembers(processing_key)
+        lease_expiry = time.time() + self.visibility_timeout
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(processing_key)
+            if job_ids:
+                pipe.zadd(processing_key, {job_id: lease_expiry for job_id in job_ids})
+            await pipe.execute()
+
+        logger.info("queue.processing_set_migrated", jobs=len(job_ids))
+
+    async def _migrate_finished_sets(self):
+        """
+        Convert legacy :completed/:failed SETs into time-ordered ZSETs
+
+        Members whose job hash already expired are dropped; the rest are
+        scored by their completed_at/failed_at timestamp.
+        """
+        for index, timestamp_field in (("completed", "completed_at"), ("failed", "failed_at")):
+            index_key = f"{self.queue_name}:{index}"
+
+            if await self.redis_client.type(index_key) != "set":
+                continue
+
+            job_ids = [job_id async for job_id in self.redis_client.sscan_iter(index_key)]
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for job_id in job_ids:
+                    pipe.hget(f"{self.job_prefix}{job_id}", timestamp_field)
+                finished_at = await pipe.execute()
+
+            entries = {
+                job_id: float(timestamp)
+                for job_id, timestamp in zip(job_ids, finished_at)
+                if timestamp
+            }
+
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(index_key)
+                if entries:
+                    pipe.zadd(index_key, entries)
+                await pipe.execute()
+
+            logger.info(
+                "queue.finished_set_migrated",
+                index=index,
+                kept=len(entries),
+                dropped=len(job_ids) - len(entries)
+            )
+
     async def disconnect(self):
         """Disconnect from Redis"""
         if self.redis_client:
@@ -75,7 +463,8 @@ class QuestQueue:
         data: Dict,
         priority: int = 0,
         delay: int = 0,
-        job_id: Optional[str] = None
+        job_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Optional[str]:
         """
         Add job to queue
@@ -86,81 +475,240 @@ class QuestQueue:
             priority: Job priority (higher = more important)
             delay: Delay in milliseconds before processing
             job_id: Optional external job ID (if None, generates new UUID)
+            idempotency_key: Optional dedupe key (if None, derived from the
+                normalized topic and target_site in data)
 
         Returns:
-            Job ID if successful, None otherwise
+            Job ID if successful (an earlier job's ID when this submission
+            duplicates one within the idempotency window), None otherwise
         """
-        if not self.redis_client:
-            if not await self.connect():
-                return None
-
-        # Use provided job_id or generate new one
+        # Known up front, so a deduplicated submission can be told apart
         job_id = job_id or str(uuid4())
-        job_key = f"{self.job_prefix}{job_id}"
 
-        job_data = {
-            "id": job_id,
-            "type": job_type,
+        job_ids = await self.enqueue_many([{
+            "job_type": job_type,
             "data": data,
-            "status": JobStatus.PENDING.value,
             "priority": priority,
-            "attempts": 0,
-            "created_at": time.time(),
-            "updated_at": time.time()
-        }
-
-        try:
-            # Store job data
-            await self.redis_client.hset(
-                job_key,
-                mapping={
-                    k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
-                    for k, v in job_data.items()
-                }
-            )
+            "delay": delay,
+            "job_id": job_id,
+            "idempotency_key": idempotency_key
+        }])
 
-            # Set expiry (24 hours)
-            await self.redis_client.expire(job_key, 86400)
-
-            # Add to queue (with priority and delay)
-            if delay > 0:
-                # Add to delayed queue
-                score = time.time() + (delay / 1000)
-                await self.redis_client.zadd(
-                    f"{self.queue_name}:delayed",
-                    {job_id: score}
-                )
-            else:
-                # Add to priority queue
-                await self.redis_client.zadd(
-                    f"{self.queue_name}:waiting",
-                    {job_id: -priority}  # Negative for descending sort
-                )
+        if not job_ids:
+            return None
 
+        # enqueue_many logged queue.job_deduplicated otherwise
+        if job_ids[0] == job_id:
             logger.info(
                 "queue.job_enqueued",
-                job_id=job_id,
+                job_id=job_ids[0],
                 job_type=job_type,
                 priority=priority,
                 delay=delay
             )
 
-            return job_id
+        return job_ids[0]
+
+    async def enqueue_many(self, jobs: List[Dict]) -> List[str]:
+        """
+        Add many jobs to queue in pipelined round trips
+
+        Jobs with an idempotency key (see idempotency_key_for) first claim it
+        in a pipelined script call; a job whose key is held by an earlier,
+        not-failed job is skipped and that job's ID returned in its place.
+
+        Args:
+            jobs: Job specs, each with job_type and data, plus optional
+                priority, delay (ms), job_id and idempotency_key (same
+                meaning as enqueue)
+
+        Returns:
+            Job IDs in input order if successful, empty list otherwise
+        """
+        if not self.redis_client:
+            if not await self.connect():
+                return []
+
+        now = time.time()
+        job_ids = [job.get("job_id") or str(uuid4()) for job in jobs]
+        queued_ids = list(job_ids)
+        new_jobs = []
+        claims = {}
+
+        try:
+            claims = await self._claim_idempotency_keys(jobs, job_ids)
+
+            for index, (job, job_id) in enumerate(zip(jobs, job_ids)):
+                owner = claims.get(index, (None, job_id))[1]
+
+                if owner != job_id:
+                    logger.info(
+                        "queue.job_deduplicated",
+                        job_id=owner,
+                        duplicate_job_id=job_id,
+                        job_type=job["job_type"]
+                    )
+                    queued_ids[index] = owner
+                else:
+                    new_jobs.append((job, job_id))
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for job, job_id in new_jobs:
+                    job_key = f"{self.job_prefix}{job_id}"
+                    priority = job.get("priority", 0)
+                    delay = job.get("delay", 0)
+
+                    job_data = {
+                        "id": job_id,
+                        "type": job["job_type"],
+                        "data": job["data"],
+                        "status": JobStatus.PENDING.value,
+                        "priority": priority,
+                        "attempts": 0,
+                        "created_at": now,
+                        "updated_at": now
+                    }
+
+                    # Store job data (expires after 24 hours)
+                    pipe.hset(
+                        job_key,
+                        mapping={
+                            k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
+                            for k, v in job_data.items()
+                        }
+                    )
+                    pipe.expire(job_key, 86400)
+
+                    # Add to queue (with priority and delay)
+                    if delay > 0:
+                        pipe.zadd(
+                            f"{self.queue_name}:delayed",
+                            {job_id: now + (delay / 1000)}
+                        )
+                    else:
+                        self._stage_waiting(pipe, job_id, priority)
+
+                # Wake blocked workers (they also recompute waits for delayed jobs)
+                self._stage_signal(pipe, [job_id for _, job_id in new_jobs])
+
+                await pipe.execute()
+
+            if len(new_jobs) > 1:
+                logger.info(
+                    "queue.jobs_enqueued",
+                    count=len(new_jobs),
+                    deduplicated=len(jobs) - len(new_jobs)
+                )
+
+            return queued_ids
 
         except Exception as e:
             logger.error(
                 "queue.enqueue_failed",
-                job_id=job_id,
+                job_ids=job_ids[:10],
+                count=len(jobs),
                 error=str(e)
             )
-            return None
+            # Only give back keys this batch claimed, not earlier jobs' keys
+            await self._release_idempotency_keys([
+                claims[index]
+                for index, job_id in enumerate(job_ids)
+                if index in claims and claims[index][1] == job_id
+            ])
+            return []
+
+    def idempotency_key_for(
+        self,
+        job_type: str,
+        data: Dict,
+        idempotency_key: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Redis key that deduplicates a submission
+
+        Args:
+            job_type: Type of job
+            data: Job data (topic and target_site are used by default)
+            idempotency_key: Caller-supplied key, used verbatim if given
+
+        Returns:
+            Namespaced key, or None if the job has nothing to dedupe on
+        """
+        if not idempotency_key:
+            topic = data.get("topic")
+            if not topic:
+                return None
+            idempotency_key = f"{data.get('target_site', '')}:{normalize_topic(topic)}"
+
+        digest = hashlib.sha1(f"{job_type}:{idempotency_key}".encode()).hexdigest()
+        return f"{self.queue_name}:idempotency:{digest}"
+
+    async def _claim_idempotency_keys(
+        self,
+        jobs: List[Dict],
+        job_ids: List[str]
+    ) -> Dict[int, tuple]:
+        """
+        Claim idempotency keys for a batch in one pipelined round trip
+
+        Claims run in input order, so duplicates within the same batch
+        resolve to the first occurrence.
+
+        Returns:
+            Job index -> (idempotency key, owning job ID)
+        """
+        if self.idempotency_window <= 0:
+            return {}
+
+        keys = {}
+        for index, job in enumerate(jobs):
+            key = self.idempotency_key_for(
+                job["job_type"], job["data"], job.get("idempotency_key")
+            )
+            if key:
+                keys[index] = key
+
+        if not keys:
+            return {}
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for index, key in keys.items():
+                await self._claim_idempotency_script(
+                    keys=[key],
+                    args=[job_ids[index], self.idempotency_window, self.job_prefix],
+                    client=pipe
+                )
+            owners = await pipe.execute()
+
+        return {
+            index: (key, owner)
+            for (index, key), owner in zip(keys.items(), owners)
+        }
+
+    async def _release_idempotency_keys(self, claims: List[tuple]):
+        """Give back (key, job_id) claims of a batch that failed to enqueue"""
+        if not claims or not self.redis_client:
+            return
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, owner in claims:
+                    await self._release_idempotency_script(
+                        keys=[key],
+                        args=[owner],
+                        client=pipe
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error("queue.release_idempotency_failed", error=str(e))
 
     async def dequeue(self) -> Optional[Dict]:
         """
         Get next job from queue
 
         Returns:
-            Job data if available, None otherwise
+            Job data if available, None otherwise. Its "lease" field is the
+            token to pass to complete_job, fail_job and extend_leases.
         """
         if not self.redis_client:
             if not await self.connect():
@@ -170,40 +718,32 @@ class QuestQueue:
             # First, check delayed jobs
             await self._process_delayed_jobs()
 
-            # Get next job from priority queue
-            result = await self.redis_client.zpopmin(
-                f"{self.queue_name}:waiting",
-                count=1
+            # Atomically claim the next job and take out a lease on it
+            now = time.time()
+            result = await self._claim_script(
+                keys=[
+                    f"{self.queue_name}:waiting",
+                    f"{self.queue_name}:processing"
+                ],
+                args=[self.job_prefix, now, now + self.visibility_timeout, uuid4().hex]
             )
 
             if not result:
                 return None
 
-            job_id = result[0][0]
-            job_key = f"{self.job_prefix}{job_id}"
-
-            # Get job data
-            job_data = await self.redis_client.hgetall(job_key)
+            job_id = result[0]
 
-            if not job_data:
+            if len(result) == 1:
                 logger.warning("queue.job_not_found", job_id=job_id)
                 return None
 
             # Parse job data
+            job_data = dict(zip(result[1::2], result[2::2]))
             job = {
                 k: json.loads(v) if k in ["data"] else v
                 for k, v in job_data.items()
             }
 
-            # Update status to processing
-            await self.update_job_status(job_id, JobStatus.PROCESSING)
-
-            # Move to processing set
-            await self.redis_client.sadd(
-                f"{self.queue_name}:processing",
-                job_id
-            )
-
             logger.info(
                 "queue.job_dequeued",
                 job_id=job_id,
@@ -216,45 +756,97 @@ class QuestQueue:
             logger.error("queue.dequeue_failed", error=str(e))
             return None
 
-    async def complete_job(self, job_id: str, result: Any = None):
+    async def wait_for_job(self) -> Optional[Dict]:
+        """
+        Get next job from queue, blocking until one is available
+
+        Idle workers park on a BLPOP of the :marker list, which enqueue and
+        retry scheduling push to. The block is bounded by the time until the
+        next delayed job comes due (and by block_timeout, so shutdown stays
+        responsive), so no polling happens while the queue is idle.
+
+        Returns:
+            Job data if available, None if the wait timed out
+        """
+        job = await self.dequeue()
+
+        if job or not self.redis_client:
+            return job
+
+        try:
+            # Block until woken, or until the next delayed job is due
+            block = await self._block_time()
+
+            if block > 0:
+                woken = await self.redis_client.blpop(
+                    f"{self.queue_name}:marker",
+                    timeout=block
+                )
+                if not woken and block == self.block_timeout:
+                    return None
+
+        except Exception as e:
+            logger.error("queue.wait_failed", error=str(e))
+            return None
+
+        return await self.dequeue()
+
+    async def _block_time(self) -> float:
+        """Seconds until the next delayed job is due, capped at block_timeout"""
+        next_delayed = await self.redis_client.zrange(
+            f"{self.queue_name}:delayed",
+            0,
+            0,
+            withscores=True
+        )
+
+        if not next_delayed:
+            return self.block_timeout
+
+        return min(self.block_timeout, max(next_delayed[0][1] - time.time(), 0))
+
+    async def complete_job(self, job_id: str, result: Any = None, lease: Optional[str] = None) -> bool:
         """
         Mark job as completed
 
         Args:
             job_id: Job ID
             result: Job result data
+            lease: Lease token from dequeue (None = whoever holds the job)
+
+        Returns:
+            True if completed, False if the lease was lost (the job was
+            reaped and may be running elsewhere) or Redis failed
         """
         if not self.redis_client:
-            return
+            return False
 
         job_key = f"{self.job_prefix}{job_id}"
 
         try:
-            # Update job data
-            updates = {
-                "status": JobStatus.COMPLETED.value,
-                "completed_at": str(time.time()),
-                "updated_at": str(time.time())
-            }
-
-            if result is not None:
-                updates["result"] = json.dumps(result)
-
-            await self.redis_client.hset(job_key, mapping=updates)
-
-            # Remove from processing set
-            await self.redis_client.srem(
-                f"{self.queue_name}:processing",
-                job_id
+            completed = await self._complete_script(
+                keys=[
+                    job_key,
+                    f"{self.queue_name}:processing",
+                    f"{self.queue_name}:completed"
+                ],
+                args=[
+                    job_id,
+                    time.time(),
+                    json.dumps(result) if result is not None else "",
+                    self.job_prefix,
+                    self.keep_completed,
+                    self.retention,
+                    lease or ""
+                ]
             )
 
-            # Add to completed set
-            await self.redis_client.sadd(
-                f"{self.queue_name}:completed",
-                job_id
-            )
+            if not completed:
+                logger.warning("queue.lease_lost", job_id=job_id, action="complete")
+                return False
 
             logger.info("queue.job_completed", job_id=job_id)
+            return True
 
         except Exception as e:
             logger.error(
@@ -262,14 +854,16 @@ class QuestQueue:
                 job_id=job_id,
                 error=str(e)
             )
+            return False
 
-    async def fail_job(self, job_id: str, error: str):
+    async def fail_job(self, job_id: str, error: str, lease: Optional[str] = None):
         """
         Mark job as failed and handle retries
 
         Args:
             job_id: Job ID
             error: Error message
+            lease: Lease token from dequeue (None = whoever holds the job)
         """
         if not self.redis_client:
             return
@@ -277,76 +871,47 @@ class QuestQueue:
         job_key = f"{self.job_prefix}{job_id}"
 
         try:
-            # Get current job data
-            job_data = await self.redis_client.hgetall(job_key)
-
-            if not job_data:
-                return
-
-            attempts = int(job_data.get("attempts", 0))
-
-            if attempts < self.max_retries:
-                # Retry with exponential backoff
-                delay = self.retry_delay[min(attempts, len(self.retry_delay) - 1)]
-
-                # Update job data
-                await self.redis_client.hset(
+            outcome = await self._fail_script(
+                keys=[
                     job_key,
-                    mapping={
-                        "status": JobStatus.RETRY.value,
-                        "attempts": str(attempts + 1),
-                        "last_error": error,
-                        "updated_at": str(time.time())
-                    }
-                )
-
-                # Remove from processing
-                await self.redis_client.srem(
                     f"{self.queue_name}:processing",
-                    job_id
-                )
-
-                # Add back to delayed queue
-                score = time.time() + (delay / 1000)
-                await self.redis_client.zadd(
                     f"{self.queue_name}:delayed",
-                    {job_id: score}
-                )
+                    f"{self.queue_name}:failed",
+                    f"{self.queue_name}:marker"
+                ],
+                args=[
+                    job_id,
+                    error,
+                    time.time(),
+                    self.max_retries,
+                    self.max_markers,
+                    self.job_prefix,
+                    self.keep_failed,
+                    self.retention,
+                    lease or "",
+                    *self.retry_delay
+                ]
+            )
 
+            if not outcome:
+                return
+
+            state, attempt, delay = outcome
+
+            if state == "lost":
+                logger.warning("queue.lease_lost", job_id=job_id, action="fail", error=error)
+            elif state == JobStatus.RETRY.value:
                 logger.info(
                     "queue.job_retry",
                     job_id=job_id,
-                    attempt=attempts + 1,
+                    attempt=attempt,
                     delay=delay
                 )
             else:
-                # Max retries exceeded - mark as failed
-                await self.redis_client.hset(
-                    job_key,
-                    mapping={
-                        "status": JobStatus.FAILED.value,
-                        "failed_at": str(time.time()),
-                        "last_error": error,
-                        "updated_at": str(time.time())
-                    }
-                )
-
-                # Remove from processing
-                await self.redis_client.srem(
-                    f"{self.queue_name}:processing",
-                    job_id
-                )
-
-                # Add to failed set
-                await self.redis_client.sadd(
-                    f"{self.queue_name}:failed",
-                    job_id
-                )
-
                 logger.error(
                     "queue.job_failed",
                     job_id=job_id,
-                    attempts=attempts + 1,
+                    attempts=attempt,
                     error=error
                 )
 
@@ -357,6 +922,122 @@ class QuestQueue:
                 error=str(e)
             )
 
+    async def extend_leases(self, leases: Dict[str, Optional[str]]) -> int:
+        """
+        Heartbeat: push back the lease expiry of in-flight jobs
+
+        Only jobs still in :processing under the same lease token are
+        touched, so a lease that was reaped (or handed to another worker)
+        is not resurrected.
+
+        Args:
+            leases: Job ID -> lease token of the jobs this worker is processing
+
+        Returns:
+            Number of leases extended
+        """
+        if not self.redis_client or not leases:
+            return 0
+
+        args = [self.job_prefix, time.time() + self.visibility_timeout]
+        for job_id, lease in leases.items():
+            args += [job_id, lease or ""]
+
+        try:
+            return await self._extend_leases_script(
+                keys=[f"{self.queue_name}:processing"],
+                args=args
+            )
+        except Exception as e:
+            logger.error("queue.extend_leases_failed", error=str(e))
+            return 0
+
+    async def reap_stalled_jobs(self) -> List[str]:
+        """
+        Reclaim jobs whose lease expired (worker died or stopped heartbeating)
+
+        Expired jobs go back to :waiting, or to :failed once they have
+        stalled more than max_stalls times. Safe to run from every worker.
+
+        Returns:
+            IDs of jobs that were failed for stalling too often
+        """
+        if not self.redis_client:
+            return []
+
+        try:
+            requeued, failed = await self._reap_script(
+                keys=[
+                    f"{self.queue_name}:processing",
+                    f"{self.queue_name}:waiting",
+                    f"{self.queue_name}:failed",
+                    f"{self.queue_name}:marker"
+                ],
+                args=[
+                    self.job_prefix,
+                    time.time(),
+                    self.max_stalls,
+                    self.reap_batch_size,
+                    self.max_markers,
+                    self.keep_failed,
+                    self.retention
+                ]
+            )
+
+            if requeued or failed:
+                logger.warning(
+                    "queue.stalled_jobs_reaped",
+                    requeued=requeued,
+                    failed=failed
+                )
+
+            return failed
+
+        except Exception as e:
+            logger.error("queue.reap_stalled_failed", error=str(e))
+            return []
+
+    async def compact_finished_jobs(self) -> Dict[str, int]:
+        """
+        Trim the :completed/:failed indexes by age and count
+
+        complete_job/fail_job already evict beyond the max count; this pass
+        also drops entries older than the retention window, whose hashes
+        have expired.
+
+        Returns:
+            Number of entries removed per index
+        """
+        if not self.redis_client:
+            return {"completed": 0, "failed": 0}
+
+        try:
+            completed, failed = await self._compact_script(
+                keys=[
+                    f"{self.queue_name}:completed",
+                    f"{self.queue_name}:failed"
+                ],
+                args=[
+                    self.job_prefix,
+                    time.time() - self.retention,
+                    self.keep_completed,
+                    self.keep_failed
+                ]
+            )
+
+            if completed or failed:
+                logger.info(
+                    "queue.finished_jobs_compacted",
+                    completed=completed,
+                    failed=failed
+                )
+
+            return {"completed": completed, "failed": failed}
+
+        except Exception as e:
+            logger.error("queue.compact_failed", error=str(e))
+            return {"completed": 0, "failed": 0}
+
     async def update_job_status(
         self,
         job_id: str,
@@ -436,47 +1117,58 @@ class QuestQueue:
             logger.error("queue.get_job_failed", job_id=job_id, error=str(e))
             return None
 
-    async def _process_delayed_jobs(self):
-        """Move ready delayed jobs to waiting queue"""
-        if not self.redis_client:
+    def _stage_waiting(self, pipe, job_id: str, priority: int):
+        """Queue a ZADD onto the priority queue in the given pipeline"""
+        pipe.zadd(
+            f"{self.queue_name}:waiting",
+            {job_id: -priority}  # Negative for descending sort
+        )
+
+    def _stage_signal(self, pipe, job_ids: List[str]):
+        """Queue wake-up markers for workers blocked in wait_for_job"""
+        if not job_ids:
             return
 
-        try:
-            # Get jobs ready to process (score <= current time)
-            current_time = time.time()
-            ready_jobs = await self.redis_client.zrangebyscore(
-                f"{self.queue_name}:delayed",
-                min=0,
-                max=current_time
-            )
+        marker_key = f"{self.queue_name}:marker"
+        pipe.lpush(marker_key, *job_ids[:self.max_markers])
+        pipe.ltrim(marker_key, 0, self.max_markers - 1)
 
-            if ready_jobs:
-                # Move to waiting queue
-                for job_id in ready_jobs:
-                    # Get job priority
-                    job_key = f"{self.job_prefix}{job_id}"
-                    priority = await self.redis_client.hget(job_key, "priority")
-                    priority = int(priority) if priority else 0
+    async def _process_delayed_jobs(self) -> int:
+        """
+        Move ready delayed jobs to waiting queue
 
-                    # Add to waiting queue
-                    await self.redis_client.zadd(
-                        f"{self.queue_name}:waiting",
-                        {job_id: -priority}
-                    )
+        Promotion runs server-side in one script (at most promote_batch_size
+        jobs per call), so concurrent workers never promote a job twice.
 
-                    # Remove from delayed queue
-                    await self.redis_client.zrem(
-                        f"{self.queue_name}:delayed",
-                        job_id
-                    )
+        Returns:
+            Number of jobs promoted
+        """
+        if not self.redis_client:
+            return 0
 
-                    logger.debug(
-                        "queue.delayed_job_ready",
-                        job_id=job_id
-                    )
+        try:
+            promoted = await self._promote_script(
+                keys=[
+                    f"{self.queue_name}:delayed",
+                    f"{self.queue_name}:waiting",
+                    f"{self.queue_name}:marker"
+                ],
+                args=[
+                    self.job_prefix,
+                    time.time(),
+                    self.promote_batch_size,
+                    self.max_markers
+                ]
+            )
+
+            if promoted:
+                logger.debug("queue.delayed_jobs_ready", count=promoted)
+
+            return promoted
 
         except Exception as e:
             logger.error("queue.process_delayed_failed", error=str(e))
+            return 0
 
     async def get_queue_stats(self) -> Dict:
         """Get queue statistics"""
@@ -487,17 +1179,21 @@ class QuestQueue:
                 "processing": 0,
                 "completed": 0,
                 "failed": 0,
-                "delayed": 0
+                "delayed": 0,
+                "stalled": 0
             }
 
         try:
             stats = {
                 "connected": True,
                 "waiting": await self.redis_client.zcard(f"{self.queue_name}:waiting"),
-                "processing": await self.redis_client.scard(f"{self.queue_name}:processing"),
-                "completed": await self.redis_client.scard(f"{self.queue_name}:completed"),
-                "failed": await self.redis_client.scard(f"{self.queue_name}:failed"),
-                "delayed": await self.redis_client.zcard(f"{self.queue_name}:delayed")
+                "processing": await self.redis_client.zcard(f"{self.queue_name}:processing"),
+                "completed": await self.redis_client.zcard(f"{self.queue_name}:completed"),
+                "failed": await self.redis_client.zcard(f"{self.queue_name}:failed"),
+                "delayed": await self.redis_client.zcard(f"{self.queue_name}:delayed"),
+                "stalled": await self.redis_client.zcount(
+                    f"{self.queue_name}:processing", "-inf", time.time()
+                )
             }
             return stats
         except:
@@ -507,9 +1203,19 @@ class QuestQueue:
                 "processing": 0,
                 "completed": 0,
                 "failed": 0,
-                "delayed": 0
+                "delayed": 0,
+                "stalled": 0
             }
 
 
+def create_queue() -> QuestQueue:
+    """Build the queue engine selected by QUEUE_ENGINE"""
+    if settings.QUEUE_ENGINE == "streams":
+        from app.core.stream_queue import StreamQuestQueue
+        return StreamQuestQueue()
+
+    return QuestQueue()
+
+
 # Global queue instance
-queue = QuestQueue()
\ No newline at end of file
+queue = create_queue()
\ No newline at end of file
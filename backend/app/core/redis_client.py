@@ -71,3 +71,13 @@ def get_redis() -> redis.Redis:
     if _redis_client is None:
         raise RuntimeError("Redis not initialized. Call init_redis() first.")
     return _redis_client
+
+
+def get_redis_or_none() -> Optional[redis.Redis]:
+    """
+    Get Redis client, or None if Redis is not initialized
+
+    For best-effort callers (caches, locks, counters) that fall back to
+    in-process behavior without Redis.
+    """
+    return _redis_client
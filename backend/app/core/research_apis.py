@@ -5,14 +5,18 @@ Integrates multiple research APIs with fallback chain
 import asyncio
 import json
 import base64
-from typing import Dict, List, Optional, Any
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from decimal import Decimal
 from abc import ABC, abstractmethod
 
-import httpx
 import structlog
 
 from app.core.config import settings
+from app.core.provider_cache import normalize_query, normalize_url, provider_cache
+from app.core.gemini_executor import run_gemini
+from app.core.resilience import get_resilience
+from app.core.single_flight import single_flight
 
 logger = structlog.get_logger()
 
@@ -40,9 +44,11 @@ class PerplexityProvider(ResearchProvider):
     """Perplexity Sonar API provider"""
 
     def __init__(self):
+        self.resilience = get_resilience("perplexity")
         self.api_key = settings.PERPLEXITY_API_KEY
         self.api_url = "https://api.perplexity.ai/chat/completions"
 
+    @single_flight("perplexity", key=lambda query: normalize_query(query))
     async def search(self, query: str) -> Dict:
         """Search using Perplexity"""
         if not self.is_available():
@@ -66,23 +72,34 @@ class PerplexityProvider(ResearchProvider):
             "max_tokens": 2000,
         }
 
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "query": normalize_query(query),
+            "model": payload["model"],
+            "max_tokens": payload["max_tokens"],
+        }
+        cached = await provider_cache.get("perplexity", cache_request)
+        if cached:
+            return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                return {
-                    "provider": "perplexity",
-                    "content": data["choices"][0]["message"]["content"],
-                    "sources": data.get("citations", []),
-                    "cost": self.get_cost()
-                }
+            result = {
+                "provider": "perplexity",
+                "content": data["choices"][0]["message"]["content"],
+                "sources": data.get("citations", []),
+                "cost": self.get_cost()
+            }
+            await provider_cache.set("perplexity", cache_request, result)
+            return result
         except Exception as e:
             logger.error("perplexity_search_failed", error=str(e))
             return {}
@@ -98,9 +115,11 @@ class TavilyProvider(ResearchProvider):
     """Tavily Search API provider"""
 
     def __init__(self):
+        self.resilience = get_resilience("tavily")
         self.api_key = settings.TAVILY_API_KEY
         self.api_url = "https://api.tavily.com/search"
 
+    @single_flight("tavily", key=lambda query: normalize_query(query))
     async def search(self, query: str) -> Dict:
         """Search using Tavily"""
         if not self.is_available():
@@ -119,34 +138,45 @@ class TavilyProvider(ResearchProvider):
             "max_results": 10,
         }
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract content from results
-                sources = []
-                content_parts = [data.get("answer", "")]
-
-                for result in data.get("results", []):
-                    content_parts.append(f"- {result.get('title', '')}: {result.get('snippet', '')}")
-                    sources.append({
-                        "url": result.get("url"),
-                        "title": result.get("title")
-                    })
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "query": normalize_query(query),
+            "search_depth": payload["search_depth"],
+            "max_results": payload["max_results"],
+        }
+        cached = await provider_cache.get("tavily", cache_request)
+        if cached:
+            return cached
 
-                return {
-                    "provider": "tavily",
-                    "content": "\n\n".join(content_parts),
-                    "sources": sources,
-                    "cost": self.get_cost()
-                }
+        try:
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # Extract content from results
+            sources = []
+            content_parts = [data.get("answer", "")]
+
+            for result in data.get("results", []):
+                content_parts.append(f"- {result.get('title', '')}: {result.get('snippet', '')}")
+                sources.append({
+                    "url": result.get("url"),
+                    "title": result.get("title")
+                })
+
+            result = {
+                "provider": "tavily",
+                "content": "\n\n".join(content_parts),
+                "sources": sources,
+                "cost": self.get_cost()
+            }
+            await provider_cache.set("tavily", cache_request, result)
+            return result
         except Exception as e:
             logger.error("tavily_search_failed", error=str(e))
             return {}
@@ -162,9 +192,11 @@ class FirecrawlProvider(ResearchProvider):
     """Firecrawl web scraping API"""
 
     def __init__(self):
+        self.resilience = get_resilience("firecrawl")
         self.api_key = settings.FIRECRAWL_API_KEY
         self.api_url = "https://api.firecrawl.dev/v0/scrape"
 
+    @single_flight("firecrawl", key=lambda url: normalize_url(url))
     async def scrape(self, url: str) -> Dict:
         """Scrape a specific URL"""
         if not self.is_available():
@@ -183,23 +215,33 @@ class FirecrawlProvider(ResearchProvider):
             }
         }
 
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "url": normalize_url(url),
+            "page_options": payload["pageOptions"],
+        }
+        cached = await provider_cache.get("firecrawl", cache_request)
+        if cached:
+            return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                return {
-                    "provider": "firecrawl",
-                    "content": data.get("data", {}).get("content", ""),
-                    "sources": [{"url": url}],
-                    "cost": self.get_cost()
-                }
+            result = {
+                "provider": "firecrawl",
+                "content": data.get("data", {}).get("content", ""),
+                "sources": [{"url": url}],
+                "cost": self.get_cost()
+            }
+            await provider_cache.set("firecrawl", cache_request, result)
+            return result
         except Exception as e:
             logger.error("firecrawl_scrape_failed", error=str(e), url=url)
             return {}
@@ -237,9 +279,11 @@ class SerperProvider(ResearchProvider):
     """Serper.dev search results API"""
 
     def __init__(self):
+        self.resilience = get_resilience("serper")
         self.api_key = settings.SERPER_API_KEY
         self.api_url = "https://google.serper.dev/search"
 
+    @single_flight("serper", key=lambda query: normalize_query(query))
     async def search(self, query: str) -> Dict:
         """Get search results from Serper.dev"""
         if not self.is_available():
@@ -257,41 +301,52 @@ class SerperProvider(ResearchProvider):
             "num": 10
         }
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract search results
-                content_parts = []
-                sources = []
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "query": normalize_query(query),
+            "gl": payload["gl"],
+            "num": payload["num"],
+        }
+        cached = await provider_cache.get("serper", cache_request)
+        if cached:
+            return cached
 
-                for result in data.get("organic_results", []):
-                    content_parts.append(
-                        f"**{result.get('title')}**\n{result.get('snippet', '')}"
-                    )
-                    sources.append({
-                        "url": result.get("link"),
-                        "title": result.get("title")
-                    })
+        try:
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                # Include featured snippet if available
-                if "featured_snippet" in data:
-                    snippet = data["featured_snippet"]
-                    content_parts.insert(0, f"**Featured:** {snippet.get('snippet', '')}")
+            # Extract search results
+            content_parts = []
+            sources = []
 
-                return {
-                    "provider": "serper",
-                    "content": "\n\n".join(content_parts),
-                    "sources": sources,
-                    "cost": self.get_cost()
-                }
+            for result in data.get("organic_results", []):
+                content_parts.append(
+                    f"**{result.get('title')}**\n{result.get('snippet', '')}"
+                )
+                sources.append({
+                    "url": result.get("link"),
+                    "title": result.get("title")
+                })
+
+            # Include featured snippet if available
+            if "featured_snippet" in data:
+                snippet = data["featured_snippet"]
+                content_parts.insert(0, f"**Featured:** {snippet.get('snippet', '')}")
+
+            result = {
+                "provider": "serper",
+                "content": "\n\n".join(content_parts),
+                "sources": sources,
+                "cost": self.get_cost()
+            }
+            await provider_cache.set("serper", cache_request, result)
+            return result
         except Exception as e:
             logger.error("serper_search_failed", error=str(e))
             return {}
@@ -307,6 +362,7 @@ class CritiqueLabsProvider(ResearchProvider):
     """Critique Labs fact-checking API (DEPRECATED - use GeminiFactChecker instead)"""
 
     def __init__(self):
+        self.resilience = get_resilience("critique_labs")
         self.api_key = settings.CRITIQUE_LABS_API_KEY
         self.api_url = "https://api.critiquelabs.com/v1/fact-check"
 
@@ -328,24 +384,23 @@ class CritiqueLabsProvider(ResearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                return {
-                    "provider": "critique_labs",
-                    "accuracy_score": data.get("accuracy_score", 0),
-                    "issues": data.get("issues", []),
-                    "suggestions": data.get("suggestions", []),
-                    "verified_facts": data.get("verified_facts", []),
-                    "cost": self.get_cost()
-                }
+            return {
+                "provider": "critique_labs",
+                "accuracy_score": data.get("accuracy_score", 0),
+                "issues": data.get("issues", []),
+                "suggestions": data.get("suggestions", []),
+                "verified_facts": data.get("verified_facts", []),
+                "cost": self.get_cost()
+            }
         except Exception as e:
             logger.error("critique_labs_fact_check_failed", error=str(e))
             return {}
@@ -382,6 +437,7 @@ class GeminiFactChecker(ResearchProvider):
     """Gemini 2.0 Flash with Google Search Grounding - FREE fact-checking (replaces Critique Labs)"""
 
     def __init__(self):
+        self.resilience = get_resilience("gemini")
         self.api_key = settings.GEMINI_API_KEY
         # Initialize Gemini client if available
         try:
@@ -447,11 +503,15 @@ Provide your analysis in this JSON format:
             # Generate with Search Grounding
             config = types.GenerateContentConfig(tools=[grounding_tool])
 
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=fact_check_prompt,
-                config=config,
-            )
+            async def generate():
+                return await run_gemini(
+                    self.client.models.generate_content,
+                    model=self.model,
+                    contents=fact_check_prompt,
+                    config=config,
+                )
+
+            response = await self.resilience.call(generate)
 
             # Extract grounding metadata
             grounding_metadata = {}
@@ -535,9 +595,11 @@ class LinkUpProvider(ResearchProvider):
     """Link Up link validation API"""
 
     def __init__(self):
+        self.resilience = get_resilience("linkup")
         self.api_key = settings.LINKUP_API_KEY
         self.api_url = "https://api.linkup.so/v1/search"  # Fixed: was .dev, should be .so
 
+    @single_flight("linkup", key=lambda query: normalize_query(query))
     async def search(self, query: str) -> Dict:
         """Search with Link Up API"""
         if not self.is_available():
@@ -556,36 +618,47 @@ class LinkUpProvider(ResearchProvider):
             "includeInlineCitations": False
         }
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "query": normalize_query(query),
+            "depth": payload["depth"],
+            "output_type": payload["outputType"],
+        }
+        cached = await provider_cache.get("linkup", cache_request)
+        if cached:
+            return cached
 
-                # Extract results
-                content_parts = []
-                sources = []
+        try:
+            response = await self.resilience.request(
+                "POST",
+                self.api_url,
+                json=payload,
+                headers=headers,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                for result in data.get("results", []):
-                    content_parts.append(
-                        f"**{result.get('name')}**\n{result.get('snippet', '')}"
-                    )
-                    sources.append({
-                        "url": result.get("url"),
-                        "title": result.get("name")
-                    })
+            # Extract results
+            content_parts = []
+            sources = []
 
-                return {
-                    "provider": "linkup",
-                    "content": "\n\n".join(content_parts),
-                    "sources": sources,
-                    "cost": self.get_cost()
-                }
+            for result in data.get("results", []):
+                content_parts.append(
+                    f"**{result.get('name')}**\n{result.get('snippet', '')}"
+                )
+                sources.append({
+                    "url": result.get("url"),
+                    "title": result.get("name")
+                })
+
+            result = {
+                "provider": "linkup",
+                "content": "\n\n".join(content_parts),
+                "sources": sources,
+                "cost": self.get_cost()
+            }
+            await provider_cache.set("linkup", cache_request, result)
+            return result
         except Exception as e:
             logger.error("linkup_search_failed", error=str(e))
             return {}
@@ -601,6 +674,7 @@ class DataForSEOProvider(ResearchProvider):
     """DataForSEO - Keyword validation, SEO metrics, AND SERP analysis"""
 
     def __init__(self):
+        self.resilience = get_resilience("dataforseo")
         self.login = settings.DATAFORSEO_LOGIN
         self.password = settings.DATAFORSEO_PASSWORD
 
@@ -614,6 +688,11 @@ class DataForSEOProvider(ResearchProvider):
         self.keywords_api_url = "https://api.dataforseo.com/v3/keywords_data/google_ads/search_volume/live"
         self.serp_api_url = "https://api.dataforseo.com/v3/serp/google/organic/live/advanced"
 
+    @single_flight(
+        "dataforseo_keywords",
+        key=lambda keywords, location_code=2826: f"{location_code}:{'|'.join(keywords[:20])}",
+        cross_process=False  # Not cached, so other processes gain nothing by waiting
+    )
     async def validate_keywords(self, keywords: List[str], location_code: int = 2826) -> Dict:
         """
         Validate keyword SEO value
@@ -650,45 +729,48 @@ class DataForSEOProvider(ResearchProvider):
         }]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.keywords_api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.resilience.request(
+                "POST",
+                self.keywords_api_url,
+                headers=headers,
+                json=payload,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                # Extract keyword data from response
-                validated = []
-                if data.get("tasks") and data["tasks"][0].get("result"):
-                    results = data["tasks"][0]["result"]
+            # Extract keyword data from response
+            validated = []
+            if data.get("tasks") and data["tasks"][0].get("result"):
+                results = data["tasks"][0]["result"]
 
-                    for item in results:
-                        if isinstance(item, dict) and item.get("keyword"):
-                            validated.append({
-                                "keyword": item["keyword"],
-                                "search_volume": item.get("search_volume") or 0,
-                                "competition": item.get("competition", "unknown"),
-                                "cpc": item.get("cpc") or 0,
-                                "competition_level": item.get("competition_level", "unknown")
-                            })
+                for item in results:
+                    if isinstance(item, dict) and item.get("keyword"):
+                        validated.append({
+                            "keyword": item["keyword"],
+                            "search_volume": item.get("search_volume") or 0,
+                            "competition": item.get("competition", "unknown"),
+                            "cpc": item.get("cpc") or 0,
+                            "competition_level": item.get("competition_level", "unknown")
+                        })
 
-                    # Sort by search volume
-                    validated.sort(key=lambda x: x.get("search_volume", 0) or 0, reverse=True)
+                # Sort by search volume
+                validated.sort(key=lambda x: x.get("search_volume", 0) or 0, reverse=True)
 
-                logger.info("dataforseo_validation_complete", keywords_validated=len(validated))
+            logger.info("dataforseo_validation_complete", keywords_validated=len(validated))
 
-                return {
-                    "provider": "dataforseo",
-                    "keywords": validated,
-                    "cost": self.get_cost()
-                }
+            return {
+                "provider": "dataforseo",
+                "keywords": validated,
+                "cost": self.get_cost()
+            }
         except Exception as e:
             logger.error("dataforseo_validation_failed", error=str(e))
             return {}
 
+    @single_flight(
+        "dataforseo_serp",
+        key=lambda query, location_code=2840: f"{location_code}:{normalize_query(query)}"
+    )
     async def get_serp_results(self, query: str, location_code: int = 2840) -> Dict:
         """
         Get SERP results from Google (REPLACES Serper.dev)
@@ -724,86 +806,97 @@ class DataForSEOProvider(ResearchProvider):
             "depth": 10  # Get top 10 results
         }]
 
+        # Same request within the provider's TTL → reuse the paid response
+        cache_request = {
+            "query": normalize_query(query),
+            "location_code": location_code,
+            "depth": payload[0]["depth"],
+        }
+        cached = await provider_cache.get("dataforseo_serp", cache_request)
+        if cached:
+            return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.serp_api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0,
+            response = await self.resilience.request(
+                "POST",
+                self.serp_api_url,
+                headers=headers,
+                json=payload,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # Extract SERP results
+            content_parts = []
+            sources = []
+            featured_snippet = None
+            people_also_ask = []
+
+            if data.get("tasks") and data["tasks"][0].get("result"):
+                results = data["tasks"][0]["result"]
+
+                for result in results:
+                    items = result.get("items", [])
+
+                    for item in items:
+                        item_type = item.get("type", "")
+
+                        # Featured snippet
+                        if item_type == "featured_snippet":
+                            featured_snippet = item.get("description", "")
+                            content_parts.append(f"**Featured Snippet:**\n{featured_snippet}")
+
+                        # Organic results
+                        elif item_type == "organic":
+                            title = item.get("title", "")
+                            description = item.get("description", "")
+                            url = item.get("url", "")
+                            rank = item.get("rank_absolute", 0)
+
+                            if url:
+                                content_parts.append(
+                                    f"**[{rank}] {title}**\n{description}"
+                                )
+                                sources.append({
+                                    "url": url,
+                                    "title": title,
+                                    "rank": rank,
+                                    "type": "organic"
+                                })
+
+                        # People Also Ask
+                        elif item_type == "people_also_ask":
+                            question = item.get("title", "")
+                            if question:
+                                people_also_ask.append(question)
+
+            # Add PAA to content
+            if people_also_ask:
+                content_parts.append(
+                    f"\n**People Also Ask:**\n" +
+                    "\n".join([f"- {q}" for q in people_also_ask[:5]])
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract SERP results
-                content_parts = []
-                sources = []
-                featured_snippet = None
-                people_also_ask = []
-
-                if data.get("tasks") and data["tasks"][0].get("result"):
-                    results = data["tasks"][0]["result"]
-
-                    for result in results:
-                        items = result.get("items", [])
-
-                        for item in items:
-                            item_type = item.get("type", "")
-
-                            # Featured snippet
-                            if item_type == "featured_snippet":
-                                featured_snippet = item.get("description", "")
-                                content_parts.append(f"**Featured Snippet:**\n{featured_snippet}")
-
-                            # Organic results
-                            elif item_type == "organic":
-                                title = item.get("title", "")
-                                description = item.get("description", "")
-                                url = item.get("url", "")
-                                rank = item.get("rank_absolute", 0)
-
-                                if url:
-                                    content_parts.append(
-                                        f"**[{rank}] {title}**\n{description}"
-                                    )
-                                    sources.append({
-                                        "url": url,
-                                        "title": title,
-                                        "rank": rank,
-                                        "type": "organic"
-                                    })
-
-                            # People Also Ask
-                            elif item_type == "people_also_ask":
-                                question = item.get("title", "")
-                                if question:
-                                    people_also_ask.append(question)
-
-                # Add PAA to content
-                if people_also_ask:
-                    content_parts.append(
-                        f"\n**People Also Ask:**\n" +
-                        "\n".join([f"- {q}" for q in people_also_ask[:5]])
-                    )
 
-                logger.info(
-                    "dataforseo_serp.complete",
-                    urls_found=len(sources),
-                    featured_snippet=bool(featured_snippet),
-                    paa_count=len(people_also_ask)
-                )
+            logger.info(
+                "dataforseo_serp.complete",
+                urls_found=len(sources),
+                featured_snippet=bool(featured_snippet),
+                paa_count=len(people_also_ask)
+            )
 
-                return {
-                    "provider": "dataforseo_serp",
-                    "content": "\n\n".join(content_parts),
-                    "sources": sources,
-                    "serp_data": {
-                        "featured_snippet": featured_snippet,
-                        "people_also_ask": people_also_ask,
-                        "total_results": len(sources)
-                    },
-                    "cost": Decimal("0.003")  # $0.003 per query (94% cheaper than Serper!)
-                }
+            result = {
+                "provider": "dataforseo_serp",
+                "content": "\n\n".join(content_parts),
+                "sources": sources,
+                "serp_data": {
+                    "featured_snippet": featured_snippet,
+                    "people_also_ask": people_also_ask,
+                    "total_results": len(sources)
+                },
+                "cost": Decimal("0.003")  # $0.003 per query (94% cheaper than Serper!)
+            }
+            await provider_cache.set("dataforseo_serp", cache_request, result)
+            return result
         except Exception as e:
             logger.error("dataforseo_serp_failed", error=str(e))
             return {}
@@ -880,7 +973,9 @@ class MultiAPIResearch:
         if not urls or not self.providers["firecrawl"].is_available():
             return {"content": "", "sources": [], "cost": Decimal("0")}
 
-        firecrawl = self.providers["firecrawl"]
+        # Shared with TemplateDetector (imported here to avoid a circular import)
+        from app.core.scrape_service import scrape_service
+
         results = []
         total_cost = Decimal("0")
 
@@ -892,19 +987,16 @@ class MultiAPIResearch:
             url_count=len(urls_to_scrape)
         )
 
-        # Scrape each URL
-        for url in urls_to_scrape:
-            try:
-                result = await firecrawl.scrape(url)
-                if result and result.get("content"):
-                    results.append({
-                        "url": url,
-                        "content": result["content"][:3000]  # Limit to 3000 chars per URL
-                    })
-                    total_cost += result.get("cost", Decimal("0"))
-            except Exception as e:
-                logger.warning("firecrawl.scrape_failed", url=url, error=str(e))
-                continue
+        # Scrape all URLs concurrently
+        scraped = await scrape_service.scrape_many(urls_to_scrape)
+
+        for url, result in zip(urls_to_scrape, scraped):
+            if result and result.get("content"):
+                results.append({
+                    "url": url,
+                    "content": result["content"][:3000]  # Limit to 3000 chars per URL
+                })
+                total_cost += result.get("cost", Decimal("0"))
 
         if not results:
             return {"content": "", "sources": [], "cost": Decimal("0")}
@@ -936,22 +1028,28 @@ class MultiAPIResearch:
         self,
         query: str,
         use_all: bool = False,
-        fact_check: bool = False
+        fact_check: bool = False,
+        on_result: Optional[Callable[[str, Dict], Awaitable[None]]] = None
     ) -> Dict:
         """
         Perform research using available APIs
 
-        Optimal Flow (when use_all=True):
-        1. Serper → Get top 10 competitor URLs
-        2. Firecrawl → Scrape competitor content
-        3. Perplexity → Gap analysis
-        4. Tavily → Additional research
-        5. LinkUp → Validation (if not rate limited)
+        Optimal Flow (when use_all=True), all started at once:
+        - DataForSEO SERP → Firecrawl scrape of competitor URLs
+        - Perplexity → Gap analysis
+        - Tavily → Additional research
+        - LinkUp → Validation (if not rate limited)
+
+        Whatever has arrived by RESEARCH_DEADLINE_SECONDS is combined; the
+        rest is cancelled. Provider calls cut off mid-flight may already have
+        been billed, so their nominal cost is included in total_cost.
 
         Args:
             query: Research query
             use_all: Use all available APIs for comprehensive research
             fact_check: Run fact-checking on results
+            on_result: Called with (provider, result) as each provider
+                returns, for streaming partial results (use_all only)
 
         Returns:
             Combined research results
@@ -959,52 +1057,14 @@ class MultiAPIResearch:
         results = []
         total_cost = Decimal("0")
         providers_used = []
-        competitor_urls = []
 
         if use_all:
-            # STEP 1: Get competitor URLs from DataForSEO SERP (replaces Serper, 94% cheaper!)
-            if self.providers["dataforseo"].is_available():
-                logger.info("research.running_dataforseo_serp_first")
-                serp_result = await self._search_with_provider("dataforseo", self.providers["dataforseo"], query)
-                if serp_result:
-                    results.append(serp_result)
-                    total_cost += serp_result.get("cost", Decimal("0"))
-                    providers_used.append("dataforseo_serp")
-
-                    # Extract competitor URLs from SERP results
-                    competitor_urls = [
-                        source["url"] for source in serp_result.get("sources", [])
-                        if source.get("url")
-                    ]
-                    logger.info("research.dataforseo_urls_found", url_count=len(competitor_urls))
-
-            # STEP 2: Scrape competitor URLs with Firecrawl
-            if competitor_urls and self.providers["firecrawl"].is_available():
-                logger.info("research.scraping_competitors", url_count=len(competitor_urls))
-                firecrawl_result = await self.scrape_competitor_urls(competitor_urls, max_urls=5)
-                if firecrawl_result and firecrawl_result.get("content"):
-                    results.append(firecrawl_result)
-                    total_cost += firecrawl_result.get("cost", Decimal("0"))
-                    providers_used.append("firecrawl")
-                    logger.info("research.firecrawl_success")
-
-            # STEP 3: Run remaining providers in parallel
-            tasks = []
-            for name, provider in self.providers.items():
-                # Skip already-run providers and fact-checkers
-                if name in ["dataforseo", "firecrawl", "critique_labs", "gemini_fact_checker", "serper"]:
-                    continue
-                if provider.is_available():
-                    tasks.append(self._search_with_provider(name, provider, query))
-
-            if tasks:
-                logger.info("research.running_parallel_providers", count=len(tasks))
-                provider_results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in provider_results:
-                    if isinstance(result, dict) and result:
-                        results.append(result)
-                        total_cost += result.get("cost", Decimal("0"))
-                        providers_used.append(result.get("provider"))
+            collected, abandoned = await self._run_research_plan(query, on_result)
+            for provider_name, result in collected:
+                results.append(result)
+                total_cost += result.get("cost", Decimal("0"))
+                providers_used.append(provider_name)
+            total_cost += sum(abandoned.values(), Decimal("0"))
         else:
             # Use priority chain with fallback
             for provider_name in self.priority_chain:
@@ -1056,13 +1116,159 @@ class MultiAPIResearch:
             "total_cost": total_cost
         }
 
+    async def _run_research_plan(
+        self,
+        query: str,
+        on_result: Optional[Callable[[str, Dict], Awaitable[None]]] = None
+    ) -> Tuple[List[Tuple[str, Dict]], Dict[str, Decimal]]:
+        """
+        Run every research provider concurrently under one deadline
+
+        The AI providers don't need the SERP, so they start alongside the
+        DataForSEO SERP → Firecrawl chain instead of after it.
+
+        Returns:
+            (provider, result) pairs in plan order (stable regardless of
+            which provider answered first), and provider → nominal cost of
+            the calls the deadline cancelled in flight
+        """
+        collected: Dict[str, Dict] = {}
+        abandoned: Dict[str, Decimal] = {}
+
+        async def metered(provider_name: str, cost: Decimal, call: Awaitable):
+            try:
+                return await call
+            except asyncio.CancelledError:
+                # The request may already have been sent (and billed)
+                abandoned[provider_name] = cost
+                raise
+
+        async def record(provider_name: str, result: Optional[Dict]):
+            if not result:
+                return
+            collected[provider_name] = result
+            if on_result is not None:
+                try:
+                    await on_result(provider_name, result)
+                except Exception as e:
+                    logger.warning("research.on_result_failed", provider=provider_name, error=str(e))
+
+        async def serp_chain():
+            # STEP 1: Get competitor URLs from DataForSEO SERP (replaces Serper, 94% cheaper!)
+            serp_result = await metered(
+                "dataforseo_serp",
+                self.providers["dataforseo"].get_cost(),
+                self._search_with_provider("dataforseo", self.providers["dataforseo"], query)
+            )
+            await record("dataforseo_serp", serp_result)
+            if not serp_result:
+                return
+
+            # Extract competitor URLs from SERP results
+            competitor_urls = [
+                source["url"] for source in serp_result.get("sources", [])
+                if source.get("url")
+            ]
+            logger.info("research.dataforseo_urls_found", url_count=len(competitor_urls))
+
+            # STEP 2: Scrape competitor URLs with Firecrawl
+            if competitor_urls and self.providers["firecrawl"].is_available():
+                logger.info("research.scraping_competitors", url_count=len(competitor_urls))
+                firecrawl_result = await metered(
+                    "firecrawl",
+                    self.providers["firecrawl"].get_cost() * len(competitor_urls[:5]),
+                    self.scrape_competitor_urls(competitor_urls, max_urls=5)
+                )
+                if firecrawl_result and firecrawl_result.get("content"):
+                    await record("firecrawl", firecrawl_result)
+                    logger.info("research.firecrawl_success")
+
+        async def search(provider_name: str, provider: ResearchProvider):
+            await record(provider_name, await metered(
+                provider_name,
+                provider.get_cost(),
+                self._search_with_provider(provider_name, provider, query)
+            ))
+
+        plan = []
+        branches = {}
+        if self.providers["dataforseo"].is_available():
+            plan += ["dataforseo_serp", "firecrawl"]
+            branches["serp_chain"] = serp_chain()
+
+        # STEP 3: Remaining providers, started at the same time
+        for name, provider in self.providers.items():
+            # Skip SERP/scrape providers and fact-checkers
+            if name in ["dataforseo", "firecrawl", "critique_labs", "gemini_fact_checker", "serper"]:
+                continue
+            if provider.is_available():
+                plan.append(name)
+                branches[name] = search(name, provider)
+
+        if not branches:
+            return [], abandoned
+
+        logger.info("research.running_parallel_providers", branches=list(branches))
+
+        tasks = {asyncio.ensure_future(branch): name for name, branch in branches.items()}
+        deadline = settings.RESEARCH_DEADLINE_SECONDS
+        started = time.monotonic()
+
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline or None)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                "research.deadline_reached",
+                deadline=deadline,
+                unfinished=[tasks[task] for task in pending],
+                results_so_far=len(collected),
+                abandoned_providers=sorted(abandoned),
+                abandoned_cost=float(sum(abandoned.values(), Decimal("0")))
+            )
+
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    "research.branch_failed",
+                    branch=tasks[task],
+                    error=str(task.exception())
+                )
+
+        logger.info(
+            "research.plan_complete",
+            providers=[name for name in plan if name in collected],
+            wall_seconds=round(time.monotonic() - started, 1)
+        )
+
+        return [(name, collected[name]) for name in plan if name in collected], abandoned
+
     async def _search_with_provider(
         self,
         name: str,
         provider: ResearchProvider,
         query: str
     ) -> Optional[Dict]:
-        """Search with a specific provider"""
+        """
+        Search with a specific provider
+
+        Providers retry transient failures themselves (see
+        app.core.resilience); a provider whose circuit is open is skipped
+        without a request so the fallback chain moves on immediately.
+        """
+        resilience = getattr(provider, "resilience", None)
+        if resilience and not resilience.allow():
+            logger.warning(
+                "research.provider_circuit_open",
+                provider=name,
+                retry_in=round(resilience.breaker.retry_in())
+            )
+            return None
+
         try:
             logger.debug(f"research.trying_provider", provider=name)
             result = await provider.search(query)
@@ -1076,7 +1282,8 @@ class MultiAPIResearch:
             logger.error(
                 f"research.provider_failed",
                 provider=name,
-                error=str(e)
+                error=str(e),
+                error_type=type(e).__name__
             )
             return None
 
@@ -0,0 +1,173 @@
+"""
+Quest Platform v2.2 - Research Blob Store
+Compressed, content-addressed storage for large research payloads
+"""
+
+import asyncio
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.payload_codec import dump_json, load_json
+from app.core.research_payload_cache import research_payload_cache
+
+logger = structlog.get_logger(__name__)
+
+# zstd needs the optional zstandard package; fall back to zlib (blobs record
+# their codec, so both kinds can be read side by side)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Sections of a cluster_research row stored as blobs
+SECTIONS = ("research_data", "seo_data", "serp_analysis", "ai_insights")
+
+
+class ResearchBlobStore:
+    """
+    Research payloads in research_blobs, keyed by the SHA-256 of their JSON
+
+    - Identical payloads (e.g. the same provider output saved for two
+      clusters) are stored once
+    - Blobs are compressed before they reach Postgres (zstd, else zlib), and
+      the column skips TOAST compression (see migration 009)
+    - Rows hold only blob hashes, so a reader fetches just the sections it
+      needs. Blobs are immutable, so reads go through the research payload
+      cache without any invalidation.
+    """
+
+    def __init__(self):
+        self.enabled = settings.RESEARCH_BLOB_STORAGE_ENABLED
+        self.level = settings.RESEARCH_BLOB_COMPRESSION_LEVEL
+        self.codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+
+    def encode(self, value: Any) -> Tuple[str, bytes, int]:
+        """
+        Content address and compressed bytes of a payload
+
+        Args:
+            value: JSON-serializable payload (a JSON string is parsed first)
+
+        Returns:
+            (hash, compressed bytes, uncompressed size)
+        """
+        if isinstance(value, str):
+            value = json.loads(value)
+
+        raw = dump_json(value, sort_keys=True).encode()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if self.codec == "zstd":
+            data = zstandard.ZstdCompressor(level=self.level).compress(raw)
+        else:
+            data = zlib.compress(raw, min(self.level, 9))
+
+        return digest, data, len(raw)
+
+    @staticmethod
+    def decode(codec: str, data: bytes) -> Any:
+        if codec == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required to read zstd research blobs")
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            raw = zlib.decompress(data)
+        return load_json(raw.decode())
+
+    async def put_many(self, values: Iterable[Any], conn=None) -> List[Optional[str]]:
+        """
+        Store payloads (deduplicated)
+
+        Args:
+            values: Payloads (None stays None)
+            conn: Connection to use, e.g. inside the caller's transaction
+
+        Returns:
+            Blob hash per payload, in order
+        """
+        values = list(values)
+        encoded = [self.encode(value) if value is not None else None for value in values]
+        rows = {entry[0]: entry for entry in encoded if entry is not None}
+
+        if rows:
+            query = """
+                INSERT INTO research_blobs (hash, codec, data, raw_bytes, stored_bytes)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (hash) DO NOTHING
+            """
+            args = [
+                (digest, self.codec, data, raw_bytes, len(data))
+                for digest, data, raw_bytes in rows.values()
+            ]
+
+            if conn is None:
+                pool = get_db()
+                async with pool.acquire() as conn:
+                    await conn.executemany(query, args)
+            else:
+                await conn.executemany(query, args)
+
+            logger.debug(
+                "research_blobs.stored",
+                blobs=len(rows),
+                raw_bytes=sum(entry[2] for entry in rows.values()),
+                stored_bytes=sum(len(entry[1]) for entry in rows.values())
+            )
+
+        return [entry[0] if entry is not None else None for entry in encoded]
+
+    async def get(self, digest: str) -> Any:
+        """
+        Read one payload (through the research payload cache)
+
+        Args:
+            digest: Blob hash
+
+        Returns:
+            Payload
+
+        Raises:
+            KeyError: If no blob has this hash
+        """
+        entry = await research_payload_cache.get_or_load("blob", digest, lambda: self._fetch(digest))
+        if entry is None:
+            raise KeyError(f"Research blob {digest} not found")
+        return entry["value"]
+
+    async def get_many(self, digests: Iterable[str]) -> Dict[str, Any]:
+        """
+        Read payloads concurrently
+
+        Args:
+            digests: Blob hashes
+
+        Returns:
+            hash → payload
+        """
+        digests = list(dict.fromkeys(digests))
+        values = await asyncio.gather(*(self.get(digest) for digest in digests))
+        return dict(zip(digests, values))
+
+    async def _fetch(self, digest: str) -> Optional[Dict]:
+        pool = get_db()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT codec, data FROM research_blobs WHERE hash = $1",
+                digest
+            )
+
+        if row is None:
+            return None
+
+        return {"value": self.decode(row["codec"], row["data"])}
+
+
+# Global research blob store
+research_blob_store = ResearchBlobStore()
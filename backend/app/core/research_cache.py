@@ -16,10 +16,15 @@ Architecture:
 - Cache key includes cluster_id + research_tier
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime, timedelta, timezone
 import structlog
+from app.core.cluster_matcher import cluster_matcher
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.research_blobs import SECTIONS, research_blob_store
+from app.core.research_payload_cache import research_payload_cache
+from app.core.reuse_counters import reuse_counters
 
 logger = structlog.get_logger()
 
@@ -34,7 +39,8 @@ class ClusterResearchCache:
     - remote_work: All remote work strategies
     """
 
-    # Topic cluster definitions (expand as you add topics)
+    # Built-in topic cluster definitions, matched together with the
+    # topic_clusters table (see cluster_matcher)
     TOPIC_CLUSTERS = {
         "portugal_digital_nomad": {
             "keywords": ["portugal", "d7", "digital nomad visa", "golden visa", "nhr"],
@@ -80,31 +86,41 @@ class ClusterResearchCache:
         """
         Identify which cluster a topic belongs to
 
+        The best-scoring cluster wins, so a topic matching keywords of
+        several clusters goes to the one it matches most specifically.
+
         Args:
             topic: Article topic (e.g., "Portugal D7 Visa 2025 Guide")
 
         Returns:
             Cluster info dict or None if no match
         """
-        topic_lower = topic.lower()
+        match = await cluster_matcher.match(topic)
 
-        for cluster_name, cluster_info in self.TOPIC_CLUSTERS.items():
-            # Check if any cluster keywords appear in topic
-            if any(keyword in topic_lower for keyword in cluster_info["keywords"]):
-                return {
-                    "cluster_id": cluster_name,
-                    "priority": cluster_info["priority"],
-                    "research_tier": cluster_info["research_tier"]
-                }
+        if not match:
+            return None
 
-        return None
+        logger.debug(
+            "research_cache.cluster_matched",
+            topic=topic,
+            cluster_id=match["cluster_id"],
+            score=match["score"],
+            keywords=[m["keyword"] for m in match["matches"]]
+        )
 
-    async def get_research(self, topic: str) -> Optional[Dict]:
+        return {
+            "cluster_id": match["cluster_id"],
+            "priority": match["priority"],
+            "research_tier": match["research_tier"]
+        }
+
+    async def get_research(self, topic: str, sections: Sequence[str] = SECTIONS) -> Optional[Dict]:
         """
         Check cluster cache before running expensive research
 
         Args:
             topic: Article topic
+            sections: Payload sections to load (others are not fetched)
 
         Returns:
             Cached research dict or None if no cache hit
@@ -117,57 +133,50 @@ class ClusterResearchCache:
 
         cluster_id = cluster["cluster_id"]
 
-        # Query cluster_research table
-        query = """
-            SELECT
-                research_data,
-                seo_data,
-                serp_analysis,
-                ai_insights,
-                reuse_count,
-                created_at
-            FROM cluster_research
-            WHERE cluster_id = $1
-              AND expires_at > NOW()
-            ORDER BY created_at DESC
-            LIMIT 1
-        """
-
-        pool = get_db()
-        async with pool.acquire() as conn:
-            result = await conn.fetchrow(query, cluster_id)
+        result = await research_payload_cache.get_or_load(
+            "cluster",
+            cluster_id,
+            lambda: self._load_research(cluster_id)
+        )
 
-            if result:
-                # Increment reuse counter
-                await conn.execute(
-                    "UPDATE cluster_research SET reuse_count = reuse_count + 1 WHERE cluster_id = $1",
-                    cluster_id
-                )
+        if result:
+            # Counted write-behind, so a hit takes no row lock
+            pending_reuses = await reuse_counters.record(cluster_id)
 
             # Make created_at timezone-aware if it isn't already
             created_at = result["created_at"]
             if created_at.tzinfo is None:
                 created_at = created_at.replace(tzinfo=timezone.utc)
 
-            age_days = (datetime.now(timezone.utc) - created_at).days
+            now = datetime.now(timezone.utc)
+            age_days = (now - created_at).days
+
+            # Past expiry (within the grace period) or marked stale: still
+            # served, the caller schedules a background refresh
+            expires_at = result["expires_at"]
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            stale = bool(result.get("is_stale")) or expires_at <= now
+            refresh_due = stale or expires_at - now < timedelta(days=settings.CLUSTER_REFRESH_AHEAD_DAYS)
 
             logger.info(
                 "research_cache.hit",
                 cluster_id=cluster_id,
                 topic=topic,
-                reuse_count=result["reuse_count"] + 1,
+                reuse_count=result["reuse_count"] + pending_reuses,
                 cost_saved=0.25,
-                age_days=age_days
+                age_days=age_days,
+                stale=stale
             )
 
             return {
                 "cluster_id": cluster_id,
-                "research_data": result["research_data"],
-                "seo_data": result["seo_data"],
-                "serp_analysis": result["serp_analysis"],
-                "ai_insights": result["ai_insights"],
+                **await self._load_sections(result, sections),
                 "cached": True,
-                "cache_age_days": age_days
+                "cache_age_days": age_days,
+                "stale": stale,
+                "refresh_due": refresh_due,
+                "source_topic": result.get("source_topic") or topic
             }
 
         logger.info(
@@ -177,13 +186,67 @@ class ClusterResearchCache:
         )
         return None
 
+    async def _load_research(self, cluster_id: str) -> Optional[Dict]:
+        """
+        Latest servable research row for a cluster (the cache's database tier)
+
+        Expired rows stay servable for CLUSTER_RESEARCH_STALE_GRACE_DAYS
+        (serve_until), so the refresh happens in the background instead of
+        on the first article after expiry.
+        """
+        # Blob-backed sections are only hashes here (fetched per section by
+        # _load_sections); rows not yet converted still carry inline JSONB
+        query = """
+            SELECT
+                research_data_hash,
+                seo_data_hash,
+                serp_analysis_hash,
+                ai_insights_hash,
+                CASE WHEN research_data_hash IS NULL THEN research_data END AS research_data,
+                CASE WHEN seo_data_hash IS NULL THEN seo_data END AS seo_data,
+                CASE WHEN serp_analysis_hash IS NULL THEN serp_analysis END AS serp_analysis,
+                CASE WHEN ai_insights_hash IS NULL THEN ai_insights END AS ai_insights,
+                reuse_count,
+                created_at,
+                expires_at,
+                expires_at + make_interval(days => $2) AS serve_until,
+                is_stale,
+                source_topic
+            FROM cluster_research
+            WHERE cluster_id = $1
+              AND expires_at > NOW() - make_interval(days => $2)
+            ORDER BY created_at DESC
+            LIMIT 1
+        """
+
+        pool = get_db()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(query, cluster_id, settings.CLUSTER_RESEARCH_STALE_GRACE_DAYS)
+
+        return dict(row) if row else None
+
+    async def _load_sections(self, row: Dict, sections: Sequence[str]) -> Dict:
+        """Requested sections of a research row, reading blobs only for those"""
+        digests = {
+            section: row[f"{section}_hash"]
+            for section in sections
+            if row.get(f"{section}_hash")
+        }
+        blobs = await research_blob_store.get_many(digests.values()) if digests else {}
+
+        return {
+            section: blobs[digests[section]] if section in digests else row[section]
+            for section in sections
+        }
+
     async def save_research(
         self,
         topic: str,
         research_data: Dict,
         seo_data: Optional[Dict] = None,
         serp_analysis: Optional[Dict] = None,
-        ai_insights: Optional[Dict] = None
+        ai_insights: Optional[Dict] = None,
+        cluster_id: Optional[str] = None
     ) -> bool:
         """
         Save research to cluster cache
@@ -194,18 +257,22 @@ class ClusterResearchCache:
             seo_data: DataForSEO keyword data
             serp_analysis: Serper/DataForSEO SERP data
             ai_insights: Perplexity/Tavily narrative research
+            cluster_id: Cluster to save under (default: identified from topic)
 
         Returns:
             True if saved successfully
         """
-        cluster = await self.identify_cluster(topic)
+        if cluster_id is None:
+            cluster = await self.identify_cluster(topic)
 
-        if not cluster:
-            logger.warning("research_cache.save_failed_no_cluster", topic=topic)
-            return False
+            if not cluster:
+                logger.warning("research_cache.save_failed_no_cluster", topic=topic)
+                return False
+
+            cluster_id = cluster["cluster_id"]
 
-        cluster_id = cluster["cluster_id"]
         expires_at = datetime.now(timezone.utc) + timedelta(days=90)
+        payload = [research_data, seo_data or {}, serp_analysis or {}, ai_insights or {}]
 
         # Insert or update cluster research
         query = """
@@ -215,31 +282,53 @@ class ClusterResearchCache:
                 seo_data,
                 serp_analysis,
                 ai_insights,
+                research_data_hash,
+                seo_data_hash,
+                serp_analysis_hash,
+                ai_insights_hash,
                 reuse_count,
                 expires_at,
+                source_topic,
+                is_stale,
                 created_at
-            ) VALUES ($1, $2, $3, $4, $5, 0, $6, NOW())
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, 0, $10, $11, false, NOW())
             ON CONFLICT (cluster_id)
             DO UPDATE SET
                 research_data = EXCLUDED.research_data,
                 seo_data = EXCLUDED.seo_data,
                 serp_analysis = EXCLUDED.serp_analysis,
                 ai_insights = EXCLUDED.ai_insights,
+                research_data_hash = EXCLUDED.research_data_hash,
+                seo_data_hash = EXCLUDED.seo_data_hash,
+                serp_analysis_hash = EXCLUDED.serp_analysis_hash,
+                ai_insights_hash = EXCLUDED.ai_insights_hash,
                 expires_at = EXCLUDED.expires_at,
+                source_topic = EXCLUDED.source_topic,
+                is_stale = false,
                 created_at = NOW()
         """
 
         pool = get_db()
         async with pool.acquire() as conn:
-            await conn.execute(
-                query,
-                cluster_id,
-                research_data,
-                seo_data or {},
-                serp_analysis or {},
-                ai_insights or {},
-                expires_at
-            )
+            async with conn.transaction():
+                if research_blob_store.enabled:
+                    # Compressed blobs; the JSONB columns stay empty
+                    hashes = await research_blob_store.put_many(payload, conn=conn)
+                    inline = [None] * len(payload)
+                else:
+                    hashes = [None] * len(payload)
+                    inline = payload
+
+                await conn.execute(
+                    query,
+                    cluster_id,
+                    *inline,
+                    *hashes,
+                    expires_at,
+                    topic
+                )
+
+        await research_payload_cache.invalidate("cluster", cluster_id)
 
         logger.info(
             "research_cache.saved",
@@ -250,6 +339,26 @@ class ClusterResearchCache:
 
         return True
 
+    async def mark_stale(self, cluster_id: str):
+        """
+        Mark a cluster's research stale
+
+        It is still served until the refresher has replaced it.
+
+        Args:
+            cluster_id: Cluster ID
+        """
+        pool = get_db()
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE cluster_research SET is_stale = true WHERE cluster_id = $1",
+                cluster_id
+            )
+
+        await research_payload_cache.invalidate("cluster", cluster_id)
+
+        logger.info("research_cache.marked_stale", cluster_id=cluster_id)
+
     async def get_cache_stats(self) -> Dict:
         """
         Get cache performance statistics
@@ -259,20 +368,23 @@ class ClusterResearchCache:
         """
         query = """
             SELECT
-                COUNT(*) as cluster_count,
-                SUM(reuse_count) as total_reuses,
-                AVG(reuse_count) as avg_reuses_per_cluster,
-                MAX(reuse_count) as max_reuses,
-                SUM(CASE WHEN expires_at < NOW() THEN 1 ELSE 0 END) as expired_count
+                cluster_id,
+                reuse_count,
+                expires_at < NOW() as expired
             FROM cluster_research
         """
 
         pool = get_db()
         async with pool.acquire() as conn:
-            stats = await conn.fetchrow(query)
+            rows = await conn.fetch(query)
+
+        # Stored counts plus reuses not yet flushed
+        pending = await reuse_counters.pending()
+        reuses = [(row["reuse_count"] or 0) + pending.get(row["cluster_id"], 0) for row in rows]
 
-        total_reuses = stats["total_reuses"] or 0
-        cluster_count = stats["cluster_count"] or 0
+        total_reuses = sum(reuses)
+        cluster_count = len(rows)
+        expired_count = sum(1 for row in rows if row["expired"])
 
         # Calculate cost savings
         cost_per_research = 0.25
@@ -286,10 +398,13 @@ class ClusterResearchCache:
         return {
             "cluster_count": cluster_count,
             "total_reuses": total_reuses,
-            "avg_reuses_per_cluster": float(stats["avg_reuses_per_cluster"] or 0),
-            "max_reuses": stats["max_reuses"] or 0,
-            "expired_count": stats["expired_count"] or 0,
+            "avg_reuses_per_cluster": total_reuses / cluster_count if cluster_count else 0.0,
+            "max_reuses": max(reuses, default=0),
+            "expired_count": expired_count,
             "hit_rate_percent": round(hit_rate, 2),
             "cost_saved_usd": round(cost_saved, 2),
-            "active_clusters": cluster_count - (stats["expired_count"] or 0)
+            "active_clusters": cluster_count - expired_count
         }
+
+
+cluster_matcher.register_builtin(ClusterResearchCache.TOPIC_CLUSTERS)
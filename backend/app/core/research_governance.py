@@ -12,8 +12,10 @@ from typing import Optional, Dict, List
 from enum import Enum
 from decimal import Decimal
 
+from app.core.cluster_matcher import cluster_matcher
 from app.core.database import get_db
-from app.core.config import settings
+from app.core.research_payload_cache import research_payload_cache
+from app.core.reuse_counters import reuse_counters
 
 logger = structlog.get_logger(__name__)
 
@@ -127,21 +129,26 @@ class ResearchGovernance:
         """
         Find which cluster this topic belongs to
 
-        Uses smart matching:
-        1. Exact keyword match
-        2. Fuzzy keyword match
-        3. Similarity to cluster name
+        Uses the in-process cluster matcher: every topic_clusters keyword
+        (primary and secondary) is matched in one pass over the topic and
+        the best-scoring cluster wins.
         """
-        async with self.pool.acquire() as conn:
-            # Use the database function we created
-            cluster_id = await conn.fetchval(
-                "SELECT find_cluster_for_topic($1)",
-                topic
-            )
+        match = await cluster_matcher.match(topic, db_only=True)
+
+        if not match:
+            return None
 
-            if not cluster_id:
-                return None
+        cluster_id = match["id"]
 
+        logger.debug(
+            "research_governance.cluster_matched",
+            topic=topic,
+            cluster=match["name"],
+            score=match["score"],
+            keywords=[m["keyword"] for m in match["matches"]]
+        )
+
+        async with self.pool.acquire() as conn:
             # Load full cluster data
             row = await conn.fetchrow("""
                 SELECT
@@ -165,7 +172,16 @@ class ResearchGovernance:
             )
 
     async def get_cluster_with_research(self, cluster_id: int) -> TopicCluster:
-        """Get cluster with its most recent research data"""
+        """Get cluster with its most recent research data (cached, see research_payload_cache)"""
+        row = await research_payload_cache.get_or_load(
+            "governance",
+            cluster_id,
+            lambda: self._load_cluster_with_research(cluster_id)
+        )
+
+        return TopicCluster(row)
+
+    async def _load_cluster_with_research(self, cluster_id: int) -> Optional[Dict]:
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow("""
                 SELECT
@@ -177,6 +193,7 @@ class ResearchGovernance:
                     cr.ai_insights,
                     cr.research_cost,
                     cr.reuse_count,
+                    cr.expires_at,
                     EXTRACT(days FROM NOW() - cr.created_at)::INTEGER as research_age_days
                 FROM topic_clusters tc
                 JOIN LATERAL (
@@ -190,7 +207,7 @@ class ResearchGovernance:
                 WHERE tc.id = $1
             """, cluster_id)
 
-            return TopicCluster(row)
+            return dict(row) if row else None
 
     async def store_cluster_research(
         self,
@@ -248,6 +265,8 @@ class ResearchGovernance:
                 ttl_days
             )
 
+            await research_payload_cache.invalidate("governance", cluster_id)
+
             logger.info(
                 "research_governance.cluster_research_stored",
                 cluster_id=cluster_id,
@@ -287,31 +306,36 @@ class ResearchGovernance:
                 WHERE created_at > NOW() - INTERVAL '30 days'
             """)
 
-            return {
-                "articles": {
-                    "total_generated": stats['total_articles'] or 0,
-                    "avg_per_cluster": float(stats['avg_articles_per_cluster'] or 0)
-                },
-                "costs": {
-                    "actual_research_cost": float(stats['actual_research_cost'] or 0),
-                    "cost_if_no_reuse": float(stats['cost_if_no_reuse'] or 0),
-                    "total_saved": float(stats['total_saved'] or 0),
-                    "savings_percentage": round(
-                        (float(stats['total_saved'] or 0) / float(stats['cost_if_no_reuse'] or 1)) * 100,
-                        1
-                    )
-                },
-                "reuse": {
-                    "total_research_operations": reuse_stats['total_research_operations'] or 0,
-                    "total_reuses": reuse_stats['total_reuses'] or 0,
-                    "avg_reuse_per_research": float(reuse_stats['avg_reuse_per_research'] or 0),
-                    "research_investment": float(reuse_stats['research_investment'] or 0),
-                    "savings_from_reuse": float(reuse_stats['savings_from_reuse'] or 0)
-                },
-                "clusters": {
-                    "active_clusters": stats['clusters_active'] or 0
-                }
+        # Cache hits not yet flushed to reuse_count
+        pending_reuses = sum((await reuse_counters.pending()).values())
+        total_reuses = (reuse_stats['total_reuses'] or 0) + pending_reuses
+        total_operations = reuse_stats['total_research_operations'] or 0
+
+        return {
+            "articles": {
+                "total_generated": stats['total_articles'] or 0,
+                "avg_per_cluster": float(stats['avg_articles_per_cluster'] or 0)
+            },
+            "costs": {
+                "actual_research_cost": float(stats['actual_research_cost'] or 0),
+                "cost_if_no_reuse": float(stats['cost_if_no_reuse'] or 0),
+                "total_saved": float(stats['total_saved'] or 0),
+                "savings_percentage": round(
+                    (float(stats['total_saved'] or 0) / float(stats['cost_if_no_reuse'] or 1)) * 100,
+                    1
+                )
+            },
+            "reuse": {
+                "total_research_operations": total_operations,
+                "total_reuses": total_reuses,
+                "avg_reuse_per_research": round(total_reuses / total_operations, 1) if total_operations else 0.0,
+                "research_investment": float(reuse_stats['research_investment'] or 0),
+                "savings_from_reuse": float(reuse_stats['savings_from_reuse'] or 0) + pending_reuses * 0.45
+            },
+            "clusters": {
+                "active_clusters": stats['clusters_active'] or 0
             }
+        }
 
     async def mark_research_stale(self, cluster_id: int):
         """Mark cluster research as stale (force new research)"""
@@ -322,6 +346,8 @@ class ResearchGovernance:
                 WHERE cluster_id = $1
             """, cluster_id)
 
+            await research_payload_cache.invalidate("governance", cluster_id)
+
             logger.info(
                 "research_governance.marked_stale",
                 cluster_id=cluster_id
@@ -0,0 +1,182 @@
+"""
+Quest Platform v2.2 - Research Payload Cache
+Read-through cache of cluster research rows: process LRU → Redis → Postgres
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.payload_codec import dump_json, load_json, pack_json, unpack_json
+from app.core.redis_client import get_redis_or_none
+from app.core.single_flight import SingleFlight
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "quest:research_payload:"
+
+
+class ResearchPayloadCache:
+    """
+    Tiered cache of cluster research payloads
+
+    Tiers:
+    - In-process LRU, bounded by the JSON size of its entries
+      (CLUSTER_CACHE_MEMORY_MB) and kept CLUSTER_CACHE_MEMORY_TTL_SECONDS
+    - Redis, compressed, kept CLUSTER_CACHE_REDIS_TTL_SECONDS
+    - Postgres (the loader), once per key per process at a time
+
+    An entry never outlives the research's own serve_until (or expires_at).
+    Writers call
+    invalidate(), which drops this process's copy and the Redis copy;
+    other processes' memory copies age out within the memory TTL.
+
+    Memory hits return the cached objects themselves: treat them as
+    read-only.
+    """
+
+    def __init__(self):
+        self.max_bytes = settings.CLUSTER_CACHE_MEMORY_MB * 1024 * 1024
+        self.memory_ttl = settings.CLUSTER_CACHE_MEMORY_TTL_SECONDS
+        self.redis_ttl = settings.CLUSTER_CACHE_REDIS_TTL_SECONDS
+        self._lru: "OrderedDict[str, Tuple[float, int, Dict]]" = OrderedDict()
+        self.bytes = 0
+        self.stats: Dict[str, int] = {"memory": 0, "redis": 0, "database": 0, "misses": 0}
+        self._loads = SingleFlight("research_payload", cross_process=False)
+        self._generations: Dict[str, int] = {}
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Any,
+        loader: Callable[[], Awaitable[Optional[Dict]]]
+    ) -> Optional[Dict]:
+        """
+        Get a payload, loading it from Postgres on a miss
+
+        Args:
+            namespace: Payload kind (e.g. "cluster", "governance")
+            key: Cluster ID
+            loader: Reads the payload from Postgres; returns None if there
+                is none. A "serve_until" (else "expires_at") datetime in the
+                payload bounds how long it is cached.
+
+        Returns:
+            Payload or None
+        """
+        cache_key = f"{namespace}:{key}"
+
+        # Tier 1: in-process LRU
+        entry = self._lru.get(cache_key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.time():
+                self._lru.move_to_end(cache_key)
+                self.stats["memory"] += 1
+                return dict(value)
+            self._forget(cache_key)
+
+        return await self._loads.do(cache_key, lambda: self._load(cache_key, loader))
+
+    async def invalidate(self, namespace: str, key: Any):
+        """
+        Drop a payload from every tier (after its research changed)
+
+        Args:
+            namespace: Payload kind
+            key: Cluster ID
+        """
+        cache_key = f"{namespace}:{key}"
+        self._forget(cache_key)
+        # Loads already in flight read the old row; don't let them cache it
+        self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+
+        redis_client = get_redis_or_none()
+        if redis_client is None:
+            return
+
+        try:
+            await redis_client.delete(f"{KEY_PREFIX}{cache_key}")
+        except Exception as e:
+            logger.warning("research_payload_cache.invalidate_failed", key=cache_key, error=str(e))
+
+        logger.debug("research_payload_cache.invalidated", key=cache_key)
+
+    async def _load(self, cache_key: str, loader: Callable[[], Awaitable[Optional[Dict]]]) -> Optional[Dict]:
+        # Tier 2: Redis
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                blob = await redis_client.get(f"{KEY_PREFIX}{cache_key}")
+                if blob:
+                    raw = unpack_json(blob)
+                    value = load_json(raw)
+                    if self._seconds_left(value) > 0:
+                        self._remember(cache_key, value, len(raw))
+                        self.stats["redis"] += 1
+                        return dict(value)
+            except Exception as e:
+                logger.warning("research_payload_cache.redis_get_failed", key=cache_key, error=str(e))
+
+        # Tier 3: Postgres
+        generation = self._generations.get(cache_key, 0)
+        value = await loader()
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["database"] += 1
+        seconds_left = self._seconds_left(value)
+        if seconds_left <= 0 or self._generations.get(cache_key, 0) != generation:
+            return value
+
+        raw = dump_json(value)
+        self._remember(cache_key, value, len(raw))
+
+        if redis_client is not None:
+            try:
+                await redis_client.set(
+                    f"{KEY_PREFIX}{cache_key}",
+                    pack_json(raw),
+                    ex=max(1, int(min(self.redis_ttl, seconds_left)))
+                )
+            except Exception as e:
+                logger.warning("research_payload_cache.redis_set_failed", key=cache_key, error=str(e))
+
+        return dict(value)
+
+    def _remember(self, cache_key: str, value: Dict, size: int):
+        if size > self.max_bytes:
+            return
+
+        self._forget(cache_key)
+        expires_at = time.time() + min(self.memory_ttl, self._seconds_left(value))
+        self._lru[cache_key] = (expires_at, size, value)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._lru.popitem(last=False)
+            self.bytes -= evicted_size
+
+    def _forget(self, cache_key: str):
+        entry = self._lru.pop(cache_key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    @staticmethod
+    def _seconds_left(value: Dict) -> float:
+        """Seconds until the payload may no longer be served (inf if it doesn't say)"""
+        expires_at = value.get("serve_until") or value.get("expires_at")
+        if not isinstance(expires_at, datetime):
+            return float("inf")
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
+
+# Global research payload cache
+research_payload_cache = ResearchPayloadCache()
@@ -2,15 +2,166 @@
 Research Queue Governance Module
 Enforces topic prioritization and deduplication from QUEST_RELOCATION_RESEARCH.md
 """
+import asyncio
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 import structlog
+from app.core.config import settings
 from app.core.database import get_db
 
 logger = structlog.get_logger()
 
+
+def normalize_topic(topic: str) -> str:
+    """Normalize topic for comparison (lowercase, punctuation stripped)"""
+    # Remove special characters and extra spaces
+    normalized = re.sub(r'[^\w\s]', ' ', topic.lower())
+    normalized = ' '.join(normalized.split())
+    return normalized
+
+
+class CompletedTopicIndex:
+    """
+    Inverted word index over completed topics
+
+    Answers "is there a completed topic sharing more than X% of this
+    topic's words?" without scanning every topic: a match must contain at
+    least one of the topic's rarest words (prefix filtering), so only the
+    short posting lists of those words are checked.
+
+    Loaded from the articles table once per process, then kept current
+    incrementally (new rows only) and by add() when an article is created.
+    Supports `in`, len() and iteration like the set it replaces.
+    """
+
+    # Re-read rows this far behind the high-water mark, so rows committed
+    # late (with an earlier created_at) are not missed
+    REFRESH_OVERLAP_SECONDS = 300
+
+    def __init__(self):
+        self.topics: Dict[str, FrozenSet[str]] = {}  # topic -> its words
+        self.postings: Dict[str, Set[str]] = {}  # word -> topics containing it
+        self.high_water: Optional[datetime] = None  # newest created_at loaded
+        self.refreshed_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __contains__(self, topic: str) -> bool:
+        return topic in self.topics
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.topics)
+
+    def add(self, topic: str):
+        """Index one completed topic (idempotent)"""
+        if topic in self.topics:
+            return
+
+        words = frozenset(topic.split())
+        self.topics[topic] = words
+        for word in words:
+            self.postings.setdefault(word, set()).add(topic)
+
+    def find_similar(self, words: Set[str], threshold: float) -> Optional[Tuple[str, float]]:
+        """
+        Find a completed topic sharing more than threshold of the given words
+
+        Args:
+            words: Words of the proposed topic
+            threshold: Overlap ratio (relative to len(words)) to exceed
+
+        Returns:
+            (completed topic, overlap ratio) or None
+        """
+        if not words:
+            return None
+
+        # A match needs more than threshold * n shared words, i.e. at least
+        # `required`; it must then contain one of any n - required + 1 words
+        required = int(threshold * len(words)) + 1
+        if required > len(words):
+            return None
+
+        rarest = sorted(words, key=lambda word: len(self.postings.get(word, ())))
+        candidates = set()
+        for word in rarest[:len(words) - required + 1]:
+            candidates.update(self.postings.get(word, ()))
+
+        for candidate in candidates:
+            overlap = len(words & self.topics[candidate]) / len(words)
+            if overlap > threshold:
+                return candidate, overlap
+
+        return None
+
+    async def refresh(self):
+        """
+        Load new articles since the last refresh
+
+        The first call loads the whole table; later calls (at most every
+        TOPIC_INDEX_REFRESH_SECONDS) only fetch rows created since then.
+        """
+        if (
+            self.refreshed_at is not None
+            and time.monotonic() - self.refreshed_at < settings.TOPIC_INDEX_REFRESH_SECONDS
+        ):
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Another job may have refreshed while we waited
+            if (
+                self.refreshed_at is not None
+                and time.monotonic() - self.refreshed_at < settings.TOPIC_INDEX_REFRESH_SECONDS
+            ):
+                return
+
+            pool = get_db()
+            async with pool.acquire() as conn:
+                if self.high_water is None:
+                    articles = await conn.fetch(
+                        "SELECT title, slug, created_at FROM articles WHERE status != 'failed'"
+                    )
+                else:
+                    articles = await conn.fetch(
+                        """
+                        SELECT title, slug, created_at FROM articles
+                        WHERE status != 'failed'
+                        AND created_at > $1 - make_interval(secs => $2)
+                        """,
+                        self.high_water,
+                        self.REFRESH_OVERLAP_SECONDS
+                    )
+
+            for article in articles:
+                self.add(article['title'].lower())
+                self.add(article['slug'].lower())
+                if article['created_at'] and (
+                    self.high_water is None or article['created_at'] > self.high_water
+                ):
+                    self.high_water = article['created_at']
+
+            self.refreshed_at = time.monotonic()
+
+            logger.info(
+                "research_governance.index_refreshed",
+                new_rows=len(articles),
+                count=len(self.topics)
+            )
+
+
+# Global completed-topic index (shared by every ResearchGovernance in the process)
+completed_topic_index = CompletedTopicIndex()
+
+
 class ResearchGovernance:
     """
     Manages research topic prioritization and deduplication
@@ -75,22 +226,15 @@ class ResearchGovernance:
 
     def __init__(self):
         """Initialize research governance"""
-        self.completed_topics = set()
+        self.completed_topics = completed_topic_index
         # Note: load_completed_topics() must be called with await from async context
 
     async def load_completed_topics(self):
-        """Load already completed topics from database"""
+        """Bring the shared completed-topic index up to date (cheap after the first call)"""
         try:
-            pool = get_db()
-            async with pool.acquire() as conn:
-                articles = await conn.fetch(
-                    "SELECT title, slug FROM articles WHERE status != 'failed'"
-                )
-                for article in articles:
-                    self.completed_topics.add(article['title'].lower())
-                    self.completed_topics.add(article['slug'].lower())
+            await self.completed_topics.refresh()
 
-            logger.info(
+            logger.debug(
                 "research_governance.loaded_completed",
                 count=len(self.completed_topics)
             )
@@ -122,17 +266,16 @@ class ResearchGovernance:
 
         # Check for similar topics (80% word overlap)
         topic_words = set(normalized_topic.split())
-        for completed in self.completed_topics:
-            completed_words = set(completed.split())
-            overlap = len(topic_words & completed_words)
-            if len(topic_words) > 0 and overlap / len(topic_words) > 0.8:
-                logger.info(
-                    "research_governance.similar_found",
-                    topic=topic,
-                    similar_to=completed,
-                    overlap_ratio=overlap/len(topic_words)
-                )
-                return True
+        similar = self.completed_topics.find_similar(topic_words, 0.8)
+        if similar:
+            completed, overlap_ratio = similar
+            logger.info(
+                "research_governance.similar_found",
+                topic=topic,
+                similar_to=completed,
+                overlap_ratio=overlap_ratio
+            )
+            return True
 
         return False
 
@@ -272,10 +415,7 @@ class ResearchGovernance:
 
     def _normalize_topic(self, topic: str) -> str:
         """Normalize topic for comparison"""
-        # Remove special characters and extra spaces
-        normalized = re.sub(r'[^\w\s]', ' ', topic.lower())
-        normalized = ' '.join(normalized.split())
-        return normalized
+        return normalize_topic(topic)
 
     def _topics_match(self, topic1: str, topic2: str) -> bool:
         """Check if two topics are essentially the same"""
@@ -0,0 +1,374 @@
+"""
+Quest Platform v2.2 - Cluster Research Refresher
+Re-researches expiring or stale clusters in the background (stale-while-revalidate)
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Dict, Optional
+from uuid import uuid4
+
+import structlog
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.redis_client import get_redis_or_none
+from app.core.research_apis import MultiAPIResearch
+from app.core.research_cache import ClusterResearchCache
+from app.core.reuse_counters import reuse_counters
+from app.core.single_flight import RELEASE_LOCK_SCRIPT
+
+logger = structlog.get_logger(__name__)
+
+LOCK_PREFIX = "quest:cluster_refresh:lock:"
+SPEND_PREFIX = "quest:cluster_refresh:spend:"
+COOLDOWN_PREFIX = "quest:cluster_refresh:cooldown:"
+
+# KEYS[1] = today's spend key
+# ARGV[1] = amount to reserve, ARGV[2] = daily budget, ARGV[3] = key TTL
+# Returns {1 if reserved else 0, spend so far (before this reservation)}
+RESERVE_SPEND_SCRIPT = """
+local spent = tonumber(redis.call('GET', KEYS[1]) or '0')
+if spent + tonumber(ARGV[1]) > tonumber(ARGV[2]) then
+    return {0, tostring(spent)}
+end
+redis.call('INCRBYFLOAT', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {1, tostring(spent)}
+"""
+
+
+class ResearchRefresher:
+    """
+    Keep cluster research fresh off the article critical path
+
+    - Readers keep getting the current copy (up to
+      CLUSTER_RESEARCH_STALE_GRACE_DAYS past expiry, or while is_stale)
+      and ask for a refresh via request()
+    - sweep() (every CLUSTER_REFRESH_INTERVAL_SECONDS) picks clusters that
+      expire within CLUSTER_REFRESH_AHEAD_DAYS or are marked stale, most
+      reused first
+    - At most CLUSTER_REFRESH_MAX_CONCURRENCY refreshes per process, one per
+      cluster across processes (Redis lock), and none once
+      CLUSTER_REFRESH_DAILY_BUDGET has been spent today
+
+    Each refresh reserves CLUSTER_REFRESH_COST_RESERVATION of the day's
+    budget atomically before researching and settles it to the actual cost
+    afterwards, so concurrent refreshes (in any process) cannot all pass the
+    budget check at once. A refresh that costs more than its reservation
+    can still take the day's spend past the budget by the difference; one
+    that raises keeps its reservation, since its calls may have been billed.
+
+    The row is re-read once the lock is held, so a refresh another process
+    just finished is not paid for again (its readers may still see the old
+    copy from their memory cache). A refresh that fails or whose research is
+    not good enough leaves the old copy in place and puts the cluster on a
+    CLUSTER_REFRESH_FAILURE_COOLDOWN_SECONDS cooldown, so every later hit
+    does not re-run paid research.
+    """
+
+    def __init__(self):
+        self.enabled = settings.CLUSTER_REFRESH_ENABLED
+        self.ahead_days = settings.CLUSTER_REFRESH_AHEAD_DAYS
+        self.interval = settings.CLUSTER_REFRESH_INTERVAL_SECONDS
+        self.batch_size = settings.CLUSTER_REFRESH_BATCH_SIZE
+        self.max_concurrency = settings.CLUSTER_REFRESH_MAX_CONCURRENCY
+        self.daily_budget = settings.CLUSTER_REFRESH_DAILY_BUDGET
+        self.cost_reservation = settings.CLUSTER_REFRESH_COST_RESERVATION
+        self.failure_cooldown = settings.CLUSTER_REFRESH_FAILURE_COOLDOWN_SECONDS
+        self.lock_ttl = max(settings.RESEARCH_DEADLINE_SECONDS * 3, 300)
+        self.cache = ClusterResearchCache()
+        self.multi_api: Optional[MultiAPIResearch] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._local_spend: Dict[str, Decimal] = {}
+        self._local_cooldowns: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def request(self, cluster_id: str, topic: str) -> bool:
+        """
+        Refresh a cluster's research in the background
+
+        Args:
+            cluster_id: cluster_research.cluster_id
+            topic: Topic to research for it
+
+        Returns:
+            True if a refresh was scheduled (False if disabled or already running)
+        """
+        if not self.enabled or cluster_id in self._inflight:
+            return False
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        task = asyncio.create_task(self._refresh(cluster_id, topic))
+        self._inflight[cluster_id] = task
+        task.add_done_callback(lambda _: self._inflight.pop(cluster_id, None))
+
+        logger.info("research_refresher.scheduled", cluster_id=cluster_id, topic=topic)
+        return True
+
+    async def sweep(self) -> int:
+        """
+        Schedule refreshes for clusters nearing expiry or marked stale
+
+        Returns:
+            Number of refreshes scheduled
+        """
+        pool = get_db()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT cluster_id, source_topic, reuse_count, last_used_at
+                FROM cluster_research
+                WHERE is_stale
+                   OR expires_at < NOW() + make_interval(days => $1)
+                """,
+                self.ahead_days
+            )
+
+        if not rows:
+            return 0
+
+        # Most reused first (stored plus unflushed counts), then most recently used
+        pending = await reuse_counters.pending()
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        ranked = sorted(
+            rows,
+            key=lambda row: (
+                (row["reuse_count"] or 0) + pending.get(row["cluster_id"], 0),
+                row["last_used_at"] or oldest
+            ),
+            reverse=True
+        )
+
+        scheduled = 0
+        for row in ranked[:self.batch_size]:
+            topic = row["source_topic"] or row["cluster_id"].replace("_", " ").replace("-", " ")
+            if self.request(row["cluster_id"], topic):
+                scheduled += 1
+
+        logger.info("research_refresher.swept", due=len(rows), scheduled=scheduled)
+        return scheduled
+
+    def start(self):
+        """Sweep on an interval in the background (idempotent)"""
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self):
+        """Stop sweeping and abandon refreshes in flight (the stale copies stay)"""
+        tasks = list(self._inflight.values())
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error("research_refresher.sweep_failed", error=str(e))
+
+    async def _refresh(self, cluster_id: str, topic: str):
+        async with self._semaphore:
+            if await self._cooling_down(cluster_id):
+                logger.debug("research_refresher.cooling_down", cluster_id=cluster_id)
+                return
+
+            redis_client = get_redis_or_none()
+            lock_key = f"{LOCK_PREFIX}{cluster_id}"
+            token = uuid4().hex
+
+            if redis_client is not None:
+                try:
+                    if not await redis_client.set(lock_key, token, nx=True, ex=self.lock_ttl):
+                        logger.debug("research_refresher.already_refreshing", cluster_id=cluster_id)
+                        return
+                except Exception as e:
+                    logger.warning("research_refresher.lock_failed", cluster_id=cluster_id, error=str(e))
+                    redis_client = None
+
+            refreshed = True
+            try:
+                # The caller may have seen a copy that has since been replaced
+                if not await self._still_due(cluster_id):
+                    logger.debug("research_refresher.already_fresh", cluster_id=cluster_id)
+                    return
+
+                if not await self._reserve_spend(cluster_id):
+                    return
+
+                refreshed = await self._research(cluster_id, topic)
+            except Exception as e:
+                logger.error("research_refresher.refresh_failed", cluster_id=cluster_id, error=str(e))
+                refreshed = False
+            finally:
+                # Before unlocking, so no other process retries in between
+                if not refreshed:
+                    await self._start_cooldown(cluster_id)
+
+                if redis_client is not None:
+                    try:
+                        await redis_client.register_script(RELEASE_LOCK_SCRIPT)(
+                            keys=[lock_key], args=[token]
+                        )
+                    except Exception as e:
+                        logger.warning("research_refresher.unlock_failed", cluster_id=cluster_id, error=str(e))
+
+    async def _still_due(self, cluster_id: str) -> bool:
+        """Whether the cluster's latest research is still stale or expiring"""
+        pool = get_db()
+        async with pool.acquire() as conn:
+            due = await conn.fetchval(
+                """
+                SELECT is_stale OR expires_at < NOW() + make_interval(days => $2)
+                FROM cluster_research
+                WHERE cluster_id = $1
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                cluster_id,
+                self.ahead_days
+            )
+
+        # No row left (deleted or past its grace period): research it afresh
+        return due is None or bool(due)
+
+    async def _research(self, cluster_id: str, topic: str) -> bool:
+        if self.multi_api is None:
+            self.multi_api = MultiAPIResearch()
+
+        research_result = await self.multi_api.research(query=topic, use_all=True)
+        cost = research_result.get("total_cost", Decimal("0"))
+        await self._settle_spend(cost)
+
+        research_data = {
+            "content": research_result.get("content", ""),
+            "sources": research_result.get("sources", []),
+            "providers_used": research_result.get("providers_used", [])
+        }
+        quality_score = self.multi_api.score_research_quality(
+            content=research_data["content"],
+            sources=research_data["sources"]
+        )
+
+        if not research_data["content"] or not quality_score["is_sufficient"]:
+            logger.warning(
+                "research_refresher.research_insufficient",
+                cluster_id=cluster_id,
+                topic=topic,
+                score=quality_score["total_score"],
+                cost=float(cost)
+            )
+            return False
+
+        research_data["quality_score"] = quality_score
+
+        await self.cache.save_research(
+            topic=topic,
+            research_data=research_data,
+            seo_data=research_result.get("seo_data"),
+            serp_analysis=research_result.get("serp_analysis"),
+            ai_insights=research_result.get("ai_insights"),
+            cluster_id=cluster_id
+        )
+
+        logger.info("research_refresher.refreshed", cluster_id=cluster_id, topic=topic, cost=float(cost))
+        return True
+
+    async def _cooling_down(self, cluster_id: str) -> bool:
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                return bool(await redis_client.exists(f"{COOLDOWN_PREFIX}{cluster_id}"))
+            except Exception as e:
+                logger.warning("research_refresher.cooldown_read_failed", cluster_id=cluster_id, error=str(e))
+
+        return self._local_cooldowns.get(cluster_id, 0.0) > time.monotonic()
+
+    async def _start_cooldown(self, cluster_id: str):
+        """Hold off refreshing a cluster whose last refresh failed"""
+        self._local_cooldowns = {
+            other_id: until
+            for other_id, until in self._local_cooldowns.items()
+            if until > time.monotonic()
+        }
+        self._local_cooldowns[cluster_id] = time.monotonic() + self.failure_cooldown
+
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                await redis_client.set(f"{COOLDOWN_PREFIX}{cluster_id}", "1", ex=self.failure_cooldown)
+            except Exception as e:
+                logger.warning("research_refresher.cooldown_set_failed", cluster_id=cluster_id, error=str(e))
+
+        logger.info("research_refresher.cooldown_started", cluster_id=cluster_id, seconds=self.failure_cooldown)
+
+    async def _reserve_spend(self, cluster_id: str) -> bool:
+        """
+        Reserve a refresh's estimated cost against today's budget
+
+        Args:
+            cluster_id: For logging
+
+        Returns:
+            True if reserved, False if the budget has been spent
+        """
+        day = date.today().isoformat()
+        reservation = self.cost_reservation
+        spent = self._local_spend.get(day, Decimal("0"))
+        reserved = spent + reservation <= self.daily_budget
+
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                reserved, spent = await redis_client.register_script(RESERVE_SPEND_SCRIPT)(
+                    keys=[f"{SPEND_PREFIX}{day}"],
+                    args=[float(reservation), float(self.daily_budget), 2 * 86400]
+                )
+                reserved, spent = bool(reserved), Decimal(spent)
+            except Exception as e:
+                logger.warning("research_refresher.spend_reserve_failed", error=str(e))
+
+        if not reserved:
+            logger.warning(
+                "research_refresher.budget_exhausted",
+                cluster_id=cluster_id,
+                spent=float(spent),
+                budget=float(self.daily_budget)
+            )
+            return False
+
+        self._local_spend = {day: self._local_spend.get(day, Decimal("0")) + reservation}
+        return True
+
+    async def _settle_spend(self, cost: Decimal):
+        """Replace a refresh's reservation with what it actually cost"""
+        day = date.today().isoformat()
+        adjustment = cost - self.cost_reservation
+        self._local_spend = {day: self._local_spend.get(day, Decimal("0")) + adjustment}
+
+        redis_client = get_redis_or_none()
+        if redis_client is None:
+            return
+
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.incrbyfloat(f"{SPEND_PREFIX}{day}", float(adjustment))
+                pipe.expire(f"{SPEND_PREFIX}{day}", 2 * 86400)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("research_refresher.spend_record_failed", error=str(e))
+
+
+# Global research refresher
+research_refresher = ResearchRefresher()
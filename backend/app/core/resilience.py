@@ -0,0 +1,388 @@
+"""
+Quest Platform v2.2 - Provider Resilience
+Retry with jittered backoff, circuit breakers and deadline budgets for
+external research providers and LLM APIs
+"""
+
+import asyncio
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+import structlog
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+
+logger = structlog.get_logger(__name__)
+
+# Status codes worth retrying (429 rate limit, 529 Anthropic overloaded)
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504, 529}
+
+# Retry hints embedded in SDK error messages (Gemini quota errors)
+RETRY_HINT_PATTERNS = [
+    re.compile(r"retry in (\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE),
+]
+
+# Per-provider (attempt timeout, total budget) in seconds. An attempt timeout
+# of None leaves per-attempt limits to the SDK (long LLM generations).
+PROVIDER_TIMEOUTS: Dict[str, Tuple[Optional[float], float]] = {
+    "perplexity": (30.0, 75.0),
+    "tavily": (20.0, 40.0),
+    "linkup": (20.0, 40.0),
+    "serper": (10.0, 20.0),
+    "dataforseo": (30.0, 60.0),
+    "firecrawl": (30.0, 45.0),
+    "critique_labs": (30.0, 45.0),
+    "openai": (30.0, 60.0),
+    # run_gemini times Gemini attempts itself, from when a thread starts them
+    "gemini": (None, 600.0),
+    "anthropic": (None, 900.0),
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a provider's circuit breaker is open"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} circuit open, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    After failure_threshold transient failures in a row the circuit opens and
+    calls fail fast for cooldown seconds. The first call after the cool-down
+    is let through as a trial: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, cooldown: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a trial call through"""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.cooldown - (time.monotonic() - self.opened_at), 0.0)
+
+    def allow(self) -> Tuple[bool, bool]:
+        """
+        Admit a call
+
+        Returns:
+            Tuple of (may proceed, is the half-open trial). Only the trial
+            call passes trial=True to record_success/record_failure/
+            end_trial, so other calls finishing meanwhile cannot let a
+            second trial through.
+        """
+        state = self.state
+        if state == "closed":
+            return True, False
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True, True
+        return False, False
+
+    def end_trial(self):
+        self.trial_in_flight = False
+
+    def record_success(self, trial: bool = False):
+        if self.opened_at is not None:
+            logger.info("resilience.circuit_closed", provider=self.name)
+        self.failures = 0
+        self.opened_at = None
+        if trial:
+            self.end_trial()
+
+    def record_failure(self, trial: bool = False):
+        self.failures += 1
+        if trial:
+            self.end_trial()
+
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            logger.warning(
+                "resilience.circuit_opened",
+                provider=self.name,
+                failures=self.failures,
+                cooldown=self.cooldown
+            )
+
+
+def classify_error(error: BaseException) -> Tuple[bool, Optional[float]]:
+    """
+    Decide whether an error is transient and how long the server asked us
+    to wait
+
+    Understands httpx errors, Anthropic/OpenAI SDK errors (status_code and
+    response headers) and Google API errors (integer code, retry hints in
+    the message).
+
+    Returns:
+        Tuple of (retryable, retry_after_seconds or None)
+    """
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError)):
+        return True, None
+
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "status_code", None)
+    if status is None and isinstance(getattr(error, "code", None), int):
+        status = error.code
+
+    retry_after = None
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        retry_after = parse_retry_after(headers.get("retry-after"))
+    if retry_after is None:
+        for pattern in RETRY_HINT_PATTERNS:
+            match = pattern.search(str(error))
+            if match:
+                retry_after = float(match.group(1))
+                break
+
+    if status is not None:
+        return status in RETRYABLE_STATUS, retry_after
+
+    # SDK connection/timeout errors carry no status code
+    name = type(error).__name__
+    if "Timeout" in name or "Connection" in name:
+        return True, retry_after
+
+    message = str(error).lower()
+    if "429" in message or "quota" in message or "rate limit" in message:
+        return True, retry_after
+
+    return False, None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderResilience:
+    """
+    Retry, circuit breaking and deadline budget for one provider
+
+    Every attempt is bounded by the provider's attempt timeout and by what
+    is left of its total budget, so one slow provider cannot stall a job.
+    Transient failures are retried with full-jitter exponential backoff,
+    or after the server's Retry-After when it sends one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        attempt_timeout: Optional[float],
+        budget: float,
+        max_attempts: Optional[int] = None
+    ):
+        self.name = name
+        self.attempt_timeout = attempt_timeout
+        self.budget = budget
+        self.max_attempts = max_attempts or settings.PROVIDER_MAX_ATTEMPTS
+        self.base_delay = settings.PROVIDER_RETRY_BASE_DELAY
+        self.max_delay = settings.PROVIDER_RETRY_MAX_DELAY
+        self.breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            cooldown=settings.CIRCUIT_COOLDOWN_SECONDS
+        )
+
+    def allow(self) -> bool:
+        """Whether the circuit currently lets calls through"""
+        return self.breaker.state != "open"
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        attempt_timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Await func(*args, **kwargs) under this provider's policy
+
+        Args:
+            func: Coroutine function to call (called once per attempt)
+            attempt_timeout: Override the provider's per-attempt timeout
+
+        Returns:
+            func's result
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last error once retries or the budget run out
+        """
+        return await self._run(
+            lambda timeout: self._with_timeout(func(*args, **kwargs), timeout),
+            attempt_timeout
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send an HTTP request on the pooled client under this provider's policy
+
+        Retryable status codes (429, 5xx) are retried; the final response is
+        returned as-is so callers keep their own status handling.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Override the provider's per-attempt timeout
+            **kwargs: Passed to httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response
+        """
+        client = get_http_client(url)
+
+        async def attempt(attempt_timeout: Optional[float]) -> httpx.Response:
+            response = await client.request(method, url, timeout=attempt_timeout, **kwargs)
+            if response.status_code in RETRYABLE_STATUS:
+                raise _RetryableResponse(response)
+            return response
+
+        try:
+            return await self._run(attempt, timeout)
+        except _RetryableResponse as e:
+            return e.response
+
+    async def _run(
+        self,
+        attempt: Callable[[Optional[float]], Awaitable[Any]],
+        attempt_timeout: Optional[float]
+    ) -> Any:
+        allowed, trial = self.breaker.allow()
+        if not allowed:
+            raise CircuitOpenError(self.name, self.breaker.retry_in())
+
+        try:
+            return await self._attempts(attempt, attempt_timeout, trial)
+        finally:
+            # A cancelled trial call must not leave the circuit stuck half-open
+            if trial:
+                self.breaker.end_trial()
+
+    async def _attempts(
+        self,
+        attempt: Callable[[Optional[float]], Awaitable[Any]],
+        attempt_timeout: Optional[float],
+        trial: bool = False
+    ) -> Any:
+        deadline = time.monotonic() + self.budget
+        per_attempt = attempt_timeout or self.attempt_timeout
+
+        for attempt_number in range(1, self.max_attempts + 1):
+            remaining = deadline - time.monotonic()
+            timeout = min(per_attempt, remaining) if per_attempt else remaining
+
+            try:
+                result = await attempt(timeout)
+                self.breaker.record_success(trial)
+                return result
+
+            except Exception as e:
+                retryable, retry_after = classify_error(e)
+
+                if not retryable:
+                    # The provider answered; the request itself was bad
+                    self.breaker.record_success(trial)
+                    raise
+
+                delay = retry_after if retry_after is not None else random.uniform(
+                    0, min(self.max_delay, self.base_delay * 2 ** (attempt_number - 1))
+                )
+                remaining = deadline - time.monotonic()
+
+                if attempt_number == self.max_attempts or delay >= remaining:
+                    self.breaker.record_failure(trial)
+                    logger.warning(
+                        "resilience.gave_up",
+                        provider=self.name,
+                        attempts=attempt_number,
+                        error=str(e) or type(e).__name__
+                    )
+                    raise
+
+                logger.info(
+                    "resilience.retrying",
+                    provider=self.name,
+                    attempt=attempt_number,
+                    delay=round(delay, 2),
+                    retry_after=retry_after is not None,
+                    error=str(e) or type(e).__name__
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _with_timeout(awaitable: Awaitable[Any], timeout: Optional[float]) -> Any:
+        if timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+
+
+class _RetryableResponse(Exception):
+    """Internal: carries a 429/5xx response through the retry loop"""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+# Global per-provider registry (one breaker per provider per process)
+_registry: Dict[str, ProviderResilience] = {}
+
+
+def get_resilience(provider: str) -> ProviderResilience:
+    """
+    Get the resilience policy for a provider
+
+    Args:
+        provider: Provider name (see PROVIDER_TIMEOUTS)
+
+    Returns:
+        Shared ProviderResilience for that provider
+    """
+    policy = _registry.get(provider)
+
+    if policy is None:
+        attempt_timeout, budget = PROVIDER_TIMEOUTS.get(provider, (30.0, 60.0))
+        policy = _registry[provider] = ProviderResilience(provider, attempt_timeout, budget)
+
+    return policy
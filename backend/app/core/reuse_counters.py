@@ -0,0 +1,177 @@
+"""
+Quest Platform v2.2 - Reuse Counters
+Write-behind accounting of cluster research cache hits
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import structlog
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.redis_client import get_redis_or_none
+
+logger = structlog.get_logger(__name__)
+
+PENDING_KEY = "quest:cluster_reuse:pending"
+
+# KEYS[1] = pending hash
+# Reads and clears the pending counts in one step, so hits recorded while
+# a flush is running are kept for the next one
+DRAIN_SCRIPT = """
+local counts = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return counts
+"""
+
+
+class ReuseCounters:
+    """
+    Cluster research reuse counts, flushed to Postgres in batches
+
+    A cache hit only increments a counter (a Redis hash shared by every
+    process, or this process's dict without Redis), so the read path never
+    takes a row lock on the hottest cluster_research rows. Every
+    REUSE_COUNTER_FLUSH_SECONDS the pending counts are drained and applied
+    with one UPDATE per batch; counts that fail to flush are put back.
+
+    Readers that need exact numbers add pending() to the stored counts.
+    """
+
+    def __init__(self):
+        self.flush_interval = settings.REUSE_COUNTER_FLUSH_SECONDS
+        self.local: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def record(self, cluster_id: str) -> int:
+        """
+        Count one reuse of a cluster's research
+
+        Args:
+            cluster_id: cluster_research.cluster_id
+
+        Returns:
+            Reuses of this cluster not yet flushed (including this one)
+        """
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                return await redis_client.hincrby(PENDING_KEY, cluster_id, 1)
+            except Exception as e:
+                logger.warning("reuse_counters.record_failed", cluster_id=cluster_id, error=str(e))
+
+        self.local[cluster_id] = self.local.get(cluster_id, 0) + 1
+        return self.local[cluster_id]
+
+    async def pending(self) -> Dict[str, int]:
+        """
+        Reuses recorded but not yet flushed
+
+        Returns:
+            cluster_id → count (shared Redis counts plus this process's own)
+        """
+        counts = dict(self.local)
+
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                for cluster_id, count in (await redis_client.hgetall(PENDING_KEY)).items():
+                    counts[cluster_id] = counts.get(cluster_id, 0) + int(count)
+            except Exception as e:
+                logger.warning("reuse_counters.pending_failed", error=str(e))
+
+        return counts
+
+    async def flush(self) -> int:
+        """
+        Apply pending counts to cluster_research
+
+        Returns:
+            Number of reuses written
+        """
+        counts, self.local = self.local, {}
+        from_redis: Dict[str, int] = {}
+
+        redis_client = get_redis_or_none()
+        if redis_client is not None:
+            try:
+                raw = await redis_client.register_script(DRAIN_SCRIPT)(keys=[PENDING_KEY])
+                from_redis = {raw[i]: int(raw[i + 1]) for i in range(0, len(raw), 2)}
+            except Exception as e:
+                logger.warning("reuse_counters.drain_failed", error=str(e))
+
+        for cluster_id, count in from_redis.items():
+            counts[cluster_id] = counts.get(cluster_id, 0) + count
+
+        if not counts:
+            return 0
+
+        try:
+            pool = get_db()
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE cluster_research AS cr
+                    SET reuse_count = cr.reuse_count + pending.count,
+                        last_used_at = NOW()
+                    FROM unnest($1::text[], $2::int[]) AS pending(cluster_id, count)
+                    WHERE cr.cluster_id = pending.cluster_id
+                    """,
+                    list(counts),
+                    list(counts.values())
+                )
+        except Exception as e:
+            logger.warning("reuse_counters.flush_failed", clusters=len(counts), error=str(e))
+            await self._restore(counts, from_redis)
+            return 0
+
+        total = sum(counts.values())
+        logger.info("reuse_counters.flushed", clusters=len(counts), reuses=total)
+        return total
+
+    def start(self):
+        """Flush on an interval in the background (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the background flush and write what is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        await self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("reuse_counters.flush_loop_error", error=str(e))
+
+    async def _restore(self, counts: Dict[str, int], from_redis: Dict[str, int]):
+        """Put unflushed counts back (drained Redis counts into Redis if possible)"""
+        redis_client = get_redis_or_none() if from_redis else None
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for cluster_id, count in from_redis.items():
+                        pipe.hincrby(PENDING_KEY, cluster_id, count)
+                    await pipe.execute()
+                counts = {
+                    cluster_id: count - from_redis.get(cluster_id, 0)
+                    for cluster_id, count in counts.items()
+                }
+            except Exception as e:
+                logger.warning("reuse_counters.restore_failed", error=str(e))
+
+        for cluster_id, count in counts.items():
+            if count:
+                self.local[cluster_id] = self.local.get(cluster_id, 0) + count
+
+
+# Global reuse counters
+reuse_counters = ReuseCounters()
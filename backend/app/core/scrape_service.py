@@ -0,0 +1,183 @@
+"""
+Quest Platform v2.2 - Competitor Scrape Service
+Concurrent, polite, cached competitor scraping shared by TemplateDetector
+and MultiAPIResearch
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import structlog
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.research_apis import FirecrawlProvider
+
+logger = structlog.get_logger(__name__)
+
+
+class ScrapeService:
+    """
+    Scrape competitor pages concurrently
+
+    - Bounded concurrency overall and per domain (politeness)
+    - Reads recent full-page content back from scraped_competitors before
+      paying for a scrape. Fresh scrapes are stored there (TemplateDetector
+      stores its own, with the content analysis); rows from before
+      content_complete was tracked held truncated content and are skipped
+    - One process-wide instance, so both consumers share the limits and
+      FirecrawlProvider.scrape's in-flight coalescing and response cache:
+      a URL wanted by both in the same job is fetched once
+    """
+
+    def __init__(self, firecrawl: Optional[FirecrawlProvider] = None):
+        self.firecrawl = firecrawl or FirecrawlProvider()
+        self.max_concurrency = settings.SCRAPE_MAX_CONCURRENCY
+        self.per_domain_limit = settings.SCRAPE_PER_DOMAIN_CONCURRENCY
+        self.cache_ttl_hours = settings.SCRAPE_CACHE_TTL_HOURS
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def is_available(self) -> bool:
+        """Whether scraping is configured (Firecrawl API key)"""
+        return self.firecrawl.is_available()
+
+    async def scrape(self, url: str, persist: bool = True) -> Dict:
+        """
+        Scrape one page (cache first)
+
+        Args:
+            url: Page URL
+            persist: Store a fresh scrape in scraped_competitors (False when
+                the caller stores its own row)
+
+        Returns:
+            {"provider": "firecrawl", "content": ..., "sources": [...], "cost": ...}
+            or {} if the page could not be scraped
+        """
+        cached = await self._load_cached(url)
+        if cached:
+            return cached
+
+        async with self._limit(url):
+            result = await self.firecrawl.scrape(url)
+
+        if persist and result.get("content") and not result.get("cached"):
+            await self._store(url, result["content"])
+
+        return result
+
+    async def scrape_many(self, urls: List[str], persist: bool = True) -> List[Dict]:
+        """
+        Scrape pages concurrently
+
+        Args:
+            urls: Page URLs
+            persist: Store fresh scrapes in scraped_competitors
+
+        Returns:
+            One result per URL, in order ({} for pages that failed)
+        """
+        if not urls:
+            return []
+
+        results = await asyncio.gather(
+            *(self.scrape(url, persist=persist) for url in urls),
+            return_exceptions=True
+        )
+
+        scraped = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.warning("scrape_service.scrape_failed", url=url, error=str(result))
+                result = {}
+            scraped.append(result)
+
+        logger.info(
+            "scrape_service.batch_complete",
+            requested=len(urls),
+            scraped=sum(1 for result in scraped if result.get("content")),
+            cached=sum(1 for result in scraped if result.get("cached"))
+        )
+
+        return scraped
+
+    @asynccontextmanager
+    async def _limit(self, url: str):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        domain = (urlsplit(url).hostname or "").lower()
+        domain_semaphore = self._domain_semaphores.get(domain)
+        if domain_semaphore is None:
+            domain_semaphore = self._domain_semaphores[domain] = asyncio.Semaphore(self.per_domain_limit)
+
+        # Domain slot first, so a crowded domain doesn't hold global slots
+        async with domain_semaphore:
+            async with self._semaphore:
+                yield
+
+    async def _load_cached(self, url: str) -> Optional[Dict]:
+        """Most recent content scraped for this URL within the TTL"""
+        if self.cache_ttl_hours <= 0:
+            return None
+
+        try:
+            pool = get_db()
+            async with pool.acquire() as conn:
+                content = await conn.fetchval(
+                    """
+                    SELECT scraped_content
+                    FROM scraped_competitors
+                    WHERE url = $1
+                    AND scraped_content IS NOT NULL
+                    AND content_complete
+                    AND created_at > NOW() - make_interval(hours => $2)
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                    """,
+                    url,
+                    self.cache_ttl_hours
+                )
+        except Exception as e:
+            logger.warning("scrape_service.cache_lookup_failed", url=url, error=str(e))
+            return None
+
+        if not content:
+            return None
+
+        logger.debug("scrape_service.cache_hit", url=url)
+
+        return {
+            "provider": "firecrawl",
+            "content": content,
+            "sources": [{"url": url}],
+            "cost": Decimal("0"),
+            "cached": True
+        }
+
+    async def _store(self, url: str, content: str):
+        """Keep a fresh scrape so later jobs read it back instead of paying again"""
+        try:
+            pool = get_db()
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO scraped_competitors (
+                        url, domain, word_count, scraped_content, content_complete
+                    ) VALUES ($1, $2, $3, $4, true)
+                    """,
+                    url,
+                    (urlsplit(url).hostname or "").lower() or None,
+                    len(content.split()),
+                    content
+                )
+        except Exception as e:
+            logger.warning("scrape_service.store_failed", url=url, error=str(e))
+
+
+# Global scrape service instance
+scrape_service = ScrapeService()
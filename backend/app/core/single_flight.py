@@ -0,0 +1,187 @@
+"""
+Single-Flight Request Coalescing
+
+When several jobs ask for the same thing at once (the same SERP query, the
+same competitor scrape), only one call goes upstream and every caller shares
+its result.
+
+- In-process: concurrent identical calls await one shared task
+- Cross-process: the leader holds a Redis lock (for at least the provider's
+  total deadline); other processes wait for it to clear and then run the
+  call themselves, by which time it is normally answered from the cache
+  the leader just filled
+
+Followers are not charged for the leader's call: a result carrying a cost
+comes back to them with cost 0 and cached/coalesced=True, like a cache hit.
+"""
+
+import asyncio
+import copy
+import functools
+import math
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+import structlog
+
+from app.core.config import settings
+from app.core.redis_client import get_redis_or_none
+from app.core.resilience import PROVIDER_TIMEOUTS
+
+logger = structlog.get_logger()
+
+LOCK_PREFIX = "quest:single_flight:"
+
+# KEYS[1] = lock key, ARGV[1] = owner token
+# Deletes the lock only if we still own it
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Lock lifetime beyond the provider's total deadline (release round trip, clock skew)
+LOCK_TTL_MARGIN = 15
+
+
+def lock_ttl_for(namespace: str) -> int:
+    """
+    Cross-process lock lifetime for a namespace
+
+    Never shorter than the provider's total deadline (PROVIDER_TIMEOUTS,
+    matched on the namespace or its first word, e.g. dataforseo_serp), so
+    the lock cannot lapse while the leader's call is still running.
+    """
+    timeouts = PROVIDER_TIMEOUTS.get(namespace) or PROVIDER_TIMEOUTS.get(namespace.split("_")[0])
+    budget = timeouts[1] if timeouts else 0.0
+    return max(settings.SINGLE_FLIGHT_LOCK_TTL, math.ceil(budget) + LOCK_TTL_MARGIN)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key
+
+    Args:
+        namespace: Prefix for keys (e.g. "firecrawl")
+        cross_process: Also coordinate through a Redis lock. Only useful
+            when the call fills a shared cache that waiters then hit.
+        lock_ttl: Lock lifetime in seconds (default lock_ttl_for(namespace));
+            must cover the call's whole deadline
+    """
+
+    def __init__(self, namespace: str, cross_process: bool = True, lock_ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.cross_process = cross_process
+        self.lock_ttl = lock_ttl or lock_ttl_for(namespace)
+        self.poll_interval = 0.25
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once for all concurrent callers with the same key
+
+        Args:
+            key: Identity of the request (already normalized)
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            func's result (followers get a shallow copy, free of charge)
+        """
+        task = self._inflight.get(key)
+
+        if task is not None:
+            logger.debug("single_flight.joined", namespace=self.namespace)
+            # Shield so one caller's cancellation doesn't cancel the others
+            return self._follower_copy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(self._lead(key, func))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _lead(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        redis_client = get_redis_or_none() if self.cross_process else None
+        if redis_client is None:
+            return await func()
+
+        lock_key = f"{LOCK_PREFIX}{self.namespace}:{key}"
+        token = uuid4().hex
+
+        try:
+            acquired = await redis_client.set(lock_key, token, nx=True, ex=self.lock_ttl)
+        except Exception as e:
+            logger.warning("single_flight.lock_failed", namespace=self.namespace, error=str(e))
+            return await func()
+
+        if not acquired:
+            await self._wait_for_release(redis_client, lock_key)
+            return await func()
+
+        try:
+            return await func()
+        finally:
+            try:
+                await redis_client.register_script(RELEASE_LOCK_SCRIPT)(
+                    keys=[lock_key], args=[token]
+                )
+            except Exception as e:
+                logger.warning("single_flight.unlock_failed", namespace=self.namespace, error=str(e))
+
+    async def _wait_for_release(self, redis_client, lock_key: str):
+        """Wait (at most lock_ttl) for another process's call to finish"""
+        logger.debug("single_flight.waiting_on_peer", namespace=self.namespace)
+        deadline = time.monotonic() + self.lock_ttl
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if not await redis_client.exists(lock_key):
+                    return
+            except Exception:
+                return
+
+    @staticmethod
+    def _follower_copy(result: Any) -> Any:
+        """The leader's result as a follower sees it (the leader paid for it)"""
+        if isinstance(result, dict) and "cost" in result:
+            return {**result, "cost": Decimal("0"), "cached": True, "coalesced": True}
+        return copy.copy(result)
+
+
+def single_flight(
+    namespace: str,
+    key: Callable[..., str],
+    cross_process: bool = True,
+    lock_ttl: Optional[int] = None
+):
+    """
+    Decorate an async method so concurrent identical calls are coalesced
+
+    Args:
+        namespace: Key prefix (one per provider/operation)
+        key: Builds the request key from the method's arguments (minus self)
+        cross_process: See SingleFlight
+        lock_ttl: See SingleFlight
+
+    Example:
+        @single_flight("firecrawl", key=lambda url: normalize_url(url))
+        async def scrape(self, url: str) -> Dict: ...
+    """
+    flight = SingleFlight(namespace, cross_process=cross_process, lock_ttl=lock_ttl)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            return await flight.do(
+                key(*args, **kwargs),
+                lambda: func(self, *args, **kwargs)
+            )
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
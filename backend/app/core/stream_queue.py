@@ -0,0 +1,749 @@
+"""
+Redis Streams Queue Engine
+Consumer-group alternative to the sorted-set QuestQueue (QUEUE_ENGINE=streams)
+"""
+import json
+import os
+import socket
+import time
+from typing import Dict, List, Optional, Any
+
+import structlog
+from redis.exceptions import ResponseError
+
+from app.core.queue import QuestQueue, JobStatus, RECORD_FINISHED_LUA
+
+logger = structlog.get_logger()
+
+
+# ----------------------------------------------------------------------------
+# Server-side scripts
+# Jobs live in one stream per priority lane; delivery, ownership and idle
+# time are tracked by the consumer group's pending entries list (PEL), so a
+# worker crash after XREADGROUP leaves the entry pending instead of lost.
+# ----------------------------------------------------------------------------
+
+# KEYS[1] = job hash, KEYS[2] = lane stream
+# ARGV[1] = group, ARGV[2] = entry id, ARGV[3] = now
+# Returns {field, value, ...} or nil if the job hash has expired
+STREAM_CLAIM_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('XACK', KEYS[2], ARGV[1], ARGV[2])
+    redis.call('XDEL', KEYS[2], ARGV[2])
+    return nil
+end
+
+redis.call('HSET', KEYS[1],
+    'status', 'processing',
+    'updated_at', ARGV[3],
+    'stream_key', KEYS[2],
+    'stream_id', ARGV[2])
+return redis.call('HGETALL', KEYS[1])
+"""
+
+# Shared helper: whether the caller's delivery is still the job's current one.
+# The lease is the entry ID the job was delivered by; the reaper re-adds a
+# stalled job as a new entry, so the stalled worker's lease stops matching.
+HOLDS_ENTRY_LUA = """
+local function holds_entry(job_key, lease)
+    local current = redis.call('HGET', job_key, 'stream_id')
+    if not current then
+        return false
+    end
+    return lease == '' or current == lease
+end
+"""
+
+# Shared helper: acknowledge and drop the stream entry a job was delivered by
+ACK_ENTRY_LUA = """
+local function ack_entry(job_key, group)
+    local entry = redis.call('HMGET', job_key, 'stream_key', 'stream_id')
+    if entry[1] and entry[2] then
+        redis.call('XACK', entry[1], group, entry[2])
+        redis.call('XDEL', entry[1], entry[2])
+        redis.call('HDEL', job_key, 'stream_key', 'stream_id')
+    end
+end
+"""
+
+# KEYS[1] = job hash, KEYS[2] = completed zset
+# ARGV[1] = job_id, ARGV[2] = now, ARGV[3] = JSON result ('' for none),
+# ARGV[4] = job key prefix, ARGV[5] = max completed, ARGV[6] = retention secs,
+# ARGV[7] = group, ARGV[8] = lease (entry id, '' = any)
+# Returns 1, or 0 if the lease was lost
+STREAM_COMPLETE_SCRIPT = RECORD_FINISHED_LUA + HOLDS_ENTRY_LUA + ACK_ENTRY_LUA + """
+if not holds_entry(KEYS[1], ARGV[8]) then
+    return 0
+end
+
+ack_entry(KEYS[1], ARGV[7])
+redis.call('HSET', KEYS[1],
+    'status', 'completed',
+    'completed_at', ARGV[2],
+    'updated_at', ARGV[2])
+if ARGV[3] ~= '' then
+    redis.call('HSET', KEYS[1], 'result', ARGV[3])
+end
+record_finished(KEYS[2], ARGV[4], ARGV[1], tonumber(ARGV[2]),
+    tonumber(ARGV[5]), tonumber(ARGV[6]))
+return 1
+"""
+
+# KEYS[1] = job hash, KEYS[2] = delayed zset, KEYS[3] = failed zset
+# ARGV[1] = job_id, ARGV[2] = error, ARGV[3] = now, ARGV[4] = max retries,
+# ARGV[5] = group, ARGV[6] = job key prefix, ARGV[7] = max failed,
+# ARGV[8] = retention secs, ARGV[9] = lease (entry id, '' = any),
+# ARGV[10..] = retry delays in ms
+# Returns {'retry', attempt, delay_ms}, {'failed', attempts, 0},
+# {'lost', 0, 0} if the lease was lost, or nil if the job hash has expired
+STREAM_FAIL_SCRIPT = RECORD_FINISHED_LUA + HOLDS_ENTRY_LUA + ACK_ENTRY_LUA + """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+
+if not holds_entry(KEYS[1], ARGV[9]) then
+    return {'lost', 0, 0}
+end
+
+ack_entry(KEYS[1], ARGV[5])
+
+local attempts = tonumber(redis.call('HGET', KEYS[1], 'attempts') or '0')
+local now = tonumber(ARGV[3])
+
+if attempts < tonumber(ARGV[4]) then
+    local delays = #ARGV - 9
+    local delay = tonumber(ARGV[10 + math.min(attempts, delays - 1)])
+    redis.call('HSET', KEYS[1],
+        'status', 'retry',
+        'attempts', tostring(attempts + 1),
+        'last_error', ARGV[2],
+        'updated_at', ARGV[3])
+    redis.call('ZADD', KEYS[2], now + delay / 1000, ARGV[1])
+    return {'retry', attempts + 1, delay}
+end
+
+redis.call('HSET', KEYS[1],
+    'status', 'failed',
+    'failed_at', ARGV[3],
+    'last_error', ARGV[2],
+    'updated_at', ARGV[3])
+record_finished(KEYS[3], ARGV[6], ARGV[1], now, tonumber(ARGV[7]), tonumber(ARGV[8]))
+return {'failed', attempts + 1, 0}
+"""
+
+# KEYS[1] = delayed zset, KEYS[2..4] = high/normal/low lane streams
+# ARGV[1] = job key prefix, ARGV[2] = now, ARGV[3] = batch limit
+# Returns number of jobs promoted
+STREAM_PROMOTE_DELAYED_SCRIPT = """
+local ready = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[2],
+    'LIMIT', 0, tonumber(ARGV[3]))
+local promoted = 0
+
+for _, job_id in ipairs(ready) do
+    redis.call('ZREM', KEYS[1], job_id)
+    local priority = redis.call('HGET', ARGV[1] .. job_id, 'priority')
+
+    if priority then
+        local lane = KEYS[3]
+        if tonumber(priority) > 0 then
+            lane = KEYS[2]
+        elseif tonumber(priority) < 0 then
+            lane = KEYS[4]
+        end
+        redis.call('XADD', lane, '*', 'job_id', job_id)
+        promoted = promoted + 1
+    end
+end
+return promoted
+"""
+
+# KEYS[1] = failed zset, KEYS[2..] = lane streams
+# ARGV[1] = group, ARGV[2] = consumer, ARGV[3] = min idle ms,
+# ARGV[4] = batch limit, ARGV[5] = job key prefix, ARGV[6] = now,
+# ARGV[7] = max stalls, ARGV[8] = max failed, ARGV[9] = retention secs
+# Returns {requeued_count, {failed_job_id, ...}}
+STREAM_REAP_STALLED_SCRIPT = RECORD_FINISHED_LUA + """
+local requeued = 0
+local failed = {}
+
+for i = 2, #KEYS do
+    local lane = KEYS[i]
+    local claimed = redis.call('XAUTOCLAIM', lane, ARGV[1], ARGV[2],
+        ARGV[3], '0-0', 'COUNT', tonumber(ARGV[4]))
+
+    for _, entry in ipairs(claimed[2]) do
+        local entry_id = entry[1]
+        local fields = entry[2]
+        redis.call('XACK', lane, ARGV[1], entry_id)
+        redis.call('XDEL', lane, entry_id)
+
+        if fields then
+            local job_id = fields[2]
+            local job_key = ARGV[5] .. job_id
+
+            if redis.call('EXISTS', job_key) == 1 then
+                redis.call('HDEL', job_key, 'stream_key', 'stream_id')
+                local stalls = redis.call('HINCRBY', job_key, 'stalled_count', 1)
+
+                if stalls > tonumber(ARGV[7]) then
+                    redis.call('HSET', job_key,
+                        'status', 'failed',
+                        'failed_at', ARGV[6],
+                        'last_error', 'Job stalled ' .. stalls .. ' times',
+                        'updated_at', ARGV[6])
+                    record_finished(KEYS[1], ARGV[5], job_id, tonumber(ARGV[6]),
+                        tonumber(ARGV[8]), tonumber(ARGV[9]))
+                    failed[#failed + 1] = job_id
+                else
+                    redis.call('HSET', job_key, 'status', 'pending', 'updated_at', ARGV[6])
+                    redis.call('XADD', lane, '*', 'job_id', job_id)
+                    requeued = requeued + 1
+                end
+            end
+        end
+    end
+end
+
+return {requeued, failed}
+"""
+
+
+# KEYS = lane streams
+# ARGV[1] = group, ARGV[2] = consumer name ('' = any), ARGV[3] = min idle ms
+# Deletes matching consumers that have nothing pending (deleting one with
+# pending entries would orphan them); atomic, so none can read in between
+# Returns number of consumers deleted
+STREAM_DELETE_CONSUMERS_SCRIPT = """
+local deleted = 0
+
+for _, lane in ipairs(KEYS) do
+    for _, consumer in ipairs(redis.call('XINFO', 'CONSUMERS', lane, ARGV[1])) do
+        local info = {}
+        for i = 1, #consumer, 2 do
+            info[consumer[i]] = consumer[i + 1]
+        end
+
+        if info['pending'] == 0
+            and (ARGV[2] == '' or info['name'] == ARGV[2])
+            and info['idle'] >= tonumber(ARGV[3]) then
+            redis.call('XGROUP', 'DELCONSUMER', lane, ARGV[1], info['name'])
+            deleted = deleted + 1
+        end
+    end
+end
+return deleted
+"""
+
+
+class StreamQuestQueue(QuestQueue):
+    """
+    Redis Streams implementation of the QuestQueue API
+
+    - One stream per priority lane (high/normal/low), read in priority order
+    - Consumer group gives at-least-once delivery and per-consumer accounting
+    - Stalled entries are recovered with XAUTOCLAIM; stats come from XPENDING
+    - Entries are only read one lane at a time with COUNT 1; idle workers
+      wait with a plain XREAD, which delivers nothing into the PEL
+    - A job's lease is the entry ID it was delivered by
+    - Consumers with nothing pending are deleted on disconnect and, once
+      idle for consumer_idle_timeout, by compaction
+    - Job hashes, delayed retries and finished-job indexes are shared with
+      the sorted-set engine
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.group_name = "quest-workers"
+        self.consumer_name = None
+        self.lane_keys = [
+            f"{self.queue_name}:stream:{lane}" for lane in ("high", "normal", "low")
+        ]
+        self._entries: Dict[str, tuple] = {}  # job_id -> (stream key, entry id)
+        self.consumer_idle_timeout = max(self.visibility_timeout * 10, 3600)  # seconds
+
+        self._stream_claim_script = None
+        self._stream_complete_script = None
+        self._stream_fail_script = None
+        self._stream_promote_script = None
+        self._stream_reap_script = None
+        self._stream_delete_consumers_script = None
+
+    async def connect(self):
+        """Connect to Redis and ensure the consumer group exists on every lane"""
+        if not await super().connect():
+            return False
+
+        # Resolved per process, so forked workers are distinct consumers
+        self.consumer_name = f"{socket.gethostname()}:{os.getpid()}"
+
+        try:
+            for lane_key in self.lane_keys:
+                try:
+                    await self.redis_client.xgroup_create(
+                        lane_key, self.group_name, id="0", mkstream=True
+                    )
+                except ResponseError as e:
+                    if "BUSYGROUP" not in str(e):
+                        raise
+            return True
+
+        except Exception as e:
+            logger.error("queue.stream_group_setup_failed", error=str(e))
+            self.redis_client = None
+            return False
+
+    async def disconnect(self):
+        """Leave the consumer group (if nothing is pending for us) and disconnect"""
+        if self.redis_client and self.consumer_name:
+            await self._delete_consumers(consumer=self.consumer_name)
+        await super().disconnect()
+
+    def _register_scripts(self):
+        """Register Lua scripts for both engines"""
+        super()._register_scripts()
+        self._stream_claim_script = self.redis_client.register_script(STREAM_CLAIM_SCRIPT)
+        self._stream_complete_script = self.redis_client.register_script(STREAM_COMPLETE_SCRIPT)
+        self._stream_fail_script = self.redis_client.register_script(STREAM_FAIL_SCRIPT)
+        self._stream_promote_script = self.redis_client.register_script(STREAM_PROMOTE_DELAYED_SCRIPT)
+        self._stream_reap_script = self.redis_client.register_script(STREAM_REAP_STALLED_SCRIPT)
+        self._stream_delete_consumers_script = self.redis_client.register_script(
+            STREAM_DELETE_CONSUMERS_SCRIPT
+        )
+
+    def _lane_key(self, priority: int) -> str:
+        """Stream key for a job priority"""
+        if priority > 0:
+            return self.lane_keys[0]
+        if priority < 0:
+            return self.lane_keys[2]
+        return self.lane_keys[1]
+
+    def _stage_waiting(self, pipe, job_id: str, priority: int):
+        """Queue an XADD onto the job's priority lane in the given pipeline"""
+        pipe.xadd(self._lane_key(priority), {"job_id": job_id})
+
+    def _stage_signal(self, pipe, job_ids: List[str]):
+        """Stream readers are woken by XADD itself - no marker list needed"""
+        return None
+
+    async def dequeue(self) -> Optional[Dict]:
+        """
+        Get next job from queue (highest priority lane first)
+
+        Returns:
+            Job data if available, None otherwise
+        """
+        if not self.redis_client:
+            if not await self.connect():
+                return None
+
+        try:
+            await self._process_delayed_jobs()
+
+            for lane_key in self.lane_keys:
+                entries = await self.redis_client.xreadgroup(
+                    self.group_name,
+                    self.consumer_name,
+                    {lane_key: ">"},
+                    count=1
+                )
+                if entries:
+                    return await self._claim_entry(entries)
+
+            return None
+
+        except Exception as e:
+            logger.error("queue.dequeue_failed", error=str(e))
+            return None
+
+    async def wait_for_job(self) -> Optional[Dict]:
+        """
+        Get next job from queue, blocking on all lanes until one has work
+
+        The wait is a plain XREAD from each lane's last generated ID, taken
+        before the dequeue attempt so nothing added in between is missed.
+        It only wakes the worker; the job is then read with dequeue(), so a
+        wake-up on several lanes never leaves extra entries pending for a
+        worker that will not process them.
+
+        Returns:
+            Job data if available, None if the wait timed out
+        """
+        if not self.redis_client:
+            return await self.dequeue()
+
+        try:
+            last_ids = await self._last_ids()
+        except Exception as e:
+            logger.error("queue.wait_failed", error=str(e))
+            return None
+
+        job = await self.dequeue()
+
+        if job or not self.redis_client:
+            return job
+
+        try:
+            block = await self._block_time()
+
+            if block > 0:
+                woken = await self.redis_client.xread(
+                    last_ids,
+                    count=1,
+                    block=max(int(block * 1000), 1)
+                )
+                if not woken and block == self.block_timeout:
+                    return None
+
+        except Exception as e:
+            logger.error("queue.wait_failed", error=str(e))
+            return None
+
+        return await self.dequeue()
+
+    async def _last_ids(self) -> Dict[str, str]:
+        """Last generated entry ID of every lane (XREAD starts after it)"""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for lane_key in self.lane_keys:
+                pipe.xinfo_stream(lane_key)
+            infos = await pipe.execute()
+
+        return {
+            lane_key: info["last-generated-id"]
+            for lane_key, info in zip(self.lane_keys, infos)
+        }
+
+    async def _claim_entry(self, entries: List) -> Optional[Dict]:
+        """Mark a delivered stream entry's job as processing and load it"""
+        # Lanes are read one at a time with COUNT 1: exactly one entry
+        lane_key, messages = entries[0]
+        entry_id, fields = messages[0]
+        job_id = fields["job_id"]
+
+        result = await self._stream_claim_script(
+            keys=[f"{self.job_prefix}{job_id}", lane_key],
+            args=[self.group_name, entry_id, time.time()]
+        )
+
+        if not result:
+            logger.warning("queue.job_not_found", job_id=job_id)
+            return None
+
+        self._entries[job_id] = (lane_key, entry_id)
+
+        job_data = dict(zip(result[::2], result[1::2]))
+        job = {
+            k: json.loads(v) if k in ["data"] else v
+            for k, v in job_data.items()
+        }
+        job["lease"] = entry_id
+
+        logger.info(
+            "queue.job_dequeued",
+            job_id=job_id,
+            job_type=job.get("type"),
+            stream=lane_key
+        )
+
+        return job
+
+    async def complete_job(self, job_id: str, result: Any = None, lease: Optional[str] = None) -> bool:
+        """
+        Mark job as completed (XACK + XDEL its stream entry)
+
+        Args:
+            job_id: Job ID
+            result: Job result data
+            lease: Lease token from dequeue (None = whoever holds the job)
+
+        Returns:
+            True if completed, False if the lease was lost (the job was
+            reaped and may be running elsewhere) or Redis failed
+        """
+        if not self.redis_client:
+            return False
+
+        self._entries.pop(job_id, None)
+
+        try:
+            completed = await self._stream_complete_script(
+                keys=[
+                    f"{self.job_prefix}{job_id}",
+                    f"{self.queue_name}:completed"
+                ],
+                args=[
+                    job_id,
+                    time.time(),
+                    json.dumps(result) if result is not None else "",
+                    self.job_prefix,
+                    self.keep_completed,
+                    self.retention,
+                    self.group_name,
+                    lease or ""
+                ]
+            )
+
+            if not completed:
+                logger.warning("queue.lease_lost", job_id=job_id, action="complete")
+                return False
+
+            logger.info("queue.job_completed", job_id=job_id)
+            return True
+
+        except Exception as e:
+            logger.error(
+                "queue.complete_job_failed",
+                job_id=job_id,
+                error=str(e)
+            )
+            return False
+
+    async def fail_job(self, job_id: str, error: str, lease: Optional[str] = None):
+        """
+        Mark job as failed and handle retries
+
+        Args:
+            job_id: Job ID
+            error: Error message
+            lease: Lease token from dequeue (None = whoever holds the job)
+        """
+        if not self.redis_client:
+            return
+
+        self._entries.pop(job_id, None)
+
+        try:
+            outcome = await self._stream_fail_script(
+                keys=[
+                    f"{self.job_prefix}{job_id}",
+                    f"{self.queue_name}:delayed",
+                    f"{self.queue_name}:failed"
+                ],
+                args=[
+                    job_id,
+                    error,
+                    time.time(),
+                    self.max_retries,
+                    self.group_name,
+                    self.job_prefix,
+                    self.keep_failed,
+                    self.retention,
+                    lease or "",
+                    *self.retry_delay
+                ]
+            )
+
+            if not outcome:
+                return
+
+            state, attempt, delay = outcome
+
+            if state == "lost":
+                logger.warning("queue.lease_lost", job_id=job_id, action="fail", error=error)
+            elif state == JobStatus.RETRY.value:
+                logger.info(
+                    "queue.job_retry",
+                    job_id=job_id,
+                    attempt=attempt,
+                    delay=delay
+                )
+            else:
+                logger.error(
+                    "queue.job_failed",
+                    job_id=job_id,
+                    attempts=attempt,
+                    error=error
+                )
+
+        except Exception as e:
+            logger.error(
+                "queue.fail_job_error",
+                job_id=job_id,
+                error=str(e)
+            )
+
+    async def extend_leases(self, leases: Dict[str, Optional[str]]) -> int:
+        """
+        Heartbeat: reset the PEL idle time of in-flight entries (XCLAIM JUSTID)
+
+        Args:
+            leases: Job ID -> lease token of the jobs this worker is processing
+
+        Returns:
+            Number of leases extended
+        """
+        entries = [self._entries[job_id] for job_id in leases if job_id in self._entries]
+
+        if not self.redis_client or not entries:
+            return 0
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for lane_key, entry_id in entries:
+                    pipe.xclaim(
+                        lane_key,
+                        self.group_name,
+                        self.consumer_name,
+                        min_idle_time=0,
+                        message_ids=[entry_id],
+                        justid=True
+                    )
+                claimed = await pipe.execute()
+
+            return sum(1 for ids in claimed if ids)
+
+        except Exception as e:
+            logger.error("queue.extend_leases_failed", error=str(e))
+            return 0
+
+    async def reap_stalled_jobs(self) -> List[str]:
+        """
+        XAUTOCLAIM entries idle past the visibility timeout and requeue them
+
+        Returns:
+            IDs of jobs that were failed for stalling too often
+        """
+        if not self.redis_client:
+            return []
+
+        try:
+            requeued, failed = await self._stream_reap_script(
+                keys=[f"{self.queue_name}:failed", *self.lane_keys],
+                args=[
+                    self.group_name,
+                    self.consumer_name,
+                    int(self.visibility_timeout * 1000),
+                    self.reap_batch_size,
+                    self.job_prefix,
+                    time.time(),
+                    self.max_stalls,
+                    self.keep_failed,
+                    self.retention
+                ]
+            )
+
+            if requeued or failed:
+                logger.warning(
+                    "queue.stalled_jobs_reaped",
+                    requeued=requeued,
+                    failed=failed
+                )
+
+            return failed
+
+        except Exception as e:
+            logger.error("queue.reap_stalled_failed", error=str(e))
+            return []
+
+    async def compact_finished_jobs(self) -> Dict[str, int]:
+        """
+        Trim the finished-job indexes and drop long-idle consumers
+
+        Returns:
+            Number of entries removed per index
+        """
+        removed = await super().compact_finished_jobs()
+
+        if self.redis_client:
+            await self._delete_consumers(min_idle_ms=int(self.consumer_idle_timeout * 1000))
+
+        return removed
+
+    async def _delete_consumers(self, consumer: str = "", min_idle_ms: int = 0) -> int:
+        """
+        XGROUP DELCONSUMER consumers that have nothing pending
+
+        Args:
+            consumer: Only this consumer ('' = any)
+            min_idle_ms: Only consumers idle at least this long
+
+        Returns:
+            Number of consumers deleted
+        """
+        try:
+            deleted = await self._stream_delete_consumers_script(
+                keys=self.lane_keys,
+                args=[self.group_name, consumer, min_idle_ms]
+            )
+
+            if deleted:
+                logger.info("queue.consumers_deleted", count=deleted)
+
+            return deleted
+
+        except Exception as e:
+            logger.error("queue.delete_consumers_failed", error=str(e))
+            return 0
+
+    async def _process_delayed_jobs(self) -> int:
+        """
+        Move ready delayed jobs onto their priority lane
+
+        Returns:
+            Number of jobs promoted
+        """
+        if not self.redis_client:
+            return 0
+
+        try:
+            promoted = await self._stream_promote_script(
+                keys=[f"{self.queue_name}:delayed", *self.lane_keys],
+                args=[self.job_prefix, time.time(), self.promote_batch_size]
+            )
+
+            if promoted:
+                logger.debug("queue.delayed_jobs_ready", count=promoted)
+
+            return promoted
+
+        except Exception as e:
+            logger.error("queue.process_delayed_failed", error=str(e))
+            return 0
+
+    async def get_queue_stats(self) -> Dict:
+        """Get queue statistics (XLEN/XPENDING per lane)"""
+        stats = {
+            "connected": False,
+            "waiting": 0,
+            "processing": 0,
+            "completed": 0,
+            "failed": 0,
+            "delayed": 0,
+            "stalled": 0
+        }
+
+        if not self.redis_client:
+            return stats
+
+        try:
+            idle_ms = int(self.visibility_timeout * 1000)
+
+            for lane_key in self.lane_keys:
+                length = await self.redis_client.xlen(lane_key)
+                pending = await self.redis_client.xpending(lane_key, self.group_name)
+                stalled = await self.redis_client.xpending_range(
+                    lane_key,
+                    self.group_name,
+                    min="-",
+                    max="+",
+                    count=self.reap_batch_size,
+                    idle=idle_ms
+                )
+
+                # Acked entries are deleted, so length = undelivered + pending
+                stats["waiting"] += length - pending["pending"]
+                stats["processing"] += pending["pending"]
+                stats["stalled"] += len(stalled)
+
+            stats.update({
+                "connected": True,
+                "completed": await self.redis_client.zcard(f"{self.queue_name}:completed"),
+                "failed": await self.redis_client.zcard(f"{self.queue_name}:failed"),
+                "delayed": await self.redis_client.zcard(f"{self.queue_name}:delayed")
+            })
+            return stats
+
+        except Exception as e:
+            logger.error("queue.stats_failed", error=str(e))
+            stats["connected"] = False
+            return stats
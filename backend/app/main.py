@@ -13,6 +13,9 @@ from prometheus_client import make_asgi_app
 from app.core.config import settings
 from app.core.database import init_db, close_db
 from app.core.redis_client import init_redis, close_redis
+from app.core.http_client import init_http_clients, close_http_clients
+from app.core.gemini_executor import close_gemini_executor
+from app.core.reuse_counters import reuse_counters
 from app.api import articles, jobs, health
 
 # Setup structured logging
@@ -39,10 +42,19 @@ async def lifespan(app: FastAPI):
         logger.warning("quest.redis.connection_failed", error=str(e), msg="Continuing without Redis - queue features disabled")
         # Continue without Redis - queue features will be disabled
 
+    # Shared keep-alive pools for research provider calls
+    await init_http_clients()
+
+    # Write-behind cluster cache reuse counts
+    reuse_counters.start()
+
     yield
 
     # Shutdown
     logger.info("quest.shutdown")
+    await reuse_counters.stop()
+    await close_http_clients()
+    close_gemini_executor()
     await close_redis()
     await close_db()
 
@@ -0,0 +1,274 @@
+"""
+Multi-process Worker Supervisor for Quest Platform
+Forks WORKER_PROCESSES QuestWorkers so CPU-bound stages don't stall every job
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+from prometheus_client import Counter, Gauge, start_http_server
+
+from app.core.config import settings
+from app.worker import QuestWorker, configure_logging
+
+logger = structlog.get_logger()
+
+# Per-child liveness metrics (exported from the supervisor process)
+WORKER_UP = Gauge(
+    "quest_worker_up",
+    "Whether the worker process in this slot is alive",
+    ["slot"]
+)
+WORKER_HEARTBEAT = Gauge(
+    "quest_worker_last_heartbeat_timestamp",
+    "Unix time of the last event-loop heartbeat from this slot",
+    ["slot"]
+)
+WORKER_RESTARTS = Counter(
+    "quest_worker_restarts_total",
+    "Number of times the worker in this slot was restarted",
+    ["slot"]
+)
+
+
+def usable_cpus() -> int:
+    """
+    CPUs this process may actually use
+
+    os.cpu_count() reports the host's cores, which inside a container can be
+    many times the CPU quota. Uses the affinity mask and, when set, the
+    cgroup CPU quota (v2 cpu.max, else v1 cfs quota/period).
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = None
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            limit, period = f.read().split()[:2]
+        if limit != "max":
+            quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                limit = int(f.read())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = int(f.read())
+            if limit > 0:
+                quota = limit / period
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        cpus = min(cpus, max(int(quota), 1))
+
+    return max(cpus, 1)
+
+
+async def _run_child(heartbeat):
+    """
+    Run a QuestWorker in this process, beating a shared heartbeat
+
+    The heartbeat is written from the worker's own event loop, so a stale
+    value means the loop is blocked (not just that the process is alive).
+    """
+    async def beat():
+        while True:
+            heartbeat.value = time.time()
+            await asyncio.sleep(WorkerSupervisor.heartbeat_interval)
+
+    beat_task = asyncio.create_task(beat())
+    try:
+        await QuestWorker().start()
+    finally:
+        beat_task.cancel()
+
+
+def _child_entry(slot: int, heartbeat):
+    """Child process entry point - fresh event loop and connection pools"""
+    # Drop the supervisor's handlers; QuestWorker installs its own
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    configure_logging()
+    structlog.contextvars.bind_contextvars(worker_slot=slot)
+
+    try:
+        asyncio.run(_run_child(heartbeat))
+    except Exception as e:
+        logger.error("supervisor.child_fatal_error", slot=slot, error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+class WorkerSupervisor:
+    """
+    Supervises K worker processes, each with its own asyncio loop
+
+    - Restarts crashed children (with per-slot exponential backoff)
+    - Kills and restarts children whose event loop stops heartbeating
+    - Forwards SIGTERM/SIGINT so children drain in-flight jobs
+    - Exports per-child liveness via Prometheus on WORKER_PORT
+    """
+
+    heartbeat_interval = 5  # seconds
+
+    def __init__(self, processes: Optional[int] = None):
+        # Each process opens DB_POOL_SIZE connections and runs QUEUE_CONCURRENCY jobs
+        self.processes = processes or settings.WORKER_PROCESSES or usable_cpus()
+        self.ctx = multiprocessing.get_context("fork")
+        self.children: Dict[int, multiprocessing.Process] = {}
+        self.heartbeats: Dict[int, Any] = {}
+        self.started_at: Dict[int, float] = {}
+        self.restart_at: Dict[int, float] = {}
+        self.failures: Dict[int, int] = {}
+        self.kill_at: Dict[int, float] = {}  # slot -> SIGKILL deadline of a terminated child
+        self.unresponsive_after = settings.WORKER_UNRESPONSIVE_SECONDS  # seconds without a heartbeat
+        self.kill_grace = settings.WORKER_KILL_GRACE_SECONDS
+        self.running = False
+        self.shutdown_timeout = settings.WORKER_DRAIN_TIMEOUT + 15  # seconds
+        self.check_interval = 1  # seconds
+        self.max_backoff = 60  # seconds
+
+    def start(self):
+        """Start supervisor and block until shutdown"""
+        logger.info("supervisor.starting", processes=self.processes)
+
+        signal.signal(signal.SIGTERM, self._handle_shutdown)
+        signal.signal(signal.SIGINT, self._handle_shutdown)
+
+        self.running = True
+        for slot in range(self.processes):
+            self._spawn(slot)
+
+        # After the first fork: forking a process that already runs the
+        # exporter thread is unsafe (held locks are copied into the child).
+        # Respawned children still fork from a threaded parent; the
+        # exporter only holds its locks while serving a scrape.
+        if settings.PROMETHEUS_ENABLED:
+            start_http_server(settings.WORKER_PORT)
+            logger.info("supervisor.metrics_exported", port=settings.WORKER_PORT)
+
+        while self.running:
+            self._check_children()
+            time.sleep(self.check_interval)
+
+        self._shutdown()
+
+    def _spawn(self, slot: int):
+        """Fork a worker process into the given slot"""
+        heartbeat = self.heartbeats.setdefault(slot, self.ctx.Value("d", 0.0))
+        heartbeat.value = time.time()
+
+        process = self.ctx.Process(
+            target=_child_entry,
+            args=(slot, heartbeat),
+            name=f"quest-worker-{slot}"
+        )
+        process.start()
+
+        self.children[slot] = process
+        self.started_at[slot] = time.time()
+        self.restart_at.pop(slot, None)
+        self.kill_at.pop(slot, None)
+        WORKER_UP.labels(slot=str(slot)).set(1)
+
+        logger.info("supervisor.worker_started", slot=slot, pid=process.pid)
+
+    def _check_children(self):
+        """Restart dead children and update liveness metrics"""
+        now = time.time()
+
+        for slot, process in list(self.children.items()):
+            labels = {"slot": str(slot)}
+            last_beat = self.heartbeats[slot].value
+            WORKER_HEARTBEAT.labels(**labels).set(last_beat)
+
+            if process.is_alive():
+                WORKER_UP.labels(**labels).set(1)
+
+                # A child that stays up past the max backoff resets its backoff
+                if now - self.started_at[slot] > self.max_backoff:
+                    self.failures.pop(slot, None)
+
+                if slot in self.kill_at:
+                    # Terminated as unresponsive and still not gone
+                    if now >= self.kill_at[slot]:
+                        logger.warning("supervisor.worker_killed", slot=slot, pid=process.pid)
+                        process.kill()
+                elif now - last_beat > self.unresponsive_after:
+                    # Its event loop is blocked: replace it (its jobs' leases
+                    # lapse and are reaped by the other workers)
+                    logger.error(
+                        "supervisor.worker_unresponsive",
+                        slot=slot,
+                        pid=process.pid,
+                        seconds_since_heartbeat=round(now - last_beat)
+                    )
+                    process.terminate()
+                    self.kill_at[slot] = now + self.kill_grace
+                continue
+
+            WORKER_UP.labels(**labels).set(0)
+
+            # Schedule a restart with backoff (crash loops shouldn't spin)
+            if slot not in self.restart_at:
+                failures = self.failures.get(slot, 0) + 1
+                self.failures[slot] = failures
+                delay = min(2 ** (failures - 1), self.max_backoff)
+                self.restart_at[slot] = now + delay
+
+                logger.error(
+                    "supervisor.worker_died",
+                    slot=slot,
+                    pid=process.pid,
+                    exitcode=process.exitcode,
+                    restart_in=delay
+                )
+                process.join(timeout=0)
+
+            if now >= self.restart_at[slot]:
+                WORKER_RESTARTS.labels(**labels).inc()
+                self._spawn(slot)
+
+    def _handle_shutdown(self, signum, frame):
+        """Handle shutdown signal"""
+        logger.info("supervisor.shutdown_signal_received", signal=signum)
+        self.running = False
+
+    def _shutdown(self):
+        """Forward SIGTERM and wait for children to drain"""
+        logger.info("supervisor.shutting_down", timeout=self.shutdown_timeout)
+
+        for process in self.children.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+        deadline = time.time() + self.shutdown_timeout
+        for slot, process in self.children.items():
+            process.join(timeout=max(deadline - time.time(), 0))
+
+            if process.is_alive():
+                logger.warning("supervisor.worker_killed", slot=slot, pid=process.pid)
+                process.kill()
+                process.join()
+
+            WORKER_UP.labels(slot=str(slot)).set(0)
+
+        logger.info("supervisor.shutdown_complete")
+
+
+def main():
+    """Supervisor entry point"""
+    configure_logging()
+    WorkerSupervisor().start()
+
+
+if __name__ == "__main__":
+    main()
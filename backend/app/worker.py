@@ -5,13 +5,18 @@ Background job processor for article generation
 import asyncio
 import signal
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 
 import structlog
 
 from app.core.config import settings
 from app.core.queue import queue, JobStatus
-from app.core.database import get_db
+from app.core.database import get_db, init_db, close_db
+from app.core.http_client import init_http_clients, close_http_clients
+from app.core.gemini_executor import close_gemini_executor
+from app.core.redis_client import init_redis, close_redis
+from app.core.research_refresher import research_refresher
+from app.core.reuse_counters import reuse_counters
 from app.agents.orchestrator import ArticleOrchestrator
 
 logger = structlog.get_logger()
@@ -19,19 +24,35 @@ logger = structlog.get_logger()
 
 class QuestWorker:
     """
-    Worker process that polls Redis queue and processes article generation jobs
+    Worker process that blocks on the Redis queue and processes article generation jobs
     """
 
     def __init__(self):
         self.orchestrator = ArticleOrchestrator()
         self.running = False
-        self.current_job = None
-        self.poll_interval = 5  # seconds
+        self.concurrency = max(1, settings.QUEUE_CONCURRENCY)
+        self.active_jobs: Dict[str, asyncio.Task] = {}  # job_id -> in-flight task
+        self.leases: Dict[str, Optional[str]] = {}  # job_id -> lease token from dequeue
+        self.poll_interval = 5  # seconds (reconnect backoff when Redis is down)
+        self.drain_timeout = settings.WORKER_DRAIN_TIMEOUT  # seconds
+        self.heartbeat_interval = max(queue.visibility_timeout // 3, 1)  # seconds
+        self.reap_interval = 30  # seconds
+        self.compact_interval = 600  # seconds
 
     async def start(self):
         """Start worker process"""
         logger.info("worker.starting", redis_url=settings.REDIS_URL[:30] + "..." if settings.REDIS_URL else "None")
 
+        # Per-process connection pools
+        await init_db()
+        await init_http_clients()
+
+        # Shared Redis client for caches (the queue keeps its own connection)
+        try:
+            await init_redis()
+        except Exception as e:
+            logger.warning("worker.redis_cache_unavailable", error=str(e))
+
         # Connect to queue
         connected = await queue.connect()
         if not connected:
@@ -44,20 +65,37 @@ class QuestWorker:
         signal.signal(signal.SIGINT, self._handle_shutdown)
 
         self.running = True
-        logger.info("worker.ready")
-
-        # Main worker loop
+        reuse_counters.start()
+        research_refresher.start()
+        maintenance = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._reaper_loop()),
+            asyncio.create_task(self._compaction_loop())
+        ]
+        logger.info("worker.ready", concurrency=self.concurrency)
+
+        # Main worker loop - only claim a job while a slot is free
         while self.running:
             try:
-                # Get next job from queue
-                job = await queue.dequeue()
+                if len(self.active_jobs) >= self.concurrency:
+                    # All slots busy - wait for one to free up (re-checking shutdown)
+                    await asyncio.wait(
+                        list(self.active_jobs.values()),
+                        timeout=self.poll_interval,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+
+                # Block until a job is available (bounded by QUEUE_BLOCK_TIMEOUT)
+                job = await queue.wait_for_job()
 
                 if job:
-                    self.current_job = job
-                    await self._process_job(job)
-                    self.current_job = None
-                else:
-                    # No jobs available, wait before polling again
+                    self.leases[job.get("id")] = job.get("lease")
+                    self.active_jobs[job.get("id")] = asyncio.create_task(
+                        self._run_job(job)
+                    )
+                elif not queue.redis_client:
+                    # Queue unavailable, back off before reconnecting
                     await asyncio.sleep(self.poll_interval)
 
             except Exception as e:
@@ -68,8 +106,21 @@ class QuestWorker:
                 )
                 await asyncio.sleep(self.poll_interval)
 
-        # Cleanup on shutdown
-        await self._shutdown()
+        # Cleanup on shutdown (leases keep beating until jobs have drained)
+        await self._shutdown(maintenance)
+
+    async def _run_job(self, job: dict):
+        """
+        Run a claimed job in its own task and free its slot when done
+
+        Args:
+            job: Job data from queue
+        """
+        try:
+            await self._process_job(job)
+        finally:
+            self.active_jobs.pop(job.get("id"), None)
+            self.leases.pop(job.get("id"), None)
 
     async def _process_job(self, job: dict):
         """
@@ -81,6 +132,7 @@ class QuestWorker:
         job_id = job.get("id")
         job_type = job.get("type")
         job_data = job.get("data", {})
+        lease = job.get("lease")
 
         logger.info(
             "worker.processing_job",
@@ -90,14 +142,14 @@ class QuestWorker:
 
         try:
             if job_type == "generate_article":
-                await self._process_article_generation(job_id, job_data)
+                await self._process_article_generation(job_id, job_data, lease)
             else:
                 logger.warning(
                     "worker.unknown_job_type",
                     job_id=job_id,
                     job_type=job_type
                 )
-                await queue.fail_job(job_id, f"Unknown job type: {job_type}")
+                await queue.fail_job(job_id, f"Unknown job type: {job_type}", lease)
 
         except Exception as e:
             logger.error(
@@ -106,15 +158,16 @@ class QuestWorker:
                 error=str(e),
                 exc_info=True
             )
-            await queue.fail_job(job_id, str(e))
+            await queue.fail_job(job_id, str(e), lease)
 
-    async def _process_article_generation(self, job_id: str, data: dict):
+    async def _process_article_generation(self, job_id: str, data: dict, lease: Optional[str] = None):
         """
         Process article generation job
 
         Args:
             job_id: Job ID
             data: Job data containing topic, target_site, etc.
+            lease: Lease token the job was claimed under
         """
         topic = data.get("topic")
         target_site = data.get("target_site", "relocation")
@@ -136,8 +189,10 @@ class QuestWorker:
                 priority=priority
             )
 
-            # Mark job as completed
-            await queue.complete_job(job_id, result)
+            # Mark job as completed (unless it was reaped and handed to another worker)
+            if not await queue.complete_job(job_id, result, lease):
+                logger.warning("worker.job_lease_lost", job_id=job_id)
+                return
 
             # Update job status in database
             pool = get_db()
@@ -183,6 +238,44 @@ class QuestWorker:
 
             raise
 
+    async def _heartbeat_loop(self):
+        """Extend the leases of in-flight jobs so they aren't reaped"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            if self.active_jobs:
+                await queue.extend_leases({job_id: self.leases.get(job_id) for job_id in self.active_jobs})
+
+    async def _reaper_loop(self):
+        """Requeue jobs whose lease expired (e.g. their worker died)"""
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            if not self.running:
+                continue
+
+            failed = await queue.reap_stalled_jobs()
+
+            if failed:
+                try:
+                    pool = get_db()
+                    async with pool.acquire() as conn:
+                        await conn.executemany(
+                            """
+                            UPDATE job_status
+                            SET status = $1, error_message = $2, updated_at = NOW()
+                            WHERE job_id = $3
+                            """,
+                            [("failed", "Job stalled too many times", job_id) for job_id in failed]
+                        )
+                except Exception as e:
+                    logger.error("worker.stalled_status_update_failed", error=str(e))
+
+    async def _compaction_loop(self):
+        """Keep the completed/failed job indexes bounded"""
+        while True:
+            await asyncio.sleep(self.compact_interval)
+            if self.running:
+                await queue.compact_finished_jobs()
+
     def _handle_shutdown(self, signum, frame):
         """Handle shutdown signal"""
         logger.info(
@@ -191,23 +284,42 @@ class QuestWorker:
         )
         self.running = False
 
-    async def _shutdown(self):
+    async def _shutdown(self, maintenance: List[asyncio.Task]):
         """Graceful shutdown"""
         logger.info("worker.shutting_down")
 
-        # Wait for current job to complete (max 30 seconds)
-        if self.current_job:
+        # Drain in-flight jobs (bounded by drain_timeout)
+        if self.active_jobs:
             logger.info(
-                "worker.waiting_for_current_job",
-                job_id=self.current_job.get("id")
+                "worker.draining_jobs",
+                job_ids=list(self.active_jobs)
+            )
+            _, pending = await asyncio.wait(
+                list(self.active_jobs.values()),
+                timeout=self.drain_timeout
             )
-            for _ in range(30):
-                if not self.current_job:
-                    break
-                await asyncio.sleep(1)
 
-        # Disconnect from queue
+            # Abandon stragglers - their leases expire and the jobs are reclaimed
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning("worker.jobs_abandoned", count=len(pending))
+
+        for task in maintenance:
+            task.cancel()
+        await asyncio.gather(*maintenance, return_exceptions=True)
+
+        # Stop background refreshes, write the cache hits counted since the last flush
+        await research_refresher.stop()
+        await reuse_counters.stop()
+
+        # Disconnect from queue, database and upstream APIs
         await queue.disconnect()
+        await close_http_clients()
+        close_gemini_executor()
+        await close_redis()
+        await close_db()
 
         logger.info("worker.shutdown_complete")
 
@@ -218,10 +330,11 @@ async def main():
     await worker.start()
 
 
-if __name__ == "__main__":
-    # Set up logging
+def configure_logging():
+    """Configure structlog for worker processes"""
     structlog.configure(
         processors=[
+            structlog.contextvars.merge_contextvars,
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
@@ -236,6 +349,11 @@ if __name__ == "__main__":
         cache_logger_on_first_use=True,
     )
 
+
+if __name__ == "__main__":
+    # Set up logging
+    configure_logging()
+
     # Run worker
     try:
         asyncio.run(main())
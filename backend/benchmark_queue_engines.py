@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sorted-set and Redis Streams queue engines against a local Redis
+
+Usage:
+    REDIS_URL=redis://localhost:6379/15 python benchmark_queue_engines.py [jobs]
+
+Runs an enqueue -> dequeue -> complete cycle for each engine under an isolated
+queue name and prints per-stage throughput. Never point this at production.
+"""
+import asyncio
+import os
+import sys
+import time
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.queue import QuestQueue
+from app.core.stream_queue import StreamQuestQueue
+
+
+def isolate(engine, name: str):
+    """Point an engine at throwaway keys so runs don't touch real queues"""
+    suffix = f"bench:{name}:{uuid4().hex[:8]}"
+    engine.queue_name = f"quest:{suffix}"
+    engine.job_prefix = f"quest:{suffix}:job:"
+    if isinstance(engine, StreamQuestQueue):
+        engine.lane_keys = [
+            f"{engine.queue_name}:stream:{lane}" for lane in ("high", "normal", "low")
+        ]
+    return engine
+
+
+async def cleanup(engine):
+    keys = [key async for key in engine.redis_client.scan_iter(f"{engine.queue_name}*")]
+    if keys:
+        await engine.redis_client.delete(*keys)
+
+
+async def bench(name: str, engine, jobs: int):
+    if not await engine.connect():
+        print(f"❌ {name}: could not connect to {engine.redis_url}")
+        return
+
+    try:
+        start = time.perf_counter()
+        for i in range(jobs):
+            await engine.enqueue("benchmark", {"n": i}, priority=i % 3 - 1)
+        enqueue_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        claimed = []
+        while len(claimed) < jobs:
+            job = await engine.dequeue()
+            if not job:
+                break
+            claimed.append(job["id"])
+        dequeue_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for job_id in claimed:
+            await engine.complete_job(job_id, {"ok": True})
+        complete_time = time.perf_counter() - start
+
+        stats = await engine.get_queue_stats()
+
+        print(f"\n{name}")
+        print("-" * 60)
+        print(f"  enqueue : {jobs / enqueue_time:8.0f} jobs/s")
+        print(f"  dequeue : {len(claimed) / dequeue_time:8.0f} jobs/s ({len(claimed)}/{jobs} claimed)")
+        print(f"  complete: {len(claimed) / complete_time:8.0f} jobs/s")
+        print(f"  stats   : {stats}")
+
+    finally:
+        await cleanup(engine)
+        await engine.disconnect()
+
+
+async def main():
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("=" * 60)
+    print(f"QUEUE ENGINE BENCHMARK ({jobs} jobs)")
+    print("=" * 60)
+
+    await bench("zset", isolate(QuestQueue(), "zset"), jobs)
+    await bench("streams", isolate(StreamQuestQueue(), "streams"), jobs)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
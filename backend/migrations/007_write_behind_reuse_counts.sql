@@ -0,0 +1,18 @@
+-- Migration: 007_write_behind_reuse_counts.sql
+-- Description: Cluster research reuse is counted by the application (write-behind)
+-- Created: October 17, 2026
+
+-- Cache hits are counted in Redis and added to cluster_research.reuse_count
+-- in batches (app/core/reuse_counters.py). The per-article trigger from
+-- migration 004 wrote to the same hot rows on every insert into articles,
+-- and its cluster_research.id lookup no longer matches the 005 schema.
+DROP TRIGGER IF EXISTS trigger_increment_reuse ON articles;
+DROP FUNCTION IF EXISTS increment_research_reuse();
+
+COMMENT ON COLUMN cluster_research.reuse_count IS 'Number of times this cluster research was reused (flushed in batches; add pending Redis counts for live totals)';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 007_write_behind_reuse_counts.sql completed successfully';
+END $$;
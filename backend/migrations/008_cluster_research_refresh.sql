@@ -0,0 +1,23 @@
+-- Migration: 008_cluster_research_refresh.sql
+-- Description: Columns for background (stale-while-revalidate) cluster research refresh
+-- Created: October 17, 2026
+
+ALTER TABLE cluster_research
+    ADD COLUMN IF NOT EXISTS is_stale BOOLEAN DEFAULT false,
+    ADD COLUMN IF NOT EXISTS source_topic TEXT,
+    ADD COLUMN IF NOT EXISTS last_used_at TIMESTAMPTZ;
+
+-- Refresher sweep (expiring rows use idx_cluster_research_expires)
+CREATE INDEX IF NOT EXISTS idx_cluster_research_stale
+    ON cluster_research(cluster_id)
+    WHERE is_stale;
+
+COMMENT ON COLUMN cluster_research.is_stale IS 'Marked for refresh; still served until the refresher replaces it';
+COMMENT ON COLUMN cluster_research.source_topic IS 'Topic the research was run for (re-run by the refresher)';
+COMMENT ON COLUMN cluster_research.last_used_at IS 'Last cache hit (set when reuse counts are flushed)';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 008_cluster_research_refresh.sql completed successfully';
+END $$;
@@ -0,0 +1,42 @@
+-- Migration: 009_research_blobs.sql
+-- Description: Compressed, content-addressed storage for research payloads
+-- Created: October 17, 2026
+--
+-- Existing rows keep their inline JSONB until converted with
+-- scripts/migrate_research_blobs.py; readers handle both forms.
+
+CREATE TABLE IF NOT EXISTS research_blobs (
+    hash TEXT PRIMARY KEY,              -- SHA-256 of the canonical JSON
+    codec VARCHAR(10) NOT NULL,         -- zstd | zlib
+    data BYTEA NOT NULL,
+    raw_bytes INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Already compressed: store out of line without a second (pglz) pass
+ALTER TABLE research_blobs ALTER COLUMN data SET STORAGE EXTERNAL;
+
+-- Cluster research: one blob per section
+ALTER TABLE cluster_research
+    ADD COLUMN IF NOT EXISTS research_data_hash TEXT REFERENCES research_blobs(hash),
+    ADD COLUMN IF NOT EXISTS seo_data_hash TEXT REFERENCES research_blobs(hash),
+    ADD COLUMN IF NOT EXISTS serp_analysis_hash TEXT REFERENCES research_blobs(hash),
+    ADD COLUMN IF NOT EXISTS ai_insights_hash TEXT REFERENCES research_blobs(hash);
+ALTER TABLE cluster_research ALTER COLUMN research_data DROP NOT NULL;
+
+-- Topic (embedding) cache
+ALTER TABLE article_research
+    ADD COLUMN IF NOT EXISTS research_json_hash TEXT REFERENCES research_blobs(hash);
+ALTER TABLE article_research ALTER COLUMN research_json DROP NOT NULL;
+
+COMMENT ON TABLE research_blobs IS 'Compressed research payloads, deduplicated by content hash';
+COMMENT ON COLUMN cluster_research.research_data_hash IS 'research_blobs hash (research_data is NULL once set)';
+COMMENT ON COLUMN article_research.research_json_hash IS 'research_blobs hash (research_json is NULL once set)';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 009_research_blobs.sql completed successfully';
+    RAISE NOTICE 'Run scripts/migrate_research_blobs.py to convert existing research rows';
+END $$;
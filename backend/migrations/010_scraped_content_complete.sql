@@ -0,0 +1,25 @@
+-- Migration: 010_scraped_content_complete.sql
+-- Description: Mark scraped_competitors rows that hold a full page, so
+--              ScrapeService can serve them as a scrape cache
+-- Created: October 17, 2026
+--
+-- Rows written before this migration stored content truncated to 5000
+-- characters; they keep content_complete = false and are never served.
+
+ALTER TABLE scraped_competitors
+    ADD COLUMN IF NOT EXISTS content_complete BOOLEAN NOT NULL DEFAULT false;
+
+-- Pages scraped for research (ScrapeService) have no SERP position
+ALTER TABLE scraped_competitors ALTER COLUMN position DROP NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_scraped_url_complete
+    ON scraped_competitors(url, created_at DESC)
+    WHERE content_complete;
+
+COMMENT ON COLUMN scraped_competitors.content_complete IS 'scraped_content is the full page (not truncated)';
+
+-- Success message
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 010_scraped_content_complete.sql completed successfully';
+END $$;
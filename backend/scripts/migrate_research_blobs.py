@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Convert inline research JSONB to compressed research_blobs (migration 009)
+
+Moves cluster_research sections and article_research.research_json into
+research_blobs in batches; each row is converted in its own transaction,
+so the script can be stopped and re-run.
+
+Usage:
+    python scripts/migrate_research_blobs.py [--dry-run] [--batch-size N] [--gc]
+
+    --dry-run      Report sizes and deduplication without writing
+    --gc           Also delete blobs no row references any more (run while
+                   no jobs are saving research)
+"""
+
+import argparse
+import asyncio
+import asyncpg
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.research_blobs import SECTIONS, research_blob_store
+
+TABLES = {
+    "cluster_research": {
+        "key": "cluster_id",
+        "columns": list(SECTIONS),
+    },
+    "article_research": {
+        "key": "id",
+        "columns": ["research_json"],
+    },
+}
+
+
+async def convert_table(conn, table: str, batch_size: int, dry_run: bool) -> dict:
+    """Convert one table's unconverted rows, keyset-paginated by its key"""
+    key = TABLES[table]["key"]
+    columns = TABLES[table]["columns"]
+    stats = {"rows": 0, "raw_bytes": 0, "stored_bytes": 0, "blobs": set()}
+    last_key = None
+
+    while True:
+        rows = await conn.fetch(
+            f"""
+            SELECT {key}, {", ".join(columns)}
+            FROM {table}
+            WHERE {columns[0]}_hash IS NULL
+              AND {columns[0]} IS NOT NULL
+              AND ($1::text IS NULL OR {key}::text > $1::text)
+            ORDER BY {key}::text
+            LIMIT $2
+            """,
+            last_key,
+            batch_size
+        )
+
+        if not rows:
+            break
+
+        for row in rows:
+            values = [row[column] for column in columns]
+
+            for value in values:
+                if value is None:
+                    continue
+                digest, data, raw_bytes = research_blob_store.encode(value)
+                stats["raw_bytes"] += raw_bytes
+                if digest not in stats["blobs"]:
+                    stats["blobs"].add(digest)
+                    stats["stored_bytes"] += len(data)
+
+            if not dry_run:
+                async with conn.transaction():
+                    hashes = await research_blob_store.put_many(values, conn=conn)
+                    assignments = ", ".join(
+                        f"{column}_hash = ${i + 2}, {column} = NULL"
+                        for i, column in enumerate(columns)
+                    )
+                    await conn.execute(
+                        f"UPDATE {table} SET {assignments} WHERE {key} = $1",
+                        row[key],
+                        *hashes
+                    )
+
+            stats["rows"] += 1
+
+        last_key = str(rows[-1][key])
+        print(f"   {table}: {stats['rows']} rows...")
+
+    return stats
+
+
+async def collect_garbage(conn) -> int:
+    """Delete blobs no longer referenced by any row"""
+    references = " AND ".join(
+        f"NOT EXISTS (SELECT 1 FROM cluster_research WHERE {section}_hash = research_blobs.hash)"
+        for section in SECTIONS
+    )
+    result = await conn.execute(f"""
+        DELETE FROM research_blobs
+        WHERE {references}
+          AND NOT EXISTS (SELECT 1 FROM article_research WHERE research_json_hash = research_blobs.hash)
+    """)
+    return int(result.split()[-1])
+
+
+async def migrate(dry_run: bool, batch_size: int, gc: bool):
+    conn = await asyncpg.connect(settings.DATABASE_URL)
+
+    try:
+        print(f"\n{'='*80}")
+        print(f"📦 Converting research payloads to research_blobs ({research_blob_store.codec})")
+        if dry_run:
+            print("   Dry run - nothing is written")
+        print(f"{'='*80}\n")
+
+        for table in TABLES:
+            stats = await convert_table(conn, table, batch_size, dry_run)
+            raw_mb = stats["raw_bytes"] / 1024 / 1024
+            stored_mb = stats["stored_bytes"] / 1024 / 1024
+            ratio = stats["raw_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+
+            print(f"\n📊 {table}:")
+            print(f"   Rows converted: {stats['rows']}")
+            print(f"   Unique blobs: {len(stats['blobs'])}")
+            print(f"   JSON size: {raw_mb:.2f} MB → stored: {stored_mb:.2f} MB ({ratio:.1f}x)\n")
+
+        if gc and not dry_run:
+            deleted = await collect_garbage(conn)
+            print(f"🗑️  Deleted {deleted} unreferenced blobs\n")
+
+        if not dry_run:
+            print("ℹ️  Run VACUUM on cluster_research and article_research to reclaim the old JSONB space\n")
+
+        print(f"{'='*80}")
+        print("✅ Done")
+        print(f"{'='*80}\n")
+
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    parser.add_argument("--batch-size", type=int, default=100, help="Rows fetched per query")
+    parser.add_argument("--gc", action="store_true", help="Delete unreferenced blobs afterwards")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.dry_run, args.batch_size, args.gc))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test pipeline checkpoints: a retried job restores completed stages from
+Redis, skips them, and still accounts for what they cost
+Uses fakeredis (pip install fakeredis); runs under pytest or directly
+"""
+import asyncio
+import os
+import sys
+from decimal import Decimal
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core import checkpoints
+from app.core.checkpoints import CheckpointStore
+from app.core.pipeline import Stage, StageScheduler
+
+JOB_ID = "job-checkpoint-test"
+
+
+def _store():
+    store = CheckpointStore()
+    store.enabled = True
+    store.ttl = 3600
+    return store
+
+
+def _pipeline(calls, fail_write=False):
+    """research → write → edit, counting how often each stage really runs"""
+    def stage(name, cost_key, cost, after=(), fail=False):
+        async def run(results):
+            calls.append(name)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return {"output": f"{name} output", "cost": Decimal(cost)}
+
+        return Stage(name, run, after=after, cost_key=cost_key)
+
+    return [
+        stage("research", "research", "0.45"),
+        stage("write", "content", "0.20", after=("research",), fail=fail_write),
+        stage("edit", "content", "0.05", after=("write",)),
+    ]
+
+
+async def _attempt(store, calls, fail_write=False):
+    """One job attempt, wired the way the orchestrator wires it"""
+    costs = {}
+
+    async def save_checkpoint(stage, result):
+        await store.save(JOB_ID, stage.name, result)
+
+    scheduler = StageScheduler(costs=costs, on_complete=save_checkpoint, job_id=JOB_ID)
+    scheduler.restore(await store.load(JOB_ID))
+
+    results = await scheduler.run(_pipeline(calls, fail_write=fail_write))
+    await store.clear(JOB_ID)
+    return results, costs
+
+
+def test_retry_resumes_and_reaccounts_costs():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(checkpoints, "get_redis_or_none", return_value=redis_client):
+            store = _store()
+            calls = []
+
+            try:
+                await _attempt(store, calls, fail_write=True)
+            except RuntimeError:
+                pass
+            else:
+                raise AssertionError("first attempt should fail at write")
+
+            saved = await store.load(JOB_ID)
+            ttl = await redis_client.ttl(f"{checkpoints.KEY_PREFIX}{JOB_ID}")
+
+            calls.clear()
+            results, costs = await _attempt(store, calls)
+            leftover = await redis_client.exists(f"{checkpoints.KEY_PREFIX}{JOB_ID}")
+
+        return saved, ttl, calls, results, costs, leftover
+
+    saved, ttl, calls, results, costs, leftover = asyncio.run(scenario())
+
+    # Only the stage that completed was checkpointed, Decimal intact
+    assert saved == {"research": {"output": "research output", "cost": Decimal("0.45")}}
+    assert 0 < ttl <= 3600
+
+    # The retry skips research but still pays for it once in the breakdown
+    assert calls == ["write", "edit"]
+    assert results["research"]["output"] == "research output"
+    assert costs == {"research": Decimal("0.45"), "content": Decimal("0.25")}
+
+    # Cleared once the job finished
+    assert not leftover
+
+
+def test_restored_cost_counted_once_across_phases():
+    """A restored stage adds its cost in the phase that includes it, and only once"""
+    async def scenario():
+        costs = {}
+        scheduler = StageScheduler(costs=costs)
+        scheduler.restore({
+            "research": {"cost": Decimal("0.45")},
+            "write": {"cost": Decimal("0.20")},
+        })
+
+        async def noop(results):
+            return {"cost": Decimal("0.01")}
+
+        await scheduler.run([Stage("research", noop, cost_key="research")])
+        first = dict(costs)
+        await scheduler.run([
+            Stage("research", noop, cost_key="research"),
+            Stage("write", noop, after=("research",), cost_key="content"),
+        ])
+        return first, costs
+
+    first, costs = asyncio.run(scenario())
+
+    assert first == {"research": Decimal("0.45")}
+    assert costs == {"research": Decimal("0.45"), "content": Decimal("0.20")}
+
+
+def test_corrupt_checkpoint_is_skipped():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(checkpoints, "get_redis_or_none", return_value=redis_client):
+            store = _store()
+            await store.save(JOB_ID, "research", {"cost": Decimal("0.45")})
+            await redis_client.hset(f"{checkpoints.KEY_PREFIX}{JOB_ID}", "write", "not a payload")
+            return await store.load(JOB_ID)
+
+    assert asyncio.run(scenario()) == {"research": {"cost": Decimal("0.45")}}
+
+
+def test_without_redis_jobs_rerun_from_start():
+    async def scenario():
+        with mock.patch.object(checkpoints, "get_redis_or_none", return_value=None):
+            store = _store()
+            await store.save(JOB_ID, "research", {"cost": Decimal("0.45")})
+            return await store.load(JOB_ID)
+
+    assert asyncio.run(scenario()) == {}
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} checkpoint tests passed")
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Test topic → cluster matching: the Aho-Corasick automaton (overlapping
+patterns, outputs inherited through failure links) and ClusterMatcher's
+scoring, priority tie-break and merge of topic_clusters rows with the
+built-in clusters
+Runs under pytest or directly
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core import cluster_matcher
+from app.core.cluster_matcher import AhoCorasick, ClusterMatcher
+from app.core.research_cache import ClusterResearchCache
+
+
+class FakePool:
+    """asyncpg pool stand-in serving topic_clusters rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetchrow(self, query):
+        return {"count": len(self.rows), "updated_at": datetime(2026, 1, 1)}
+
+    async def fetch(self, query):
+        return self.rows
+
+
+def _row(slug, primary=(), secondary=(), priority="medium", row_id=None):
+    return {
+        "id": row_id or slug,
+        "name": slug.replace("-", " ").title(),
+        "slug": slug,
+        "priority": priority,
+        "research_tier": "tavily",
+        "primary_keywords": list(primary),
+        "secondary_keywords": list(secondary),
+    }
+
+
+def _matcher(builtin=None, rows=None):
+    """ClusterMatcher with the given built-ins; rows are loaded as the topic_clusters table"""
+    matcher = ClusterMatcher()
+    matcher.register_builtin(ClusterResearchCache.TOPIC_CLUSTERS if builtin is None else builtin)
+    if rows is None:
+        return matcher
+
+    async def load():
+        with mock.patch.object(cluster_matcher, "get_db", return_value=FakePool(rows)):
+            await matcher.refresh()
+
+    asyncio.run(load())
+    return matcher
+
+
+def _automaton(*patterns):
+    automaton = AhoCorasick()
+    for pattern in patterns:
+        automaton.add(pattern, pattern.upper())
+    return automaton
+
+
+def test_automaton_finds_overlapping_patterns():
+    automaton = _automaton("he", "she", "his", "hers")
+
+    matches = sorted(
+        (start, pattern) for start, pattern, _ in automaton.iter_matches("ushers")
+    )
+
+    assert matches == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_automaton_reports_outputs_through_failure_links():
+    """A pattern that is a suffix of another is reported where the longer one ends"""
+    automaton = _automaton("digital nomad visa", "nomad visa", "visa")
+
+    matches = list(automaton.iter_matches("spain digital nomad visa"))
+
+    assert [(start, pattern) for start, pattern, _ in matches] == [
+        (6, "digital nomad visa"), (14, "nomad visa"), (20, "visa"),
+    ]
+    assert [payload for _, _, payload in matches] == ["DIGITAL NOMAD VISA", "NOMAD VISA", "VISA"]
+
+
+def test_automaton_repeated_and_self_overlapping_matches():
+    automaton = _automaton("aa", "ab")
+
+    matches = [(start, pattern) for start, pattern, _ in automaton.iter_matches("aaab aa")]
+
+    assert matches == [(0, "aa"), (1, "aa"), (2, "ab"), (5, "aa")]
+
+
+def test_automaton_is_frozen_after_build():
+    automaton = _automaton("visa")
+    automaton.build()
+
+    try:
+        automaton.add("tax", None)
+    except RuntimeError:
+        return
+    raise AssertionError("add() after build() should fail")
+
+
+def test_spain_digital_nomad_visa_goes_to_spain():
+    """'digital nomad visa' is shared with Portugal; 'spain' decides it"""
+    match = _matcher().match_loaded("Spain Digital Nomad Visa")
+
+    assert match["cluster_id"] == "spain_immigration"
+    assert [m["keyword"] for m in match["matches"]] == ["spain", "digital nomad visa"]
+    assert match["score"] == len("spain") + len("digital nomad visa")
+
+
+def test_portugal_topic_matches_portugal():
+    match = _matcher().match_loaded("Portugal  D7 Visa 2025 Guide")
+
+    assert match["cluster_id"] == "portugal_digital_nomad"
+    assert [m["keyword"] for m in match["matches"]] == ["portugal", "d7"]
+
+
+def test_no_keyword_no_match():
+    assert _matcher().match_loaded("Sourdough starter basics") is None
+
+
+def test_keyword_counts_once_per_cluster():
+    matcher = _matcher(builtin={
+        "tax": {"keywords": ["tax"], "priority": "medium"},
+        "visas": {"keywords": ["golden visa"], "priority": "medium"},
+    })
+
+    match = matcher.match_loaded("Tax, tax and more tax on a golden visa")
+
+    # Three "tax" occurrences still only score 3, below "golden visa" once
+    assert match["cluster_id"] == "visas"
+    assert match["score"] == len("golden visa")
+
+
+def test_ties_broken_by_priority():
+    for builtin in (
+        {"low": {"keywords": ["coworking"], "priority": "low"},
+         "high": {"keywords": ["coworking"], "priority": "high"}},
+        {"high": {"keywords": ["coworking"], "priority": "high"},
+         "low": {"keywords": ["coworking"], "priority": "low"}},
+    ):
+        match = _matcher(builtin=builtin).match_loaded("Best coworking in Lisbon")
+        assert match["cluster_id"] == "high"
+
+
+def test_secondary_keywords_weigh_half():
+    matcher = _matcher(builtin={}, rows=[
+        _row("lisbon", primary=["lisbon"]),
+        _row("moving", secondary=["moving to"]),
+    ])
+
+    match = matcher.match_loaded("Moving to Lisbon")
+
+    assert match["cluster_id"] == "lisbon"
+    assert match["score"] == len("lisbon")
+    assert matcher.match_loaded("Moving to Madrid")["score"] == len("moving to") * 0.5
+
+
+def test_table_row_extends_builtin_cluster_by_slug():
+    matcher = _matcher(rows=[
+        _row("spain-immigration", primary=["beckham law"], row_id=42),
+    ])
+
+    match = matcher.match_loaded("Beckham Law explained")
+
+    # Same cluster_id as the built-in, with the table row's id and name
+    assert match["cluster_id"] == "spain_immigration"
+    assert match["id"] == 42
+    assert match["name"] == "Spain Immigration"
+    assert match["priority"] == "high"
+    assert "spain_immigration" in matcher.clusters
+    assert "spain-immigration" not in matcher.clusters
+
+
+def test_new_table_cluster_competes_with_builtins():
+    matcher = _matcher(rows=[
+        _row("spain-digital-nomad-visa", primary=["spain digital nomad visa"]),
+    ])
+
+    match = matcher.match_loaded("Spain Digital Nomad Visa")
+
+    assert match["cluster_id"] == "spain-digital-nomad-visa"
+
+
+def test_db_only_ignores_builtin_keywords():
+    matcher = _matcher(rows=[
+        _row("spain-immigration", primary=["beckham law"], row_id=42),
+        _row("greece-golden-visa", primary=["greece"]),
+    ])
+
+    # Built-in keywords ("spain") don't count, even on an extended cluster
+    assert matcher.match_loaded("Spain digital nomad visa", db_only=True) is None
+
+    match = matcher.match_loaded("Spain Beckham Law", db_only=True)
+    assert match["cluster_id"] == "spain_immigration"
+    assert [m["keyword"] for m in match["matches"]] == ["beckham law"]
+
+    assert matcher.match_loaded("Greece golden visa", db_only=True)["cluster_id"] == "greece-golden-visa"
+
+
+def test_refresh_failure_keeps_builtins():
+    matcher = _matcher()
+
+    async def refresh():
+        with mock.patch.object(cluster_matcher, "get_db", side_effect=RuntimeError("no pool")):
+            return await matcher.match("Spain digital nomad visa")
+
+    assert asyncio.run(refresh())["cluster_id"] == "spain_immigration"
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} cluster matcher tests passed")
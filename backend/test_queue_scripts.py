@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Test the queue's Lua scripts: claim, complete, fail and reap, including the
+lease tokens that keep a reaped worker from finishing someone else's run
+Uses fakeredis with Lua support (pip install "fakeredis[lua]"); runs under
+pytest or directly
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core.queue import QuestQueue
+
+PROCESSING = "quest:articles:processing"
+WAITING = "quest:articles:waiting"
+DELAYED = "quest:articles:delayed"
+COMPLETED = "quest:articles:completed"
+FAILED = "quest:articles:failed"
+
+
+def _queue():
+    queue = QuestQueue()
+    queue.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    queue._register_scripts()
+    queue.idempotency_window = 0
+    queue.visibility_timeout = 60
+    queue.max_retries = 2
+    queue.retry_delay = [1000, 5000]
+    queue.max_stalls = 1
+    return queue
+
+
+async def _job(queue, job_id):
+    return await queue.redis_client.hgetall(f"{queue.job_prefix}{job_id}")
+
+
+async def _expire_lease(queue, job_id):
+    """Pretend the worker stopped heartbeating a minute ago"""
+    await queue.redis_client.zadd(PROCESSING, {job_id: time.time() - 60})
+
+
+async def _due(queue, job_id):
+    """Make a scheduled retry due now"""
+    await queue.redis_client.zadd(DELAYED, {job_id: 0})
+
+
+def test_claim_issues_lease_in_priority_order():
+    async def scenario():
+        queue = _queue()
+        low = await queue.enqueue("generate_article", {"topic": "low"}, priority=0)
+        high = await queue.enqueue("generate_article", {"topic": "high"}, priority=5)
+
+        first = await queue.dequeue()
+        second = await queue.dequeue()
+        empty = await queue.dequeue()
+
+        lease_expiry = await queue.redis_client.zscore(PROCESSING, high)
+        stored = await _job(queue, high)
+        return low, high, first, second, empty, lease_expiry, stored
+
+    low, high, first, second, empty, lease_expiry, stored = asyncio.run(scenario())
+
+    assert (first["id"], second["id"]) == (high, low)
+    assert first["data"] == {"topic": "high"}
+    assert empty is None
+
+    assert first["lease"] and first["lease"] != second["lease"]
+    assert stored["status"] == "processing"
+    assert stored["lease"] == first["lease"]
+    assert 0 < lease_expiry - time.time() <= 60
+
+
+def test_claim_skips_expired_job_hash():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "gone"})
+        await queue.redis_client.delete(f"{queue.job_prefix}{job_id}")
+        job = await queue.dequeue()
+        return job, await queue.redis_client.zcard(PROCESSING)
+
+    assert asyncio.run(scenario()) == (None, 0)
+
+
+def test_complete_requires_current_lease():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "lisbon"})
+        job = await queue.dequeue()
+
+        wrong = await queue.complete_job(job_id, {"ok": False}, lease="not-the-lease")
+        still_processing = await queue.redis_client.zscore(PROCESSING, job_id) is not None
+
+        right = await queue.complete_job(job_id, {"ok": True}, lease=job["lease"])
+        again = await queue.complete_job(job_id, {"ok": True}, lease=job["lease"])
+
+        stored = await _job(queue, job_id)
+        ttl = await queue.redis_client.ttl(f"{queue.job_prefix}{job_id}")
+        indexed = await queue.redis_client.zscore(COMPLETED, job_id)
+        return wrong, still_processing, right, again, stored, ttl, indexed, queue
+
+    wrong, still_processing, right, again, stored, ttl, indexed, queue = asyncio.run(scenario())
+
+    assert wrong is False and still_processing
+    assert right is True
+    assert again is False  # no longer in :processing
+    assert stored["status"] == "completed"
+    assert stored["result"] == '{"ok": true}'
+    assert "lease" not in stored
+    assert indexed is not None
+    assert 0 < ttl <= queue.retention
+
+
+def test_fail_retries_then_fails():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "porto"})
+        states = []
+
+        for _ in range(queue.max_retries + 1):
+            job = await queue.dequeue()
+            assert job is not None and job["id"] == job_id
+            await queue.fail_job(job_id, "provider down", lease=job["lease"])
+
+            stored = await _job(queue, job_id)
+            retry_at = await queue.redis_client.zscore(DELAYED, job_id)
+            states.append((stored["status"], stored["attempts"], retry_at))
+            await _due(queue, job_id)
+
+        failed = await queue.redis_client.zscore(FAILED, job_id)
+        return states, failed, await _job(queue, job_id)
+
+    states, failed, stored = asyncio.run(scenario())
+
+    now = time.time()
+    assert [state[:2] for state in states] == [("retry", "1"), ("retry", "2"), ("failed", "2")]
+    assert 0 < states[0][2] - now <= 1
+    assert 3 < states[1][2] - now <= 5
+    assert failed is not None
+    assert stored["last_error"] == "provider down"
+    assert "lease" not in stored
+
+
+def test_fail_with_lost_lease_changes_nothing():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "faro"})
+        await queue.dequeue()
+
+        await queue.fail_job(job_id, "stale worker", lease="not-the-lease")
+        return (
+            await _job(queue, job_id),
+            await queue.redis_client.zscore(PROCESSING, job_id) is not None,
+            await queue.redis_client.zcard(DELAYED)
+        )
+
+    stored, still_processing, delayed = asyncio.run(scenario())
+
+    assert stored["status"] == "processing"
+    assert "last_error" not in stored
+    assert still_processing and delayed == 0
+
+
+def test_reaped_worker_cannot_touch_new_owners_run():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "madeira"})
+        zombie = await queue.dequeue()
+
+        await _expire_lease(queue, job_id)
+        failed = await queue.reap_stalled_jobs()
+        requeued = await _job(queue, job_id)
+
+        owner = await queue.dequeue()
+
+        zombie_extend = await queue.extend_leases({job_id: zombie["lease"]})
+        zombie_complete = await queue.complete_job(job_id, {"by": "zombie"}, lease=zombie["lease"])
+        await queue.fail_job(job_id, "zombie error", lease=zombie["lease"])
+        after_zombie = await _job(queue, job_id)
+
+        owner_extend = await queue.extend_leases({job_id: owner["lease"]})
+        owner_complete = await queue.complete_job(job_id, {"by": "owner"}, lease=owner["lease"])
+        return (failed, requeued, zombie, owner, zombie_extend, zombie_complete,
+                after_zombie, owner_extend, owner_complete, await _job(queue, job_id))
+
+    (failed, requeued, zombie, owner, zombie_extend, zombie_complete,
+     after_zombie, owner_extend, owner_complete, final) = asyncio.run(scenario())
+
+    # Reaping revokes the lease and puts the job back
+    assert failed == []
+    assert requeued["status"] == "pending"
+    assert requeued["stalled_count"] == "1"
+    assert "lease" not in requeued
+
+    assert owner["lease"] != zombie["lease"]
+    assert zombie_extend == 0
+    assert zombie_complete is False
+    assert after_zombie["status"] == "processing"
+    assert "last_error" not in after_zombie
+
+    assert owner_extend == 1
+    assert owner_complete is True
+    assert final["result"] == '{"by": "owner"}'
+
+
+def test_reap_fails_job_that_stalls_too_often():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "azores"})
+        reaped = []
+
+        for _ in range(queue.max_stalls + 1):
+            await queue.dequeue()
+            await _expire_lease(queue, job_id)
+            reaped.append(await queue.reap_stalled_jobs())
+
+        return job_id, reaped, await _job(queue, job_id), await queue.redis_client.zcard(WAITING)
+
+    job_id, reaped, stored, waiting = asyncio.run(scenario())
+
+    assert reaped == [[], [job_id]]
+    assert stored["status"] == "failed"
+    assert stored["last_error"] == "Job stalled 2 times"
+    assert waiting == 0
+
+
+def test_reap_leaves_live_leases_alone():
+    async def scenario():
+        queue = _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "braga"})
+        await queue.dequeue()
+        await queue.reap_stalled_jobs()
+        return await _job(queue, job_id), await queue.redis_client.zscore(PROCESSING, job_id)
+
+    stored, lease_expiry = asyncio.run(scenario())
+
+    assert stored["status"] == "processing"
+    assert stored.get("stalled_count") is None
+    assert lease_expiry is not None
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} queue script tests passed")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Test the research payload cache: memory → Redis → Postgres read-through,
+invalidation racing an in-flight load, byte-bounded LRU eviction, and
+entries never outliving the research's serve_until
+Uses fakeredis (pip install fakeredis); runs under pytest or directly
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core import research_payload_cache
+from app.core.payload_codec import dump_json, pack_json
+from app.core.research_payload_cache import KEY_PREFIX, ResearchPayloadCache
+
+
+def _cache(max_bytes=1024 * 1024, memory_ttl=300, redis_ttl=3600):
+    cache = ResearchPayloadCache()
+    cache.max_bytes = max_bytes
+    cache.memory_ttl = memory_ttl
+    cache.redis_ttl = redis_ttl
+    return cache
+
+
+def _loader(rows, calls, started=None, release=None):
+    """Postgres stand-in reading rows[key], then optionally waiting to be released"""
+    def for_key(key):
+        async def load():
+            calls.append(key)
+            row = rows.get(key)
+            if started is not None:
+                started.set()
+            if release is not None:
+                await release.wait()
+            return row
+        return load
+    return for_key
+
+
+def _payload(cluster_id, size=0, serve_in=None):
+    payload = {"cluster_id": cluster_id, "summary": "x" * size}
+    if serve_in is not None:
+        payload["serve_until"] = datetime.now(timezone.utc) + timedelta(seconds=serve_in)
+    return payload
+
+
+def test_read_through_memory_redis_database():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=redis_client):
+            rows, calls = {1: _payload(1)}, []
+            load = _loader(rows, calls)
+
+            cache = _cache()
+            first = await cache.get_or_load("cluster", 1, load(1))
+            second = await cache.get_or_load("cluster", 1, load(1))
+
+            # Another process: empty memory, shared Redis
+            peer = _cache()
+            third = await peer.get_or_load("cluster", 1, load(1))
+            return first, second, third, calls, cache.stats, peer.stats
+
+    first, second, third, calls, stats, peer_stats = asyncio.run(scenario())
+
+    assert first == second == third == _payload(1)
+    assert calls == [1]
+    assert stats == {"memory": 1, "redis": 0, "database": 1, "misses": 0}
+    assert peer_stats == {"memory": 0, "redis": 1, "database": 0, "misses": 0}
+
+
+def test_invalidate_during_load_is_not_cached():
+    """A load that read the row before a write must not cache the stale row"""
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=redis_client):
+            cache = _cache()
+            rows, calls = {1: _payload(1)}, []
+            started, release = asyncio.Event(), asyncio.Event()
+
+            loading = asyncio.create_task(
+                cache.get_or_load("cluster", 1, _loader(rows, calls, started, release)(1))
+            )
+            await started.wait()
+
+            # The research is rewritten while the load is in flight
+            rows[1] = {"cluster_id": 1, "summary": "new"}
+            await cache.invalidate("cluster", 1)
+            release.set()
+            stale = await loading
+
+            cached_in_memory = "cluster:1" in cache._lru
+            cached_in_redis = await redis_client.exists(f"{KEY_PREFIX}cluster:1")
+
+            fresh = await cache.get_or_load("cluster", 1, _loader(rows, calls)(1))
+            return stale, cached_in_memory, cached_in_redis, fresh, calls
+
+    stale, cached_in_memory, cached_in_redis, fresh, calls = asyncio.run(scenario())
+
+    # The caller still gets what it read, but nobody else will
+    assert stale["summary"] == ""
+    assert not cached_in_memory and not cached_in_redis
+    assert fresh["summary"] == "new"
+    assert calls == [1, 1]
+
+
+def test_invalidate_drops_memory_and_redis_copies():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=redis_client):
+            cache = _cache()
+            rows, calls = {1: _payload(1)}, []
+            await cache.get_or_load("cluster", 1, _loader(rows, calls)(1))
+            await cache.invalidate("cluster", 1)
+            return cache._lru, cache.bytes, await redis_client.exists(f"{KEY_PREFIX}cluster:1")
+
+    lru, size, in_redis = asyncio.run(scenario())
+
+    assert not lru and size == 0 and not in_redis
+
+
+def test_lru_evicts_least_recently_used_over_max_bytes():
+    async def scenario():
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=None):
+            rows = {key: _payload(key, size=400) for key in (1, 2, 3)}
+            entry_size = len(dump_json(rows[1]))
+            cache = _cache(max_bytes=entry_size * 2 + 10)
+            calls = []
+            load = _loader(rows, calls)
+
+            await cache.get_or_load("cluster", 1, load(1))
+            await cache.get_or_load("cluster", 2, load(2))
+            await cache.get_or_load("cluster", 1, load(1))  # 1 is now most recent
+            await cache.get_or_load("cluster", 3, load(3))  # evicts 2
+            return list(cache._lru), cache.bytes, cache.max_bytes, entry_size
+
+    keys, size, max_bytes, entry_size = asyncio.run(scenario())
+
+    assert keys == ["cluster:1", "cluster:3"]
+    assert size == entry_size * 2 <= max_bytes
+
+
+def test_oversized_payload_is_not_kept_in_memory():
+    async def scenario():
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=None):
+            cache = _cache(max_bytes=100)
+            rows, calls = {1: _payload(1, size=500)}, []
+            value = await cache.get_or_load("cluster", 1, _loader(rows, calls)(1))
+            return value, cache._lru, cache.bytes
+
+    value, lru, size = asyncio.run(scenario())
+
+    assert len(value["summary"]) == 500
+    assert not lru and size == 0
+
+
+def test_entry_expires_with_serve_until():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=redis_client):
+            cache = _cache(memory_ttl=300, redis_ttl=3600)
+            rows, calls = {1: _payload(1, serve_in=5)}, []
+            load = _loader(rows, calls)
+
+            await cache.get_or_load("cluster", 1, load(1))
+            memory_expires_at = cache._lru["cluster:1"][0]
+            redis_ttl = await redis_client.ttl(f"{KEY_PREFIX}cluster:1")
+
+            # Six seconds later the memory copy is gone
+            later = time.time() + 6
+            with mock.patch.object(research_payload_cache, "time", SimpleNamespace(time=lambda: later)):
+                await redis_client.delete(f"{KEY_PREFIX}cluster:1")  # Redis TTL lapsed too
+                rows[1] = _payload(1, serve_in=60)
+                await cache.get_or_load("cluster", 1, load(1))
+            return memory_expires_at, redis_ttl, calls
+
+    memory_expires_at, redis_ttl, calls = asyncio.run(scenario())
+
+    assert memory_expires_at <= time.time() + 5
+    assert 0 < redis_ttl <= 5
+    assert calls == [1, 1]
+
+
+def test_expired_payload_is_never_cached_or_served():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=redis_client):
+            cache = _cache()
+
+            # A Redis copy whose research has passed serve_until is ignored
+            expired = _payload(1, serve_in=-1)
+            await redis_client.set(f"{KEY_PREFIX}cluster:1", pack_json(dump_json(expired)))
+
+            rows, calls = {1: _payload(1, serve_in=-1)}, []
+            load = _loader(rows, calls)
+            await cache.get_or_load("cluster", 1, load(1))
+            await cache.get_or_load("cluster", 1, load(1))
+            return calls, cache._lru, cache.stats
+
+    calls, lru, stats = asyncio.run(scenario())
+
+    # Returned to the caller from Postgres each time, never from a cache
+    assert calls == [1, 1]
+    assert not lru
+    assert stats["redis"] == 0 and stats["database"] == 2
+
+
+def test_missing_row_is_a_miss():
+    async def scenario():
+        with mock.patch.object(research_payload_cache, "get_redis_or_none", return_value=None):
+            cache = _cache()
+            calls = []
+            value = await cache.get_or_load("cluster", 9, _loader({}, calls)(9))
+            return value, cache.stats["misses"], cache._lru
+
+    assert asyncio.run(scenario()) == (None, 1, {})
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} research payload cache tests passed")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent multi-API research plan with stub providers: streaming
+partial results (on_result), the research deadline, and the cost of calls
+the deadline cuts off
+Runs under pytest or directly
+"""
+import asyncio
+import os
+import sys
+from decimal import Decimal
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core import research_apis
+from app.core.research_apis import MultiAPIResearch
+
+
+class StubProvider:
+    """Answers after a delay with a fixed cost (unavailable if delay is None)"""
+
+    def __init__(self, name, cost="0.00", delay=None, sources=(), error=None):
+        self.name = name
+        self.cost = Decimal(cost)
+        self.delay = delay
+        self.sources = [{"url": url} for url in sources]
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    def is_available(self):
+        return self.delay is not None
+
+    def get_cost(self):
+        return self.cost
+
+    async def search(self, query):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return {
+            "provider": self.name,
+            "content": f"{self.name} on {query}",
+            "sources": self.sources,
+            "cost": self.cost,
+        }
+
+
+def _research(**delays):
+    """MultiAPIResearch whose providers are stubs (absent ones unavailable)"""
+    costs = {
+        "perplexity": "0.20", "tavily": "0.10", "linkup": "0.05",
+        "dataforseo": "0.003", "firecrawl": "0.05",
+    }
+    multi_api = MultiAPIResearch()
+    multi_api.providers = {
+        name: StubProvider(name, costs.get(name, "0.00"), delays.get(name))
+        for name in (
+            "perplexity", "tavily", "firecrawl", "serper", "critique_labs",
+            "gemini_fact_checker", "linkup", "dataforseo",
+        )
+    }
+    return multi_api
+
+
+def _run(multi_api, deadline, **kwargs):
+    async def scenario():
+        with mock.patch.object(research_apis.settings, "RESEARCH_DEADLINE_SECONDS", deadline):
+            return await multi_api.research(query="portugal visa", use_all=True, **kwargs)
+
+    return asyncio.run(scenario())
+
+
+def test_on_result_streams_in_arrival_order():
+    multi_api = _research(perplexity=0.06, tavily=0.01, linkup=0.03)
+    streamed = []
+
+    async def on_result(provider_name, result):
+        streamed.append((provider_name, result["cost"]))
+
+    result = _run(multi_api, deadline=5, on_result=on_result)
+
+    assert streamed == [
+        ("tavily", Decimal("0.10")),
+        ("linkup", Decimal("0.05")),
+        ("perplexity", Decimal("0.20")),
+    ]
+    # The combined result is in plan order, whatever answered first
+    assert result["providers_used"] == ["perplexity", "tavily", "linkup"]
+    assert result["total_cost"] == Decimal("0.35")
+
+
+def test_failing_on_result_does_not_drop_results():
+    multi_api = _research(perplexity=0.01, tavily=0.01)
+
+    async def on_result(provider_name, result):
+        raise RuntimeError("subscriber went away")
+
+    result = _run(multi_api, deadline=5, on_result=on_result)
+
+    assert result["providers_used"] == ["perplexity", "tavily"]
+
+
+def test_failed_provider_is_skipped():
+    multi_api = _research(perplexity=0.01, tavily=0.01)
+    multi_api.providers["tavily"].error = RuntimeError("500")
+
+    result = _run(multi_api, deadline=5)
+
+    assert result["providers_used"] == ["perplexity"]
+    assert result["total_cost"] == Decimal("0.20")
+
+
+def test_deadline_cancels_and_counts_abandoned_calls():
+    """Calls cut off by the deadline are cancelled but still counted as spent"""
+    multi_api = _research(perplexity=0.01, tavily=5, linkup=5)
+    streamed = []
+
+    async def on_result(provider_name, result):
+        streamed.append(provider_name)
+
+    result = _run(multi_api, deadline=0.2, on_result=on_result)
+
+    assert result["providers_used"] == ["perplexity"]
+    assert streamed == ["perplexity"]
+    assert multi_api.providers["tavily"].cancelled
+    assert multi_api.providers["linkup"].cancelled
+    # 0.20 received + 0.10 and 0.05 abandoned in flight
+    assert result["total_cost"] == Decimal("0.35")
+
+
+def test_deadline_during_competitor_scrape():
+    """A cut-off scrape counts one nominal Firecrawl call per URL being scraped"""
+    multi_api = _research(dataforseo=0.01, firecrawl=0)
+    multi_api.providers["dataforseo"].sources = [{"url": f"https://site{i}.com"} for i in range(8)]
+
+    async def slow_scrape(urls, max_urls=5):
+        await asyncio.sleep(5)
+
+    multi_api.scrape_competitor_urls = slow_scrape
+
+    result = _run(multi_api, deadline=0.2)
+
+    assert result["providers_used"] == ["dataforseo_serp"]
+    # SERP 0.003 + five URLs × 0.05
+    assert result["total_cost"] == Decimal("0.253")
+
+
+def test_no_deadline_waits_for_everyone():
+    multi_api = _research(perplexity=0.01, tavily=0.3)
+
+    result = _run(multi_api, deadline=0)
+
+    assert result["providers_used"] == ["perplexity", "tavily"]
+    assert result["total_cost"] == Decimal("0.30")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} research plan tests passed")
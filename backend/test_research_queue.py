@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test the completed-topic index behind duplicate detection: prefix-filtered
+find_similar must agree with a brute-force scan of every completed topic
+Runs under pytest or directly
+"""
+import os
+import random
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.research_queue import CompletedTopicIndex
+
+# Small vocabulary with a few very common words, so topics overlap a lot
+VOCABULARY = (
+    ["visa", "guide", "2025", "digital", "nomad"] * 4
+    + ["portugal", "spain", "italy", "greece", "tax", "golden", "d7", "remote",
+       "work", "residency", "cost", "living", "lisbon", "madrid", "rome", "best",
+       "cities", "how", "to", "apply", "requirements", "income", "family", "retire"]
+)
+
+
+def _topic(rng):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, 12)))
+
+
+def _near_copy(rng, topic):
+    """A completed topic with one or two words swapped, dropped or added"""
+    words = topic.split()
+    for _ in range(rng.randint(1, 2)):
+        edit = rng.choice(("swap", "drop", "add"))
+        if edit == "swap" and words:
+            words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+        elif edit == "drop" and len(words) > 1:
+            words.pop(rng.randrange(len(words)))
+        else:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(VOCABULARY))
+    return " ".join(words)
+
+
+def _brute_force(completed, words, threshold):
+    """Every completed topic sharing more than threshold of the words"""
+    if not words:
+        return set()
+    return {
+        topic for topic in completed
+        if len(words & set(topic.split())) / len(words) > threshold
+    }
+
+
+def _check(rng, threshold, rounds=200):
+    for _ in range(rounds):
+        completed = {_topic(rng) for _ in range(rng.randint(0, 60))}
+        index = CompletedTopicIndex()
+        for topic in completed:
+            index.add(topic)
+
+        proposals = [_topic(rng) for _ in range(10)]
+        proposals += [_near_copy(rng, topic) for topic in rng.sample(sorted(completed), min(10, len(completed)))]
+
+        for proposal in proposals:
+            words = set(proposal.split())
+            expected = _brute_force(completed, words, threshold)
+            found = index.find_similar(words, threshold)
+
+            if not expected:
+                assert found is None, (proposal, found)
+                continue
+
+            assert found is not None, (proposal, sorted(expected))
+            topic, overlap = found
+            assert topic in expected, (proposal, topic)
+            assert overlap == len(words & set(topic.split())) / len(words)
+
+
+def test_find_similar_matches_brute_force_at_duplicate_threshold():
+    _check(random.Random(8), 0.8)
+
+
+def test_find_similar_matches_brute_force_at_other_thresholds():
+    rng = random.Random(20)
+    for threshold in (0.0, 0.3, 0.5, 0.6, 0.75, 0.9, 0.99):
+        _check(rng, threshold, rounds=40)
+
+
+def test_find_similar_edge_cases():
+    index = CompletedTopicIndex()
+    index.add("portugal d7 visa guide")
+    index.add("portugal d7 visa guide")  # idempotent
+
+    assert len(index) == 1
+    assert "portugal d7 visa guide" in index
+    assert index.find_similar(set(), 0.8) is None
+    # Exactly 80% overlap is not more than 80%
+    assert index.find_similar({"portugal", "d7", "visa", "guide", "2025"}, 0.8) is None
+    assert index.find_similar({"portugal", "d7", "visa", "guide"}, 0.8) == ("portugal d7 visa guide", 1.0)
+    # Words nobody has used before can't produce a match
+    assert index.find_similar({"iceland", "visa"}, 0.8) is None
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} research queue tests passed")
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Test provider resilience: retry delays (Retry-After, deadline budget),
+error classification and the circuit breaker's half-open trial
+Uses a fake clock and fake attempts; runs under pytest or directly
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core import resilience
+from app.core.resilience import CircuitBreaker, CircuitOpenError, ProviderResilience
+
+THRESHOLD = 3
+COOLDOWN = 30.0
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances it instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+        await _real_sleep(0)
+
+
+class StatusError(Exception):
+    """Provider error carrying an HTTP status (and optional Retry-After)"""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status, headers=headers)
+
+
+def _provider(budget=60.0, max_attempts=3):
+    provider = ProviderResilience("stub", attempt_timeout=None, budget=budget, max_attempts=max_attempts)
+    provider.base_delay = 1.0
+    provider.max_delay = 8.0
+    provider.breaker = CircuitBreaker("stub", failure_threshold=THRESHOLD, cooldown=COOLDOWN)
+    return provider
+
+
+def _attempts(*outcomes):
+    """Attempt callable returning/raising the given outcomes in turn"""
+    calls = []
+
+    async def attempt(timeout):
+        calls.append(timeout)
+        outcome = outcomes[len(calls) - 1]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return attempt, calls
+
+
+def _run(scenario):
+    """Run a scenario(clock) coroutine against the fake clock"""
+    clock = FakeClock()
+
+    async def main():
+        with mock.patch.object(resilience, "time", clock), \
+                mock.patch.object(resilience.asyncio, "sleep", clock.sleep), \
+                mock.patch.object(resilience.random, "uniform", lambda low, high: high):
+            return await scenario(clock)
+
+    return asyncio.run(main()), clock
+
+
+async def _call(provider, attempt):
+    return await provider._run(attempt, None)
+
+
+async def _open_circuit(provider):
+    for _ in range(THRESHOLD):
+        try:
+            await _call(provider, _attempts(StatusError(503))[0])
+        except StatusError:
+            pass
+
+
+def test_backoff_grows_exponentially():
+    provider = _provider(max_attempts=4)
+    attempt, calls = _attempts(StatusError(503), StatusError(503), StatusError(503), "ok")
+
+    result, clock = _run(lambda clock: _call(provider, attempt))
+
+    assert result == "ok"
+    assert clock.sleeps == [1.0, 2.0, 4.0]  # upper bound of the jitter window
+
+
+def test_retry_after_overrides_backoff():
+    provider = _provider()
+    attempt, calls = _attempts(StatusError(429, retry_after="7"), "ok")
+
+    result, clock = _run(lambda clock: _call(provider, attempt))
+
+    assert result == "ok"
+    assert clock.sleeps == [7.0]
+    # The second attempt only gets what is left of the budget
+    assert calls == [60.0, 53.0]
+
+
+def test_gives_up_when_delay_exceeds_budget():
+    provider = _provider(budget=10.0)
+    attempt, calls = _attempts(StatusError(429, retry_after="30"), "ok")
+
+    async def scenario(clock):
+        try:
+            await _call(provider, attempt)
+        except StatusError as e:
+            return e
+        raise AssertionError("should have given up")
+
+    error, clock = _run(scenario)
+
+    assert error.response.status_code == 429
+    assert len(calls) == 1
+    assert clock.sleeps == []
+    assert provider.breaker.failures == 1
+
+
+def test_non_retryable_error_does_not_trip_breaker():
+    provider = _provider()
+
+    async def scenario(clock):
+        for _ in range(THRESHOLD + 2):
+            attempt, calls = _attempts(StatusError(400))
+            try:
+                await _call(provider, attempt)
+            except StatusError:
+                pass
+            assert len(calls) == 1  # not retried
+        return provider.breaker.state
+
+    state, clock = _run(scenario)
+
+    assert state == "closed"
+    assert provider.breaker.failures == 0
+    assert clock.sleeps == []
+
+
+def test_opens_after_threshold_and_fails_fast():
+    provider = _provider(max_attempts=1)
+
+    async def scenario(clock):
+        await _open_circuit(provider)
+        attempt, calls = _attempts("ok")
+        try:
+            await _call(provider, attempt)
+        except CircuitOpenError as e:
+            return e, calls, provider.breaker.state
+        raise AssertionError("circuit should be open")
+
+    (error, calls, state), clock = _run(scenario)
+
+    assert state == "open"
+    assert calls == []
+    assert error.retry_in == COOLDOWN
+
+
+def test_half_open_allows_a_single_trial():
+    provider = _provider(max_attempts=1)
+
+    async def scenario(clock):
+        await _open_circuit(provider)
+        clock.now += COOLDOWN
+
+        release = asyncio.Event()
+
+        async def slow_trial(timeout):
+            await release.wait()
+            return "recovered"
+
+        trial = asyncio.create_task(_call(provider, slow_trial))
+        await _real_sleep(0)
+
+        # A second call while the trial is in flight fails fast
+        attempt, calls = _attempts("ok")
+        try:
+            await _call(provider, attempt)
+            second = "admitted"
+        except CircuitOpenError:
+            second = "rejected"
+
+        release.set()
+        return second, calls, await trial
+
+    (second, calls, trial_result), clock = _run(scenario)
+
+    assert second == "rejected" and calls == []
+    assert trial_result == "recovered"
+    assert provider.breaker.state == "closed"
+    assert not provider.breaker.trial_in_flight
+
+
+def test_failed_trial_reopens_circuit():
+    provider = _provider(max_attempts=1)
+
+    async def scenario(clock):
+        await _open_circuit(provider)
+        clock.now += COOLDOWN
+        try:
+            await _call(provider, _attempts(StatusError(503))[0])
+        except StatusError:
+            pass
+        return provider.breaker.state
+
+    state, clock = _run(scenario)
+
+    assert state == "open"
+    assert not provider.breaker.trial_in_flight
+
+
+def test_other_calls_do_not_end_the_trial():
+    """A call admitted before the circuit opened, failing during the trial, leaves the trial in place"""
+    provider = _provider(max_attempts=1)
+
+    async def scenario(clock):
+        release_early = asyncio.Event()
+
+        async def early_failure(timeout):
+            await release_early.wait()
+            raise StatusError(503)
+
+        early = asyncio.create_task(_call(provider, early_failure))
+        await _real_sleep(0)
+
+        await _open_circuit(provider)
+        clock.now += COOLDOWN
+
+        release_trial = asyncio.Event()
+
+        async def slow_trial(timeout):
+            await release_trial.wait()
+            return "recovered"
+
+        trial = asyncio.create_task(_call(provider, slow_trial))
+        await _real_sleep(0)
+
+        release_early.set()
+        await asyncio.gather(early, return_exceptions=True)
+        still_in_flight = provider.breaker.trial_in_flight
+
+        release_trial.set()
+        await trial
+        return still_in_flight
+
+    still_in_flight, clock = _run(scenario)
+
+    assert still_in_flight
+    assert not provider.breaker.trial_in_flight
+
+
+def test_cancelled_trial_does_not_leave_breaker_stuck():
+    provider = _provider(max_attempts=1)
+
+    async def scenario(clock):
+        await _open_circuit(provider)
+        clock.now += COOLDOWN
+
+        async def hanging_trial(timeout):
+            await asyncio.Event().wait()
+
+        trial = asyncio.create_task(_call(provider, hanging_trial))
+        await _real_sleep(0)
+        assert provider.breaker.trial_in_flight
+
+        trial.cancel()
+        await asyncio.gather(trial, return_exceptions=True)
+
+        # The next call is admitted as the new trial
+        attempt, calls = _attempts("ok")
+        return await _call(provider, attempt), calls
+
+    (result, calls), clock = _run(scenario)
+
+    assert result == "ok" and len(calls) == 1
+    assert provider.breaker.state == "closed"
+    assert not provider.breaker.trial_in_flight
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} resilience tests passed")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test write-behind reuse counters: draining Redis and local counts into one
+UPDATE, putting counts back exactly once when the UPDATE fails, and keeping
+hits recorded while a flush is running
+Uses fakeredis with Lua support (pip install "fakeredis[lua]"); runs under
+pytest or directly
+"""
+import asyncio
+import os
+import sys
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core import reuse_counters
+from app.core.reuse_counters import PENDING_KEY, ReuseCounters
+
+
+class FakePool:
+    """asyncpg pool stand-in recording UPDATEs (or failing them)"""
+
+    def __init__(self, error=None, release=None):
+        self.error = error
+        self.release = release
+        self.started = asyncio.Event()
+        self.updates = []
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, cluster_ids, counts):
+        self.started.set()
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        self.updates.append(dict(zip(cluster_ids, counts)))
+
+
+def _patched(pool, **redis):
+    """Patch the database pool and get_redis_or_none (return_value= or side_effect=)"""
+    return (
+        mock.patch.object(reuse_counters, "get_redis_or_none", **redis),
+        mock.patch.object(reuse_counters, "get_db", return_value=pool)
+    )
+
+
+async def _redis_counts(redis_client):
+    return {key: int(count) for key, count in (await redis_client.hgetall(PENDING_KEY)).items()}
+
+
+def test_flush_merges_redis_and_local_counts():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = FakePool()
+        redis_patch, db_patch = _patched(pool, return_value=redis_client)
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            for cluster_id in ("spain", "spain", "portugal"):
+                await counters.record(cluster_id)
+            counters.local = {"spain": 2}  # counted while Redis was down
+
+            written = await counters.flush()
+            return written, pool.updates, await counters.pending()
+
+    written, updates, pending = asyncio.run(scenario())
+
+    assert written == 5
+    assert updates == [{"spain": 4, "portugal": 1}]
+    assert pending == {}
+
+
+def test_failed_update_restores_counts_exactly_once():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = FakePool(error=RuntimeError("connection reset"))
+        redis_patch, db_patch = _patched(pool, return_value=redis_client)
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            await redis_client.hset(PENDING_KEY, mapping={"spain": 3, "portugal": 1})
+            counters.local = {"spain": 2}
+
+            written = await counters.flush()
+            after_failure = (await _redis_counts(redis_client), dict(counters.local))
+
+            # The database is back: everything is written, once
+            pool.error = None
+            rewritten = await counters.flush()
+            return written, after_failure, rewritten, pool.updates, await counters.pending()
+
+    written, (in_redis, local), rewritten, updates, pending = asyncio.run(scenario())
+
+    assert written == 0
+    # Drained counts go back to Redis, local counts back to local
+    assert in_redis == {"spain": 3, "portugal": 1}
+    assert local == {"spain": 2}
+
+    assert rewritten == 6
+    assert updates == [{"spain": 5, "portugal": 1}]
+    assert pending == {}
+
+
+def test_failed_update_without_redis_restores_locally():
+    """If Redis is gone by the time counts are put back, they are kept locally instead"""
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = FakePool(error=RuntimeError("connection reset"))
+        redis_patch, db_patch = _patched(pool, side_effect=[redis_client, None])
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            await redis_client.hset(PENDING_KEY, mapping={"spain": 3, "portugal": 1})
+            counters.local = {"spain": 2}
+
+            await counters.flush()
+            return await _redis_counts(redis_client), counters.local
+
+    in_redis, local = asyncio.run(scenario())
+
+    assert in_redis == {}
+    assert local == {"spain": 5, "portugal": 1}
+
+
+def test_hits_recorded_during_flush_are_kept():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = FakePool(release=asyncio.Event())
+        redis_patch, db_patch = _patched(pool, return_value=redis_client)
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            await counters.record("spain")
+            counters.local = {"portugal": 1}
+
+            flushing = asyncio.create_task(counters.flush())
+            await pool.started.wait()
+
+            # Hits while the UPDATE runs: into Redis, and locally (Redis blip)
+            await counters.record("spain")
+            await counters.record("greece")
+            counters.local["portugal"] = counters.local.get("portugal", 0) + 1
+
+            pool.release.set()
+            written = await flushing
+            return written, pool.updates, await counters.pending()
+
+    written, updates, pending = asyncio.run(scenario())
+
+    assert written == 2
+    assert updates == [{"portugal": 1, "spain": 1}]
+    assert pending == {"spain": 1, "greece": 1, "portugal": 1}
+
+
+def test_hits_during_failed_flush_add_to_restored_counts():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        pool = FakePool(error=RuntimeError("connection reset"), release=asyncio.Event())
+        redis_patch, db_patch = _patched(pool, return_value=redis_client)
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            await counters.record("spain")
+
+            flushing = asyncio.create_task(counters.flush())
+            await pool.started.wait()
+            await counters.record("spain")
+
+            pool.release.set()
+            await flushing
+            return await counters.pending()
+
+    assert asyncio.run(scenario()) == {"spain": 2}
+
+
+def test_records_locally_without_redis():
+    async def scenario():
+        pool = FakePool()
+        redis_patch, db_patch = _patched(pool, return_value=None)
+        with redis_patch, db_patch:
+            counters = ReuseCounters()
+            counts = [await counters.record("spain") for _ in range(3)]
+            written = await counters.flush()
+            return counts, written, pool.updates, counters.local
+
+    counts, written, updates, local = asyncio.run(scenario())
+
+    assert counts == [1, 2, 3]
+    assert written == 3
+    assert updates == [{"spain": 3}]
+    assert local == {}
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} reuse counter tests passed")
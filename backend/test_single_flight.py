@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test single-flight coalescing: one upstream call per key in-process, shared
+results and errors, and the cross-process Redis lock (released only by the
+token that holds it)
+Uses fakeredis with Lua support (pip install "fakeredis[lua]"); runs under
+pytest or directly
+"""
+import asyncio
+import os
+import sys
+from decimal import Decimal
+from unittest import mock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core import single_flight
+from app.core.single_flight import LOCK_PREFIX, SingleFlight
+
+KEY = "serp:portugal visa"
+LOCK_KEY = f"{LOCK_PREFIX}stub:{KEY}"
+
+
+def _counted_call(result=None, error=None, started=None, release=None):
+    """Provider call that counts its runs and optionally waits to be released"""
+    calls = []
+
+    async def func():
+        calls.append(1)
+        if started is not None:
+            started.set()
+        if release is not None:
+            await release.wait()
+        else:
+            await asyncio.sleep(0.01)
+        if error is not None:
+            raise error
+        return result
+
+    return func, calls
+
+
+def test_concurrent_identical_calls_run_once():
+    async def scenario():
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=None):
+            flight = SingleFlight("stub")
+            func, calls = _counted_call({"content": "answer", "cost": Decimal("0.05")})
+            results = await asyncio.gather(*(flight.do(KEY, func) for _ in range(5)))
+            return results, calls, flight._inflight
+
+    results, calls, inflight = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    # The leader pays, followers get the result free of charge
+    assert results[0] == {"content": "answer", "cost": Decimal("0.05")}
+    for follower in results[1:]:
+        assert follower["content"] == "answer"
+        assert follower["cost"] == Decimal("0")
+        assert follower["cached"] and follower["coalesced"]
+    assert inflight == {}
+
+
+def test_different_keys_are_not_coalesced():
+    async def scenario():
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=None):
+            flight = SingleFlight("stub")
+            func, calls = _counted_call({"cost": Decimal("0.05")})
+            await asyncio.gather(flight.do("a", func), flight.do("b", func))
+            return calls
+
+    assert len(asyncio.run(scenario())) == 2
+
+
+def test_leader_exception_reaches_every_follower():
+    async def scenario():
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=None):
+            flight = SingleFlight("stub")
+            func, calls = _counted_call(error=RuntimeError("upstream 500"))
+            outcomes = await asyncio.gather(
+                *(flight.do(KEY, func) for _ in range(4)), return_exceptions=True
+            )
+
+            # The failure isn't remembered: the next call goes upstream again
+            retry, retry_calls = _counted_call({"cost": Decimal("0.05")})
+            await flight.do(KEY, retry)
+            return outcomes, calls, retry_calls
+
+    outcomes, calls, retry_calls = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert {str(outcome) for outcome in outcomes} == {"upstream 500"}
+    assert len(retry_calls) == 1
+
+
+def test_cancelled_follower_does_not_cancel_the_call():
+    async def scenario():
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=None):
+            flight = SingleFlight("stub")
+            started, release = asyncio.Event(), asyncio.Event()
+            func, calls = _counted_call({"cost": Decimal("0.05")}, started=started, release=release)
+
+            leader = asyncio.create_task(flight.do(KEY, func))
+            await started.wait()
+            follower = asyncio.create_task(flight.do(KEY, func))
+            await asyncio.sleep(0)
+
+            follower.cancel()
+            await asyncio.gather(follower, return_exceptions=True)
+            release.set()
+            return await leader, calls
+
+    result, calls = asyncio.run(scenario())
+
+    assert result == {"cost": Decimal("0.05")}
+    assert len(calls) == 1
+
+
+def test_leader_holds_and_releases_the_lock():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=redis_client):
+            flight = SingleFlight("stub", lock_ttl=90)
+            seen = {}
+
+            async def func():
+                seen["token"] = await redis_client.get(LOCK_KEY)
+                seen["ttl"] = await redis_client.ttl(LOCK_KEY)
+                return {"cost": Decimal("0.05")}
+
+            await flight.do(KEY, func)
+            return seen, await redis_client.exists(LOCK_KEY)
+
+    seen, still_locked = asyncio.run(scenario())
+
+    assert seen["token"]
+    assert 0 < seen["ttl"] <= 90
+    assert not still_locked
+
+
+def test_lock_released_only_by_its_holder():
+    """A leader whose lock lapsed and was taken over must not delete the new holder's lock"""
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=redis_client):
+            flight = SingleFlight("stub", lock_ttl=90)
+
+            async def func():
+                # Our lock expired mid-call and another process acquired it
+                await redis_client.set(LOCK_KEY, "other-process-token", ex=90)
+                return {"cost": Decimal("0.05")}
+
+            await flight.do(KEY, func)
+            return await redis_client.get(LOCK_KEY)
+
+    assert asyncio.run(scenario()) == "other-process-token"
+
+
+def test_lock_released_when_call_fails():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=redis_client):
+            flight = SingleFlight("stub", lock_ttl=90)
+            func, calls = _counted_call(error=RuntimeError("upstream 500"))
+            try:
+                await flight.do(KEY, func)
+            except RuntimeError:
+                pass
+            return await redis_client.exists(LOCK_KEY)
+
+    assert not asyncio.run(scenario())
+
+
+def test_other_process_waits_for_release_then_runs():
+    async def scenario():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with mock.patch.object(single_flight, "get_redis_or_none", return_value=redis_client):
+            # Two processes: separate SingleFlight instances sharing Redis
+            leader, peer = SingleFlight("stub", lock_ttl=90), SingleFlight("stub", lock_ttl=90)
+            peer.poll_interval = 0.01
+            order = []
+
+            started, release = asyncio.Event(), asyncio.Event()
+            leader_func, _ = _counted_call({"cost": Decimal("0.05")}, started=started, release=release)
+
+            async def peer_func():
+                order.append(("peer_runs", await redis_client.exists(LOCK_KEY)))
+                return {"cost": Decimal("0")}
+
+            leading = asyncio.create_task(leader.do(KEY, leader_func))
+            await started.wait()
+            waiting = asyncio.create_task(peer.do(KEY, peer_func))
+            await asyncio.sleep(0.05)
+            order.append(("peer_waiting", waiting.done()))
+
+            release.set()
+            await asyncio.gather(leading, waiting)
+            return order
+
+    order = asyncio.run(scenario())
+
+    assert order == [("peer_waiting", False), ("peer_runs", 0)]
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} single-flight tests passed")
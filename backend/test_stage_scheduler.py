@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test the stage scheduler: dependency ordering, overlap, cancellation on
+failure and optional stages
+Runs under pytest or directly (python test_stage_scheduler.py)
+"""
+import asyncio
+import os
+import sys
+from decimal import Decimal
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.pipeline import Stage, StageScheduler
+
+
+def _stage(name, log, after=(), delay=0.0, result=None, error=None, **kwargs):
+    """Stage that records when it starts and finishes"""
+    async def run(results):
+        log.append(("start", name, sorted(results)))
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        log.append(("end", name))
+        return result if result is not None else {"stage": name}
+
+    return Stage(name, run, after=after, **kwargs)
+
+
+def test_dependency_order():
+    """A stage starts only once everything it runs after has completed"""
+    async def scenario():
+        log = []
+        scheduler = StageScheduler(costs={})
+        results = await scheduler.run([
+            _stage("write", log, after=("research", "outline")),
+            _stage("research", log, delay=0.02),
+            _stage("outline", log, after=("research",)),
+            _stage("images", log, after=("research",), delay=0.01),
+        ])
+        return log, results
+
+    log, results = asyncio.run(scenario())
+
+    assert set(results) == {"research", "outline", "write", "images"}
+    order = [entry[1] for entry in log if entry[0] == "end"]
+    assert order.index("research") < order.index("outline") < order.index("write")
+
+    # Each stage sees the results of its dependencies
+    started_with = {entry[1]: entry[2] for entry in log if entry[0] == "start"}
+    assert started_with["research"] == []
+    assert {"research", "outline"} <= set(started_with["write"])
+
+
+def test_independent_stages_overlap():
+    """Stages without dependencies between them run concurrently"""
+    async def scenario():
+        log = []
+        scheduler = StageScheduler(costs={})
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await scheduler.run([
+            _stage("a", log, delay=0.1),
+            _stage("b", log, delay=0.1),
+            _stage("c", log, delay=0.1),
+        ])
+        return loop.time() - started
+
+    assert asyncio.run(scenario()) < 0.25
+
+
+def test_required_failure_cancels_running_stages():
+    """A failed required stage raises and cancels the stages still running"""
+    cancelled = []
+
+    async def slow(results):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def scenario():
+        log = []
+        scheduler = StageScheduler(costs={})
+        try:
+            await scheduler.run([
+                _stage("broken", log, delay=0.01, error=RuntimeError("provider down")),
+                Stage("slow", slow),
+                _stage("after_broken", log, after=("broken",)),
+            ])
+        except RuntimeError as e:
+            return log, scheduler, str(e)
+        raise AssertionError("required stage failure was not raised")
+
+    log, scheduler, error = asyncio.run(scenario())
+
+    assert error == "provider down"
+    assert cancelled == ["slow"]
+    assert "after_broken" not in [entry[1] for entry in log]
+    assert "broken" not in scheduler.results
+
+
+def test_optional_stage_failure_and_timeout():
+    """Optional stages that fail or time out yield None; dependents still run"""
+    async def scenario():
+        log = []
+        scheduler = StageScheduler(costs={})
+        results = await scheduler.run([
+            _stage("images", log, error=RuntimeError("no images"), required=False),
+            _stage("links", log, delay=1, timeout=0.05, required=False),
+            _stage("publish", log, after=("images", "links")),
+        ])
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert results["images"] is None
+    assert results["links"] is None
+    assert results["publish"] == {"stage": "publish"}
+
+
+def test_required_timeout_raises():
+    async def scenario():
+        scheduler = StageScheduler(costs={})
+        await scheduler.run([_stage("research", [], delay=1, timeout=0.05)])
+
+    try:
+        asyncio.run(scenario())
+    except TimeoutError as e:
+        assert "research" in str(e)
+    else:
+        raise AssertionError("timeout was not raised")
+
+
+def test_unknown_dependency_and_cycle():
+    async def scenario(stages):
+        await StageScheduler(costs={}).run(stages)
+
+    for stages in (
+        [_stage("write", [], after=("research",))],
+        [_stage("a", [], after=("b",)), _stage("b", [], after=("a",))],
+    ):
+        try:
+            asyncio.run(scenario(stages))
+        except ValueError:
+            continue
+        raise AssertionError("invalid stage graph was accepted")
+
+
+def test_costs_progress_and_phases():
+    """Costs land in their breakdown key; progress only moves forward; phases share results"""
+    progress = []
+    completed = []
+
+    async def on_progress(stage):
+        progress.append(stage.progress)
+
+    async def on_complete(stage, result):
+        completed.append(stage.name)
+
+    async def scenario():
+        log = []
+        costs = {}
+        scheduler = StageScheduler(costs=costs, on_progress=on_progress, on_complete=on_complete)
+        await scheduler.run([
+            _stage("research", log, progress=20, cost_key="research",
+                   result={"cost": Decimal("0.30")}),
+            _stage("write", log, after=("research",), progress=50, cost_key="content",
+                   result={"cost": Decimal("0.12")}),
+        ])
+        # Second phase depends on a stage from the first
+        await scheduler.run([
+            _stage("edit", log, after=("write",), progress=40, cost_key="content",
+                   result={"cost": Decimal("0.05")}),
+        ])
+        return costs
+
+    costs = asyncio.run(scenario())
+
+    assert costs == {"research": Decimal("0.30"), "content": Decimal("0.17")}
+    assert progress == [20, 50]
+    assert completed == ["research", "write", "edit"]
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} stage scheduler tests passed")
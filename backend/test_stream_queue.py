@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Test the Redis Streams queue engine (QUEUE_ENGINE=streams): lane priority,
+entry-ID leases, retries through the delayed set and XAUTOCLAIM reaping
+Uses fakeredis with Lua support (pip install "fakeredis[lua]"); runs under
+pytest or directly
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakeredis
+
+from app.core.stream_queue import StreamQuestQueue
+
+DELAYED = "quest:articles:delayed"
+FAILED = "quest:articles:failed"
+
+
+async def _queue(redis_client=None, consumer="worker-1"):
+    """Stream queue on fakeredis with the consumer group in place (pass redis_client to share one)"""
+    queue = StreamQuestQueue()
+    queue.redis_client = redis_client or fakeredis.FakeAsyncRedis(decode_responses=True)
+    queue._register_scripts()
+    queue.consumer_name = consumer
+    queue.idempotency_window = 0
+    queue.max_retries = 2
+    queue.retry_delay = [1000, 5000]
+    queue.max_stalls = 1
+
+    if redis_client is None:
+        for lane_key in queue.lane_keys:
+            await queue.redis_client.xgroup_create(lane_key, queue.group_name, id="0", mkstream=True)
+    return queue
+
+
+async def _reaper(queue):
+    """Second worker whose reaper treats every pending entry as stalled"""
+    reaper = StreamQuestQueue()
+    reaper.redis_client = queue.redis_client
+    reaper._register_scripts()
+    reaper.consumer_name = "reaper"
+    reaper.visibility_timeout = 0
+    reaper.max_stalls = queue.max_stalls
+    return reaper
+
+
+async def _job(queue, job_id):
+    return await queue.redis_client.hgetall(f"{queue.job_prefix}{job_id}")
+
+
+async def _pending(queue):
+    return sum([
+        (await queue.redis_client.xpending(lane_key, queue.group_name))["pending"]
+        for lane_key in queue.lane_keys
+    ])
+
+
+def test_lanes_are_read_in_priority_order():
+    async def scenario():
+        queue = await _queue()
+        for topic, priority in [("low", -1), ("normal 1", 0), ("high", 3), ("normal 2", 0)]:
+            await queue.enqueue("generate_article", {"topic": topic}, priority=priority)
+
+        order = []
+        while True:
+            job = await queue.dequeue()
+            if job is None:
+                break
+            order.append(job["data"]["topic"])
+        return order, await _pending(queue)
+
+    order, pending = asyncio.run(scenario())
+
+    # High lane first, FIFO within a lane
+    assert order == ["high", "normal 1", "normal 2", "low"]
+    assert pending == 4
+
+
+def test_lease_is_the_delivering_entry():
+    async def scenario():
+        queue = await _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "lisbon"})
+        job = await queue.dequeue()
+        return job_id, job, await _job(queue, job_id)
+
+    job_id, job, stored = asyncio.run(scenario())
+
+    assert job["id"] == job_id
+    assert job["lease"] == stored["stream_id"]
+    assert stored["status"] == "processing"
+
+
+def test_complete_with_stale_lease_returns_false():
+    async def scenario():
+        queue = await _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "porto"})
+        job = await queue.dequeue()
+
+        stale = await queue.complete_job(job_id, {"ok": False}, lease="0-1")
+        after_stale = await _job(queue, job_id)
+        pending_after_stale = await _pending(queue)
+
+        completed = await queue.complete_job(job_id, {"ok": True}, lease=job["lease"])
+        return stale, after_stale, pending_after_stale, completed, await _job(queue, job_id), await _pending(queue)
+
+    stale, after_stale, pending_after_stale, completed, stored, pending = asyncio.run(scenario())
+
+    assert stale is False
+    assert after_stale["status"] == "processing"
+    assert pending_after_stale == 1
+
+    assert completed is True
+    assert stored["status"] == "completed"
+    assert stored["result"] == '{"ok": true}'
+    assert "stream_id" not in stored
+    assert pending == 0  # acknowledged
+
+
+def test_fail_retries_through_delayed_set():
+    async def scenario():
+        queue = await _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "faro"}, priority=2)
+        first = await queue.dequeue()
+
+        await queue.fail_job(job_id, "provider down", lease=first["lease"])
+        retrying = await _job(queue, job_id)
+        retry_at = await queue.redis_client.zscore(DELAYED, job_id)
+        not_yet = await queue.dequeue()
+
+        # Retry comes due: promoted back onto its own (high) lane
+        await queue.redis_client.zadd(DELAYED, {job_id: 0})
+        second = await queue.dequeue()
+        high_lane = await queue.redis_client.xlen(queue.lane_keys[0])
+        return job_id, first, retrying, retry_at, not_yet, second, high_lane, await _pending(queue)
+
+    job_id, first, retrying, retry_at, not_yet, second, high_lane, pending = asyncio.run(scenario())
+
+    assert retrying["status"] == "retry"
+    assert retrying["attempts"] == "1"
+    assert retrying["last_error"] == "provider down"
+    assert 0 < retry_at - time.time() <= 1
+    assert not_yet is None
+
+    assert second["id"] == job_id
+    assert second["lease"] != first["lease"]
+    assert high_lane == 1
+    assert pending == 1  # the failed delivery was acknowledged
+
+
+def test_fail_after_max_retries():
+    async def scenario():
+        queue = await _queue()
+        job_id = await queue.enqueue("generate_article", {"topic": "braga"})
+
+        for _ in range(queue.max_retries + 1):
+            job = await queue.dequeue()
+            await queue.fail_job(job_id, "provider down", lease=job["lease"])
+            await queue.redis_client.zadd(DELAYED, {job_id: 0}, xx=True)
+
+        return (
+            await _job(queue, job_id),
+            await queue.redis_client.zscore(FAILED, job_id),
+            await queue.dequeue()
+        )
+
+    stored, failed_at, next_job = asyncio.run(scenario())
+
+    assert stored["status"] == "failed"
+    assert failed_at is not None
+    assert next_job is None
+
+
+def test_reaper_requeues_then_fails_after_max_stalls():
+    async def scenario():
+        queue = await _queue()
+        reaper = await _reaper(queue)
+        job_id = await queue.enqueue("generate_article", {"topic": "madeira"})
+
+        await queue.dequeue()
+        first_reap = await reaper.reap_stalled_jobs()
+        requeued = await _job(queue, job_id)
+
+        await queue.dequeue()
+        second_reap = await reaper.reap_stalled_jobs()
+        return (job_id, first_reap, requeued, second_reap, await _job(queue, job_id),
+                await queue.dequeue(), await _pending(queue))
+
+    job_id, first_reap, requeued, second_reap, stored, next_job, pending = asyncio.run(scenario())
+
+    assert first_reap == []
+    assert requeued["status"] == "pending"
+    assert requeued["stalled_count"] == "1"
+
+    assert second_reap == [job_id]
+    assert stored["status"] == "failed"
+    assert stored["last_error"] == "Job stalled 2 times"
+    assert next_job is None
+    assert pending == 0
+
+
+def test_reaped_worker_cannot_complete():
+    async def scenario():
+        queue = await _queue()
+        reaper = await _reaper(queue)
+        job_id = await queue.enqueue("generate_article", {"topic": "azores"})
+
+        zombie = await queue.dequeue()
+        await reaper.reap_stalled_jobs()
+
+        owner_queue = await _queue(queue.redis_client, consumer="worker-2")
+        owner = await owner_queue.dequeue()
+
+        zombie_complete = await queue.complete_job(job_id, {"by": "zombie"}, lease=zombie["lease"])
+        await queue.fail_job(job_id, "zombie error", lease=zombie["lease"])
+        after_zombie = await _job(queue, job_id)
+
+        owner_complete = await owner_queue.complete_job(job_id, {"by": "owner"}, lease=owner["lease"])
+        return zombie, owner, zombie_complete, after_zombie, owner_complete, await _job(queue, job_id)
+
+    zombie, owner, zombie_complete, after_zombie, owner_complete, final = asyncio.run(scenario())
+
+    assert owner["lease"] != zombie["lease"]
+    assert zombie_complete is False
+    assert after_zombie["status"] == "processing"
+    assert "last_error" not in after_zombie
+
+    assert owner_complete is True
+    assert final["result"] == '{"by": "owner"}'
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\n🎉 {len(tests)} stream queue tests passed")